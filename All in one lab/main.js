@@ -11,6 +11,7 @@ function createWindow() {
         minHeight: 700,
         backgroundColor: '#0a0a0f',
         titleBarStyle: 'default',
+        show: false,
         icon: path.join(__dirname, 'assets/icons/icon.png'),
         webPreferences: {
             nodeIntegration: false,
@@ -21,6 +22,12 @@ function createWindow() {
 
     mainWindow.loadFile('renderer/index.html');
 
+    // Show once the first frame is ready and let the renderer record the moment
+    mainWindow.once('ready-to-show', () => {
+        mainWindow.show();
+        mainWindow.webContents.send('window-shown');
+    });
+
     // Open DevTools in development
     if (process.argv.includes('--enable-logging')) {
         mainWindow.webContents.openDevTools();
@@ -16,3 +16,13 @@ contextBridge.exposeInMainWorld('versions', {
     chrome: () => process.versions.chrome,
     electron: () => process.versions.electron
 });
+
+// Startup timing: the main process reports when the window is first shown
+let windowShownAt = null;
+ipcRenderer.once('window-shown', () => {
+    windowShownAt = performance.now();
+});
+
+contextBridge.exposeInMainWorld('startupTiming', {
+    windowShown: () => windowShownAt
+});
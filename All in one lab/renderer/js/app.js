@@ -5,30 +5,10 @@
 
 // Wait for DOM to be ready
 document.addEventListener('DOMContentLoaded', async () => {
+    performance.mark('qagi:dom-ready');
     console.log('QAGI Lab initializing...');
 
-    // Check if libraries are loaded
-    if (typeof math === 'undefined') {
-        console.warn('Math.js not loaded from node_modules, loading from CDN...');
-        await loadScript('https://cdnjs.cloudflare.com/ajax/libs/mathjs/12.2.1/math.min.js');
-    }
-
-    if (typeof Chart === 'undefined') {
-        console.warn('Chart.js not loaded from node_modules, loading from CDN...');
-        await loadScript('https://cdnjs.cloudflare.com/ajax/libs/Chart.js/4.4.1/chart.umd.min.js');
-    }
-
-    if (typeof Plotly === 'undefined') {
-        console.warn('Plotly not loaded from node_modules, loading from CDN...');
-        await loadScript('https://cdn.plot.ly/plotly-2.27.1.min.js');
-    }
-
-    // Configure Chart.js defaults
-    if (typeof Chart !== 'undefined') {
-        Chart.defaults.color = 'rgba(255, 255, 255, 0.7)';
-        Chart.defaults.borderColor = 'rgba(255, 255, 255, 0.1)';
-        Chart.defaults.font.family = 'Inter, sans-serif';
-    }
+    // math.js, Chart.js and Plotly are loaded by TabManager when a tab needs them
 
     // Initialize tab manager
     tabManager = new TabManager();
@@ -48,22 +28,9 @@ document.addEventListener('DOMContentLoaded', async () => {
         console.log(`Chrome ${window.versions.chrome()}`);
     }
 
-    console.log('QAGI Lab initialized successfully!');
+    console.log('QAGI Lab initialized successfully! Startup timings: tabManager.getTimings()');
 });
 
-/**
- * Load a script dynamically
- */
-function loadScript(src) {
-    return new Promise((resolve, reject) => {
-        const script = document.createElement('script');
-        script.src = src;
-        script.onload = resolve;
-        script.onerror = reject;
-        document.head.appendChild(script);
-    });
-}
-
 /**
  * Handle keyboard shortcuts
  */
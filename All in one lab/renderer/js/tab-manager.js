@@ -11,6 +11,13 @@ class TabManager {
         this.contentContainer = document.getElementById('tab-content');
         this.navItems = document.querySelectorAll('.nav-item');
 
+        this.pendingTab = null;
+        this.libraryPromises = new Map();
+        this.scriptPromises = new Map();
+        this.prefetchQueue = [];
+        this.visitCounts = this.loadVisitCounts();
+        this.firstTabInteractive = false;
+
         this.init();
     }
 
@@ -34,66 +41,73 @@ class TabManager {
     }
 
     registerTabs() {
+        // libs: keys of TabManager.LIBRARIES; scripts: loaded in order before the tab module
         this.tabs = {
             neuralnet: {
                 name: 'Neural Network',
                 icon: '🕸️',
-                module: null,
-                loaded: false
+                libs: ['chart'],
+                scripts: []
             },
             electrical: {
                 name: 'Electrical Circuits',
                 icon: '⚡',
-                module: null,
-                loaded: false
+                libs: [],
+                scripts: []
             },
             quantum: {
                 name: 'Quantum Circuits',
                 icon: '🔮',
-                module: null,
-                loaded: false
+                libs: [],
+                scripts: []
             },
             matrices: {
                 name: 'Matrices & Vectors',
                 icon: '📊',
-                module: null,
-                loaded: false
+                libs: ['math', 'plotly'],
+                scripts: []
             },
             calculus: {
                 name: 'Calculus & Graphs',
                 icon: '📈',
-                module: null,
-                loaded: false
+                libs: ['math', 'plotly'],
+                scripts: []
             },
             complex: {
                 name: 'Complex Numbers',
                 icon: '🌀',
-                module: null,
-                loaded: false
+                libs: ['math', 'plotly'],
+                scripts: []
             },
             statistics: {
                 name: 'Statistics & Probability',
                 icon: '🎲',
-                module: null,
-                loaded: false
+                libs: ['plotly'],
+                scripts: []
             },
             bitwise: {
                 name: 'Bitwise Analysis',
                 icon: '💾',
-                module: null,
-                loaded: false
+                libs: [],
+                scripts: []
             },
             neuroscience: {
                 name: 'Neuroscience',
                 icon: '🧠',
-                module: null,
-                loaded: false
+                libs: ['plotly'],
+                scripts: ['tabs/neuroscience/hh-solver.js']
             }
         };
+
+        for (const tab of Object.values(this.tabs)) {
+            tab.module = null;
+            tab.loaded = false;
+            tab.html = null;
+        }
     }
 
     async switchTab(tabId) {
-        if (this.currentTab === tabId) return;
+        if (this.currentTab === tabId && this.pendingTab === tabId) return;
 
         // Update navigation UI
         this.navItems.forEach(item => {
@@ -116,10 +130,28 @@ class TabManager {
         `;
 
         // Load tab content
+        const markPrefix = `qagi:tab:${tabId}`;
+        performance.mark(`${markPrefix}:start`);
+        this.pendingTab = tabId;
+
         try {
             await this.loadTab(tabId);
+            // A newer switch started while this tab was loading
+            if (this.pendingTab !== tabId) return;
             this.currentTab = tabId;
+
+            performance.mark(`${markPrefix}:interactive`);
+            performance.measure(`${markPrefix}`, `${markPrefix}:start`, `${markPrefix}:interactive`);
+            if (!this.firstTabInteractive) {
+                this.firstTabInteractive = true;
+                performance.mark('qagi:first-tab-interactive');
+                console.log('Startup timings (ms):', this.getTimings());
+            }
+
+            this.recordVisit(tabId);
+            this.schedulePrefetch(tabId);
         } catch (error) {
+            if (this.pendingTab !== tabId) return;
             console.error(`Error loading tab ${tabId}:`, error);
             this.contentContainer.innerHTML = `
                 <div class="empty-state">
@@ -136,15 +168,14 @@ class TabManager {
     async loadTab(tabId) {
         const tab = this.tabs[tabId];
 
-        // Load HTML content
-        const htmlPath = `tabs/${tabId}/${tabId}.html`;
-        const response = await fetch(htmlPath);
-
-        if (!response.ok) {
-            throw new Error(`Failed to load ${htmlPath}`);
-        }
+        // HTML, libraries and helper scripts load in parallel
+        const htmlPromise = this.fetchTabHTML(tabId);
+        const dependencies = this.loadDependencies(tabId);
+        // Observed below; this only keeps an abandoned load from reporting an unhandled rejection
+        dependencies.catch(() => { });
 
-        const html = await response.text();
+        const html = await htmlPromise;
+        if (this.pendingTab !== tabId) return;
         this.contentContainer.innerHTML = html;
 
         // Load CSS if not already loaded
@@ -157,28 +188,176 @@ class TabManager {
             document.head.appendChild(link);
         }
 
+        await dependencies;
+
         // Load and initialize JS module
         if (!tab.loaded) {
-            const script = document.createElement('script');
-            script.src = `tabs/${tabId}/${tabId}.js`;
-            script.onload = () => {
-                tab.loaded = true;
-                // Initialize the module
-                const moduleName = tabId.charAt(0).toUpperCase() + tabId.slice(1) + 'Tab';
-                if (window[moduleName]) {
-                    tab.module = window[moduleName];
-                    if (typeof tab.module.init === 'function') {
-                        tab.module.init();
-                    }
-                }
-            };
-            document.body.appendChild(script);
-        } else if (tab.module && typeof tab.module.init === 'function') {
-            // Re-initialize if already loaded
+            await this.loadScript(`tabs/${tabId}/${tabId}.js`);
+            tab.loaded = true;
+            const moduleName = tabId.charAt(0).toUpperCase() + tabId.slice(1) + 'Tab';
+            tab.module = window[moduleName] || null;
+        }
+
+        if (this.pendingTab !== tabId) return;
+        if (tab.module && typeof tab.module.init === 'function') {
             tab.module.init();
         }
     }
 
+    // Tab HTML is fetched once and reused on later switches
+    async fetchTabHTML(tabId) {
+        const tab = this.tabs[tabId];
+        if (tab.html !== null) return tab.html;
+
+        const htmlPath = `tabs/${tabId}/${tabId}.html`;
+        const response = await fetch(htmlPath);
+        if (!response.ok) {
+            throw new Error(`Failed to load ${htmlPath}`);
+        }
+        tab.html = await response.text();
+        return tab.html;
+    }
+
+    // ==================== DEPENDENCY LOADING ====================
+
+    loadDependencies(tabId) {
+        const tab = this.tabs[tabId];
+        const libraries = Promise.all(tab.libs.map(name => this.loadLibrary(name)));
+        // Helper scripts may use the libraries at load time, so they wait for them
+        return libraries.then(async () => {
+            for (const src of tab.scripts) {
+                await this.loadScript(src);
+            }
+        });
+    }
+
+    loadLibrary(name) {
+        const lib = TabManager.LIBRARIES[name];
+        if (!lib) return Promise.reject(new Error(`Unknown library: ${name}`));
+        if (window[lib.global]) return Promise.resolve();
+
+        if (!this.libraryPromises.has(name)) {
+            performance.mark(`qagi:lib:${name}:start`);
+            const promise = this.loadScript(lib.src)
+                .catch(() => {
+                    console.warn(`${name} not loaded from node_modules, loading from CDN...`);
+                    return this.loadScript(lib.fallback);
+                })
+                .then(() => {
+                    performance.mark(`qagi:lib:${name}:loaded`);
+                    performance.measure(`qagi:lib:${name}`, `qagi:lib:${name}:start`, `qagi:lib:${name}:loaded`);
+                    if (lib.onLoad) lib.onLoad();
+                });
+            this.libraryPromises.set(name, promise);
+        }
+        return this.libraryPromises.get(name);
+    }
+
+    // Each script is inserted once; failed loads are forgotten so a retry can try again
+    loadScript(src) {
+        if (!this.scriptPromises.has(src)) {
+            const promise = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = src;
+                script.onload = resolve;
+                script.onerror = () => {
+                    script.remove();
+                    this.scriptPromises.delete(src);
+                    reject(new Error(`Failed to load ${src}`));
+                };
+                document.body.appendChild(script);
+            });
+            this.scriptPromises.set(src, promise);
+        }
+        return this.scriptPromises.get(src);
+    }
+
+    // ==================== IDLE PREFETCH ====================
+
+    recordVisit(tabId) {
+        this.visitCounts[tabId] = (this.visitCounts[tabId] || 0) + 1;
+        try {
+            localStorage.setItem(TabManager.VISITS_KEY, JSON.stringify(this.visitCounts));
+        } catch (e) {
+            // Storage unavailable; counts still apply to this session
+        }
+    }
+
+    loadVisitCounts() {
+        try {
+            return JSON.parse(localStorage.getItem(TabManager.VISITS_KEY)) || {};
+        } catch (e) {
+            return {};
+        }
+    }
+
+    // Most visited tabs first, then the sidebar neighbours of the current tab
+    predictNextTabs(currentTab, count = 2) {
+        const order = Array.from(this.navItems, item => item.dataset.tab);
+        const index = order.indexOf(currentTab);
+        const neighbours = [order[index + 1], order[index - 1]].filter(Boolean);
+
+        const candidates = order.filter(id => id !== currentTab);
+        candidates.sort((a, b) =>
+            (this.visitCounts[b] || 0) - (this.visitCounts[a] || 0) ||
+            neighbours.indexOf(b) - neighbours.indexOf(a)
+        );
+        return candidates.slice(0, count);
+    }
+
+    // Warm one dependency per idle period so prefetching never blocks input for long
+    schedulePrefetch(currentTab) {
+        const queue = [];
+        for (const tabId of this.predictNextTabs(currentTab)) {
+            const tab = this.tabs[tabId];
+            queue.push(() => this.fetchTabHTML(tabId));
+            tab.libs.forEach(name => queue.push(() => this.loadLibrary(name)));
+        }
+        this.prefetchQueue = queue;
+
+        const idle = window.requestIdleCallback
+            ? window.requestIdleCallback.bind(window)
+            : (cb) => setTimeout(() => cb({ timeRemaining: () => 0 }), 200);
+        const runNext = () => {
+            if (this.prefetchQueue !== queue || queue.length === 0) return;
+            const task = queue.shift();
+            Promise.resolve()
+                .then(task)
+                .catch(error => console.warn('Prefetch failed:', error))
+                .then(() => idle(runNext, { timeout: 2000 }));
+        };
+        idle(runNext, { timeout: 2000 });
+    }
+
+    // ==================== STARTUP TIMING ====================
+
+    // Milliseconds since navigation start for the startup marks, plus per-tab load times
+    getTimings() {
+        const markTime = (name) => {
+            const entries = performance.getEntriesByName(name, 'mark');
+            return entries.length ? Math.round(entries[0].startTime) : null;
+        };
+        // First (cold) load of each tab and library; later switches hit the caches
+        const measures = {};
+        for (const entry of performance.getEntriesByType('measure')) {
+            const key = entry.name.slice(5);
+            if (entry.name.startsWith('qagi:') && !(key in measures)) measures[key] = Math.round(entry.duration);
+        }
+
+        // The preload script records when the main process showed the window
+        if (markTime('qagi:window-shown') === null && window.startupTiming) {
+            const shownAt = window.startupTiming.windowShown();
+            if (shownAt !== null) performance.mark('qagi:window-shown', { startTime: shownAt });
+        }
+
+        return {
+            domContentLoaded: markTime('qagi:dom-ready'),
+            windowShown: markTime('qagi:window-shown'),
+            firstTabInteractive: markTime('qagi:first-tab-interactive'),
+            measures
+        };
+    }
+
     getCurrentTab() {
         return this.currentTab;
     }
@@ -188,5 +367,31 @@ class TabManager {
     }
 }
 
+// Shared libraries, loaded on first use by a tab that declares them
+TabManager.LIBRARIES = {
+    math: {
+        global: 'math',
+        src: '../node_modules/mathjs/lib/browser/math.js',
+        fallback: 'https://cdnjs.cloudflare.com/ajax/libs/mathjs/12.2.1/math.min.js'
+    },
+    chart: {
+        global: 'Chart',
+        src: '../node_modules/chart.js/dist/chart.umd.js',
+        fallback: 'https://cdnjs.cloudflare.com/ajax/libs/Chart.js/4.4.1/chart.umd.min.js',
+        onLoad() {
+            Chart.defaults.color = 'rgba(255, 255, 255, 0.7)';
+            Chart.defaults.borderColor = 'rgba(255, 255, 255, 0.1)';
+            Chart.defaults.font.family = 'Inter, sans-serif';
+        }
+    },
+    plotly: {
+        global: 'Plotly',
+        src: '../node_modules/plotly.js-dist-min/plotly.min.js',
+        fallback: 'https://cdn.plot.ly/plotly-2.27.1.min.js'
+    }
+};
+
+TabManager.VISITS_KEY = 'qagi-tab-visits';
+
 // Global instance
 let tabManager;
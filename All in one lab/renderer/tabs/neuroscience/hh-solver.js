@@ -0,0 +1,626 @@
+/**
+ * QAGI Lab - Hodgkin-Huxley Solver
+ * Adaptive Dormand-Prince RK45, exponential Euler (stiff-safe) and the
+ * reference forward Euler scheme, plus a struct-of-arrays parameter sweep
+ * that can run inside a Web Worker (hh-sweep-worker.js)
+ */
+
+const HHSolver = {
+    // Squid axon parameters (rates are defined at 6.3 °C)
+    defaults: {
+        gNa: 120,       // mS/cm²
+        gK: 36,
+        gL: 0.3,
+        ENa: 50,        // mV
+        EK: -77,
+        EL: -54.4,
+        Cm: 1.0,        // μF/cm²
+        current: 10,    // μA/cm²
+        stimStart: 5,   // ms
+        stimEnd: 45,
+        tMax: 50,
+        temperature: 6.3,
+        V0: -65,
+        m0: 0.05,
+        h0: 0.6,
+        n0: 0.32
+    },
+
+    spikeThreshold: 0,  // mV, upward crossing counts as a spike
+    sweepAxes: ['current', 'gNa', 'gK', 'gL', 'temperature'],
+
+    // Dormand-Prince 5(4) tableau (the stage times are not needed: the
+    // right-hand side only depends on t through the segment's stimulus)
+    DP: {
+        a: [
+            [],
+            [1 / 5],
+            [3 / 40, 9 / 40],
+            [44 / 45, -56 / 15, 32 / 9],
+            [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+            [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+            [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84]
+        ],
+        // 5th order solution minus the embedded 4th order one
+        e: [71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40]
+    },
+
+    // ==================== MODEL ====================
+
+    params(overrides = {}) {
+        const p = { ...this.defaults };
+        for (const key in overrides) {
+            if (overrides[key] !== undefined && !Number.isNaN(overrides[key])) p[key] = overrides[key];
+        }
+        p.phi = this.temperatureFactor(p.temperature);
+        return p;
+    },
+
+    // Q10 = 3 scaling of all rate constants relative to 6.3 °C
+    temperatureFactor(celsius) {
+        return Math.pow(3, (celsius - 6.3) / 10);
+    },
+
+    // x / (1 - e^-x), continuous through the removable singularity at x = 0
+    vtrap(x) {
+        return Math.abs(x) < 1e-6 ? 1 + x / 2 : x / -Math.expm1(-x);
+    },
+
+    // Writes [αm, βm, αh, βh, αn, βn] at V into out
+    rates(V, phi, out) {
+        out[0] = phi * this.vtrap((V + 40) / 10);
+        out[1] = phi * 4 * Math.exp(-(V + 65) / 18);
+        out[2] = phi * 0.07 * Math.exp(-(V + 65) / 20);
+        out[3] = phi / (1 + Math.exp(-(V + 35) / 10));
+        out[4] = phi * 0.1 * this.vtrap((V + 55) / 10);
+        out[5] = phi * 0.125 * Math.exp(-(V + 65) / 80);
+        return out;
+    },
+
+    // dy/dt for y = [V, m, h, n] with a constant injected current I
+    derivatives(y, p, I, rateBuffer, dy) {
+        const V = y[0], m = y[1], h = y[2], n = y[3];
+        const r = this.rates(V, p.phi, rateBuffer);
+        const m3h = m * m * m * h;
+        const n4 = n * n * n * n;
+
+        dy[0] = (I - p.gNa * m3h * (V - p.ENa) - p.gK * n4 * (V - p.EK) - p.gL * (V - p.EL)) / p.Cm;
+        dy[1] = r[0] * (1 - m) - r[1] * m;
+        dy[2] = r[2] * (1 - h) - r[3] * h;
+        dy[3] = r[4] * (1 - n) - r[5] * n;
+        return dy;
+    },
+
+    // Stimulus is piecewise constant; solvers never step across these times
+    stimulusSegments(p) {
+        const start = Math.min(Math.max(p.stimStart, 0), p.tMax);
+        const end = Math.min(Math.max(p.stimEnd, start), p.tMax);
+        return [
+            { t0: 0, t1: start, I: 0 },
+            { t0: start, t1: end, I: p.current },
+            { t0: end, t1: p.tMax, I: 0 }
+        ].filter(s => s.t1 > s.t0);
+    },
+
+    // ==================== SINGLE TRACE ====================
+
+    /**
+     * Integrate one neuron. Output is decimated to `points` samples on a
+     * uniform grid (screen resolution); peaks and spike times use every step.
+     * options: { method: 'rk45' | 'exponential' | 'euler', points, dt, rtol, atol, hMax }
+     */
+    simulate(overrides = {}, options = {}) {
+        const p = this.params(overrides);
+        const method = options.method || 'rk45';
+        const points = Math.max(2, Math.floor(options.points || 1000));
+        const trace = this.createTrace(points, p.tMax);
+
+        if (method === 'rk45') {
+            this.integrateRK45(p, trace, options);
+        } else if (method === 'exponential') {
+            this.integrateFixed(p, trace, options.dt || 0.025, this.exponentialStep);
+        } else if (method === 'euler') {
+            this.integrateFixed(p, trace, options.dt || 0.01, this.eulerStep);
+        } else {
+            throw new Error(`Unknown Hodgkin-Huxley method: ${method}`);
+        }
+
+        trace.method = method;
+        return trace;
+    },
+
+    createTrace(points, tMax) {
+        const time = new Float64Array(points);
+        for (let i = 0; i < points; i++) time[i] = tMax * i / (points - 1);
+        return {
+            time,
+            V: new Float64Array(points),
+            m: new Float64Array(points),
+            h: new Float64Array(points),
+            n: new Float64Array(points),
+            filled: 0,
+            spikeTimes: [],
+            peakV: -Infinity,
+            maxM: 0,
+            minH: 1,
+            maxN: 0,
+            steps: 0,
+            rejected: 0,
+            evaluations: 0
+        };
+    },
+
+    recordSample(trace, i, V, m, h, n) {
+        trace.V[i] = V;
+        trace.m[i] = m;
+        trace.h[i] = h;
+        trace.n[i] = n;
+    },
+
+    recordExtrema(trace, V, m, h, n) {
+        if (V > trace.peakV) trace.peakV = V;
+        if (m > trace.maxM) trace.maxM = m;
+        if (h < trace.minH) trace.minH = h;
+        if (n > trace.maxN) trace.maxN = n;
+    },
+
+    // Cubic Hermite interpolation of component k between two accepted steps
+    hermite(t, t0, dt, y0, y1, f0, f1, k) {
+        const s = (t - t0) / dt;
+        const s2 = s * s;
+        const s3 = s2 * s;
+        return (2 * s3 - 3 * s2 + 1) * y0[k] + (s3 - 2 * s2 + s) * dt * f0[k] +
+            (-2 * s3 + 3 * s2) * y1[k] + (s3 - s2) * dt * f1[k];
+    },
+
+    integrateRK45(p, trace, options) {
+        const rtol = options.rtol || 1e-6;
+        const atol = options.atol || 1e-8;
+        const hMax = options.hMax || 0.5;
+        const { a, e } = this.DP;
+        const threshold = this.spikeThreshold;
+
+        const y = new Float64Array([p.V0, p.m0, p.h0, p.n0]);
+        const yNew = new Float64Array(4);
+        const yStage = new Float64Array(4);
+        const k = [];
+        for (let s = 0; s < 7; s++) k.push(new Float64Array(4));
+        const rateBuffer = new Float64Array(6);
+
+        const out = trace.time;
+        let sample = 0;
+        let h = Math.min(0.01, hMax);
+
+        this.recordExtrema(trace, y[0], y[1], y[2], y[3]);
+
+        for (const seg of this.stimulusSegments(p)) {
+            let t = seg.t0;
+            // Derivative at the segment start (the stimulus may just have changed)
+            this.derivatives(y, p, seg.I, rateBuffer, k[0]);
+            trace.evaluations++;
+
+            // Samples that fall exactly on the segment start
+            while (sample < out.length && out[sample] <= t) {
+                this.recordSample(trace, sample++, y[0], y[1], y[2], y[3]);
+            }
+
+            while (t < seg.t1) {
+                const last = t + h >= seg.t1;
+                const step = last ? seg.t1 - t : h;
+
+                for (let s = 1; s < 7; s++) {
+                    const as = a[s];
+                    for (let j = 0; j < 4; j++) {
+                        let acc = y[j];
+                        for (let q = 0; q < s; q++) acc += step * as[q] * k[q][j];
+                        yStage[j] = acc;
+                    }
+                    this.derivatives(yStage, p, seg.I, rateBuffer, k[s]);
+                }
+                trace.evaluations += 6;
+                // Stage 7 is evaluated at the 5th order solution (FSAL)
+                yNew.set(yStage);
+
+                let errSq = 0;
+                for (let j = 0; j < 4; j++) {
+                    let err = 0;
+                    for (let q = 0; q < 7; q++) err += e[q] * k[q][j];
+                    const scale = atol + rtol * Math.max(Math.abs(y[j]), Math.abs(yNew[j]));
+                    const ratio = step * err / scale;
+                    errSq += ratio * ratio;
+                }
+                const err = Math.sqrt(errSq / 4);
+
+                if (err > 1 || !Number.isFinite(err)) {
+                    trace.rejected++;
+                    h = step * Math.max(0.2, 0.9 * Math.pow(err, -0.2) || 0.2);
+                    continue;
+                }
+
+                const tNew = t + step;
+
+                // Dense output on the display grid
+                while (sample < out.length && out[sample] <= tNew) {
+                    const ts = out[sample];
+                    const V = this.hermite(ts, t, step, y, yNew, k[0], k[6], 0);
+                    const m = this.hermite(ts, t, step, y, yNew, k[0], k[6], 1);
+                    const hh = this.hermite(ts, t, step, y, yNew, k[0], k[6], 2);
+                    const n = this.hermite(ts, t, step, y, yNew, k[0], k[6], 3);
+                    this.recordSample(trace, sample++, V, m, hh, n);
+                    this.recordExtrema(trace, V, m, hh, n);
+                }
+
+                if (y[0] < threshold && yNew[0] >= threshold) {
+                    trace.spikeTimes.push(this.refineCrossing(t, step, y, yNew, k[0], k[6], threshold));
+                }
+
+                this.recordExtrema(trace, yNew[0], yNew[1], yNew[2], yNew[3]);
+                y.set(yNew);
+                k[0].set(k[6]);
+                t = last ? seg.t1 : tNew;
+                trace.steps++;
+
+                const grow = err === 0 ? 5 : Math.min(5, 0.9 * Math.pow(err, -0.2));
+                h = Math.min(hMax, step * Math.max(0.2, grow));
+            }
+        }
+
+        while (sample < out.length) {
+            this.recordSample(trace, sample++, y[0], y[1], y[2], y[3]);
+        }
+        trace.filled = sample;
+    },
+
+    // Bisection on the Hermite interpolant for the threshold crossing time
+    refineCrossing(t0, dt, y0, y1, f0, f1, threshold) {
+        let lo = t0;
+        let hi = t0 + dt;
+        for (let i = 0; i < 40; i++) {
+            const mid = 0.5 * (lo + hi);
+            if (this.hermite(mid, t0, dt, y0, y1, f0, f1, 0) < threshold) lo = mid;
+            else hi = mid;
+        }
+        return 0.5 * (lo + hi);
+    },
+
+    // Gates relax exactly toward their steady state for frozen V, then V
+    // relaxes toward its conductance-weighted reversal potential. Both
+    // updates are bounded for any dt, so stiff parameter sets stay stable.
+    exponentialStep(y, p, I, dt, r) {
+        const V = y[0];
+        HHSolver.rates(V, p.phi, r);
+
+        let sum = r[0] + r[1];
+        const m = r[0] / sum + (y[1] - r[0] / sum) * Math.exp(-dt * sum);
+        sum = r[2] + r[3];
+        const h = r[2] / sum + (y[2] - r[2] / sum) * Math.exp(-dt * sum);
+        sum = r[4] + r[5];
+        const n = r[4] / sum + (y[3] - r[4] / sum) * Math.exp(-dt * sum);
+
+        const gNa = p.gNa * m * m * m * h;
+        const gK = p.gK * n * n * n * n;
+        const g = gNa + gK + p.gL;
+        const Vinf = (I + gNa * p.ENa + gK * p.EK + p.gL * p.EL) / g;
+
+        y[0] = Vinf + (V - Vinf) * Math.exp(-dt * g / p.Cm);
+        y[1] = m;
+        y[2] = h;
+        y[3] = n;
+    },
+
+    // The original explicit scheme (V first, gates from the updated V, clamped)
+    eulerStep(y, p, I, dt, r) {
+        const m = y[1], h = y[2], n = y[3];
+        let V = y[0];
+        const INa = p.gNa * m * m * m * h * (V - p.ENa);
+        const IK = p.gK * n * n * n * n * (V - p.EK);
+        const IL = p.gL * (V - p.EL);
+        V += (I - INa - IK - IL) / p.Cm * dt;
+
+        HHSolver.rates(V, p.phi, r);
+        y[0] = V;
+        y[1] = Math.max(0, Math.min(1, m + (r[0] * (1 - m) - r[1] * m) * dt));
+        y[2] = Math.max(0, Math.min(1, h + (r[2] * (1 - h) - r[3] * h) * dt));
+        y[3] = Math.max(0, Math.min(1, n + (r[4] * (1 - n) - r[5] * n) * dt));
+    },
+
+    integrateFixed(p, trace, dt, stepFn) {
+        const steps = Math.round(p.tMax / dt);
+        const y = new Float64Array([p.V0, p.m0, p.h0, p.n0]);
+        const rateBuffer = new Float64Array(6);
+        const out = trace.time;
+        const threshold = this.spikeThreshold;
+        let sample = 0;
+
+        this.recordExtrema(trace, y[0], y[1], y[2], y[3]);
+
+        for (let i = 0; i < steps; i++) {
+            const t = i * dt;
+            const I = (t >= p.stimStart && t <= p.stimEnd) ? p.current : 0;
+            const Vprev = y[0], mPrev = y[1], hPrev = y[2], nPrev = y[3];
+
+            stepFn(y, p, I, dt, rateBuffer);
+
+            const tNew = t + dt;
+            while (sample < out.length && out[sample] <= tNew + 1e-12) {
+                // Linear interpolation onto the display grid
+                const s = Math.max(0, (out[sample] - t) / dt);
+                this.recordSample(trace, sample++,
+                    Vprev + s * (y[0] - Vprev), mPrev + s * (y[1] - mPrev),
+                    hPrev + s * (y[2] - hPrev), nPrev + s * (y[3] - nPrev));
+            }
+
+            if (Vprev < threshold && y[0] >= threshold) {
+                trace.spikeTimes.push(t + dt * (threshold - Vprev) / (y[0] - Vprev));
+            }
+            this.recordExtrema(trace, y[0], y[1], y[2], y[3]);
+        }
+
+        while (sample < out.length) {
+            this.recordSample(trace, sample++, y[0], y[1], y[2], y[3]);
+        }
+        trace.filled = sample;
+        trace.steps = steps;
+        trace.evaluations = steps;
+    },
+
+    // ==================== PARAMETER SWEEP ====================
+
+    /**
+     * Integrate the cartesian product of `grid` values in lockstep with the
+     * exponential scheme. State and parameters are struct-of-arrays; lane
+     * order has `current` varying fastest, so every run of `current.length`
+     * lanes is one f-I curve.
+     * grid: { current: [...], gNa: [...], gK: [...], gL: [...], temperature: [...] }
+     * options: { dt, tMax, stimStart, stimEnd, ENa, EK, EL, Cm, onProgress }
+     */
+    sweep(grid = {}, options = {}) {
+        const base = this.params(options);
+        const axes = {};
+        const shape = [];
+        for (const name of this.sweepAxes) {
+            const values = grid[name] && grid[name].length ? Array.from(grid[name]) : [base[name]];
+            axes[name] = values;
+            shape.push(values.length);
+        }
+        const size = shape.reduce((a, b) => a * b, 1);
+
+        // Per-lane parameters
+        const I = new Float64Array(size);
+        const gNa = new Float64Array(size);
+        const gK = new Float64Array(size);
+        const gL = new Float64Array(size);
+        const phi = new Float64Array(size);
+        for (let lane = 0; lane < size; lane++) {
+            let rest = lane;
+            const pick = {};
+            for (let a = 0; a < this.sweepAxes.length; a++) {
+                pick[this.sweepAxes[a]] = axes[this.sweepAxes[a]][rest % shape[a]];
+                rest = Math.floor(rest / shape[a]);
+            }
+            I[lane] = pick.current;
+            gNa[lane] = pick.gNa;
+            gK[lane] = pick.gK;
+            gL[lane] = pick.gL;
+            phi[lane] = this.temperatureFactor(pick.temperature);
+        }
+
+        // Lane state
+        const V = new Float64Array(size).fill(base.V0);
+        const m = new Float64Array(size).fill(base.m0);
+        const h = new Float64Array(size).fill(base.h0);
+        const n = new Float64Array(size).fill(base.n0);
+
+        // Spike log (time, lane) grown by doubling, bucketed per lane at the end
+        let spikeTime = new Float64Array(1024);
+        let spikeLane = new Int32Array(1024);
+        let spikeCount = 0;
+        const counts = new Int32Array(size);
+
+        const dt = options.dt || 0.025;
+        const steps = Math.round(base.tMax / dt);
+        const { ENa, EK, EL, Cm, stimStart, stimEnd } = base;
+        const threshold = this.spikeThreshold;
+        const vtrap = this.vtrap;
+        const reportEvery = Math.max(1, Math.floor(steps / 50));
+
+        for (let i = 0; i < steps; i++) {
+            const t = i * dt;
+            const on = t >= stimStart && t <= stimEnd;
+
+            for (let lane = 0; lane < size; lane++) {
+                const v = V[lane];
+                const f = phi[lane];
+
+                const am = f * vtrap((v + 40) / 10);
+                const bm = f * 4 * Math.exp(-(v + 65) / 18);
+                const ah = f * 0.07 * Math.exp(-(v + 65) / 20);
+                const bh = f / (1 + Math.exp(-(v + 35) / 10));
+                const an = f * 0.1 * vtrap((v + 55) / 10);
+                const bn = f * 0.125 * Math.exp(-(v + 65) / 80);
+
+                let sum = am + bm;
+                const mi = am / sum + (m[lane] - am / sum) * Math.exp(-dt * sum);
+                sum = ah + bh;
+                const hi = ah / sum + (h[lane] - ah / sum) * Math.exp(-dt * sum);
+                sum = an + bn;
+                const ni = an / sum + (n[lane] - an / sum) * Math.exp(-dt * sum);
+
+                const gna = gNa[lane] * mi * mi * mi * hi;
+                const gk = gK[lane] * ni * ni * ni * ni;
+                const gl = gL[lane];
+                const g = gna + gk + gl;
+                const Vinf = ((on ? I[lane] : 0) + gna * ENa + gk * EK + gl * EL) / g;
+                const vNew = Vinf + (v - Vinf) * Math.exp(-dt * g / Cm);
+
+                if (v < threshold && vNew >= threshold) {
+                    if (spikeCount === spikeTime.length) {
+                        const grownTime = new Float64Array(spikeCount * 2);
+                        grownTime.set(spikeTime);
+                        spikeTime = grownTime;
+                        const grownLane = new Int32Array(spikeCount * 2);
+                        grownLane.set(spikeLane);
+                        spikeLane = grownLane;
+                    }
+                    spikeTime[spikeCount] = t + dt * (threshold - v) / (vNew - v);
+                    spikeLane[spikeCount++] = lane;
+                    counts[lane]++;
+                }
+
+                V[lane] = vNew;
+                m[lane] = mi;
+                h[lane] = hi;
+                n[lane] = ni;
+            }
+
+            if (options.onProgress && (i + 1) % reportEvery === 0) {
+                options.onProgress((i + 1) / steps);
+            }
+        }
+
+        // Per-lane spike times: spikeTimes[spikeOffsets[lane] .. spikeOffsets[lane + 1]]
+        const spikeOffsets = new Int32Array(size + 1);
+        for (let lane = 0; lane < size; lane++) spikeOffsets[lane + 1] = spikeOffsets[lane] + counts[lane];
+        const spikeTimes = new Float64Array(spikeCount);
+        const cursor = spikeOffsets.slice(0, size);
+        for (let s = 0; s < spikeCount; s++) {
+            spikeTimes[cursor[spikeLane[s]]++] = spikeTime[s];
+        }
+
+        // Firing rate over the stimulus window (Hz)
+        const windowStart = Math.max(0, stimStart);
+        const windowEnd = Math.min(stimEnd, base.tMax);
+        const windowSeconds = Math.max(windowEnd - windowStart, dt) / 1000;
+        const rates = new Float64Array(size);
+        for (let lane = 0; lane < size; lane++) {
+            let inWindow = 0;
+            for (let s = spikeOffsets[lane]; s < spikeOffsets[lane + 1]; s++) {
+                if (spikeTimes[s] >= windowStart && spikeTimes[s] <= windowEnd) inWindow++;
+            }
+            rates[lane] = inWindow / windowSeconds;
+        }
+
+        return {
+            axes,
+            shape,
+            size,
+            dt,
+            steps,
+            rates,
+            spikeCounts: counts,
+            spikeOffsets,
+            spikeTimes,
+            fI: this.extractFICurves(axes, shape, rates)
+        };
+    },
+
+    // One curve per combination of the non-current axes
+    extractFICurves(axes, shape, rates) {
+        const nI = shape[0];
+        const curves = [];
+        for (let offset = 0; offset < rates.length; offset += nI) {
+            let rest = offset / nI;
+            const params = {};
+            for (let a = 1; a < this.sweepAxes.length; a++) {
+                params[this.sweepAxes[a]] = axes[this.sweepAxes[a]][rest % shape[a]];
+                rest = Math.floor(rest / shape[a]);
+            }
+            curves.push({
+                params,
+                current: Float64Array.from(axes.current),
+                rate: rates.slice(offset, offset + nI)
+            });
+        }
+        return curves;
+    }
+};
+
+// ==================== WORKER RUNNER ====================
+
+class HHSweepRunner {
+    constructor(options = {}) {
+        this.scriptUrl = options.scriptUrl || 'tabs/neuroscience/hh-sweep-worker.js';
+        this.onProgress = options.onProgress || null;
+        this.worker = null;
+        this.pending = null;
+        this.nextId = 0;
+    }
+
+    static isSupported() {
+        return typeof Worker !== 'undefined';
+    }
+
+    // Resolves with the HHSolver.sweep result; a newer run supersedes an older one
+    run(grid, options = {}) {
+        this.cancel();
+
+        if (!HHSweepRunner.isSupported()) {
+            return Promise.resolve(HHSolver.sweep(grid, { ...options, onProgress: this.onProgress }));
+        }
+
+        if (!this.worker) {
+            this.worker = new Worker(this.scriptUrl);
+            this.worker.onmessage = (e) => this.handleMessage(e.data);
+            this.worker.onerror = (e) => {
+                const pending = this.pending;
+                this.pending = null;
+                this.terminate();
+                if (!pending) return;
+                // Worker unavailable (e.g. blocked script URL): run in-thread instead
+                e.preventDefault();
+                try {
+                    pending.resolve(HHSolver.sweep(pending.grid, pending.options));
+                } catch (err) {
+                    pending.reject(err);
+                }
+            };
+        }
+
+        const id = ++this.nextId;
+        return new Promise((resolve, reject) => {
+            this.pending = { id, resolve, reject, grid, options };
+            this.worker.postMessage({ type: 'sweep', id, grid, options });
+        });
+    }
+
+    handleMessage(msg) {
+        const pending = this.pending;
+        if (!pending || msg.id !== pending.id) return;
+
+        if (msg.type === 'progress') {
+            if (this.onProgress) this.onProgress(msg.fraction);
+        } else if (msg.type === 'result') {
+            this.pending = null;
+            pending.resolve(msg.result);
+        } else if (msg.type === 'error') {
+            this.pending = null;
+            pending.reject(new Error(msg.message));
+        }
+    }
+
+    cancel() {
+        if (this.pending) {
+            const pending = this.pending;
+            this.pending = null;
+            // A worker mid-sweep cannot be interrupted; restart it instead
+            if (this.worker) {
+                this.worker.terminate();
+                this.worker = null;
+            }
+            const error = new Error('Sweep cancelled');
+            error.name = 'AbortError';
+            pending.reject(error);
+        }
+    }
+
+    terminate() {
+        this.cancel();
+        if (this.worker) {
+            this.worker.terminate();
+            this.worker = null;
+        }
+    }
+}
+
+window.HHSolver = HHSolver;
+window.HHSweepRunner = HHSweepRunner;
@@ -0,0 +1,35 @@
+/**
+ * QAGI Lab - Hodgkin-Huxley Sweep Worker
+ * Runs HHSolver.sweep off the UI thread and posts progress plus the
+ * typed-array result (transferred, not copied)
+ */
+
+// Solver file exports onto `window`
+self.window = self;
+importScripts('hh-solver.js');
+
+self.onmessage = (e) => {
+    const msg = e.data;
+    if (msg.type !== 'sweep') return;
+
+    try {
+        const result = HHSolver.sweep(msg.grid, {
+            ...msg.options,
+            onProgress: (fraction) => self.postMessage({ type: 'progress', id: msg.id, fraction })
+        });
+
+        const transfer = [
+            result.rates.buffer,
+            result.spikeCounts.buffer,
+            result.spikeOffsets.buffer,
+            result.spikeTimes.buffer
+        ];
+        for (const curve of result.fI) {
+            transfer.push(curve.current.buffer, curve.rate.buffer);
+        }
+
+        self.postMessage({ type: 'result', id: msg.id, result }, transfer);
+    } catch (err) {
+        self.postMessage({ type: 'error', id: msg.id, message: err.message });
+    }
+};
@@ -5,6 +5,7 @@
 
 const NeuroscienceTab = {
     hhChart: null,
+    hhSweepRunner: null,
     waveAnimationId: null,
     currentWaveType: 'delta',
     synapseType: 'excitatory',
@@ -155,6 +156,19 @@ const NeuroscienceTab = {
             hhBtn.addEventListener('click', () => this.simulateHodgkinHuxley());
         }
 
+        // Re-run on parameter edits; a solve takes a few milliseconds
+        ['hh-gna', 'hh-gk', 'hh-gl', 'hh-current', 'hh-temp', 'hh-method'].forEach(id => {
+            const input = document.getElementById(id);
+            if (input) {
+                input.addEventListener('change', () => this.simulateHodgkinHuxley());
+            }
+        });
+
+        const sweepBtn = document.getElementById('btn-hh-sweep');
+        if (sweepBtn) {
+            sweepBtn.addEventListener('click', () => this.runHHSweep());
+        }
+
         // Synaptic Transmission
         const releaseBtn = document.getElementById('btn-release-nt');
         if (releaseBtn) {
@@ -286,95 +300,45 @@ const NeuroscienceTab = {
     // ==================== HODGKIN-HUXLEY MODEL ====================
 
     simulateHodgkinHuxley() {
-        const gNa = parseFloat(document.getElementById('hh-gna')?.value) || 120;
-        const gK = parseFloat(document.getElementById('hh-gk')?.value) || 36;
-        const gL = parseFloat(document.getElementById('hh-gl')?.value) || 0.3;
-        const Iext = parseFloat(document.getElementById('hh-current')?.value) || 10;
-
-        // Constants
-        const Cm = 1.0;  // Membrane capacitance (μF/cm²)
-        const ENa = 50;  // Na⁺ equilibrium potential (mV)
-        const EK = -77;  // K⁺ equilibrium potential (mV)
-        const EL = -54.4; // Leak equilibrium potential (mV)
-
-        // Time parameters
-        const dt = 0.01; // Time step (ms)
-        const tMax = 50; // Max time (ms)
-        const steps = Math.floor(tMax / dt);
-
-        // Initial conditions
-        let V = -65;
-        let m = 0.05;
-        let h = 0.6;
-        let n = 0.32;
-
-        const time = [];
-        const voltage = [];
-        const mGate = [];
-        const hGate = [];
-        const nGate = [];
-
-        // Rate functions
-        const alphaM = (V) => 0.1 * (V + 40) / (1 - Math.exp(-(V + 40) / 10));
-        const betaM = (V) => 4 * Math.exp(-(V + 65) / 18);
-        const alphaH = (V) => 0.07 * Math.exp(-(V + 65) / 20);
-        const betaH = (V) => 1 / (1 + Math.exp(-(V + 35) / 10));
-        const alphaN = (V) => 0.01 * (V + 55) / (1 - Math.exp(-(V + 55) / 10));
-        const betaN = (V) => 0.125 * Math.exp(-(V + 65) / 80);
-
-        // Simulation loop
-        for (let i = 0; i < steps; i++) {
-            const t = i * dt;
-
-            // Apply current stimulus (pulse from 5-45ms)
-            const I = (t >= 5 && t <= 45) ? Iext : 0;
-
-            // Ionic currents
-            const INa = gNa * Math.pow(m, 3) * h * (V - ENa);
-            const IK = gK * Math.pow(n, 4) * (V - EK);
-            const IL = gL * (V - EL);
-
-            // Update voltage
-            const dV = (I - INa - IK - IL) / Cm;
-            V += dV * dt;
-
-            // Update gate variables
-            const aM = alphaM(V), bM = betaM(V);
-            const aH = alphaH(V), bH = betaH(V);
-            const aN = alphaN(V), bN = betaN(V);
-
-            m += (aM * (1 - m) - bM * m) * dt;
-            h += (aH * (1 - h) - bH * h) * dt;
-            n += (aN * (1 - n) - bN * n) * dt;
-
-            // Clamp gates to [0, 1]
-            m = Math.max(0, Math.min(1, m));
-            h = Math.max(0, Math.min(1, h));
-            n = Math.max(0, Math.min(1, n));
-
-            // Store every 10th point
-            if (i % 10 === 0) {
-                time.push(t);
-                voltage.push(V);
-                mGate.push(m);
-                hGate.push(h);
-                nGate.push(n);
-            }
-        }
+        const method = document.getElementById('hh-method')?.value || 'rk45';
+        const params = this.readHHParams();
+
+        // One output sample per device pixel is all the plot can show
+        const container = document.getElementById('hh-graph');
+        const width = container ? container.clientWidth * (window.devicePixelRatio || 1) : 0;
+        const points = Math.max(400, Math.min(4000, Math.round(width) || 1000));
+
+        const start = performance.now();
+        const trace = HHSolver.simulate(params, { method, points });
+        const elapsed = performance.now() - start;
 
         // Plot results
-        this.plotHodgkinHuxley(time, voltage, mGate, hGate, nGate);
-
-        // Update gate displays
-        const peakV = Math.max(...voltage);
-        const peakM = Math.max(...mGate);
-        const minH = Math.min(...hGate);
-        const peakN = Math.max(...nGate);
-
-        document.getElementById('hh-peak').textContent = `${peakV.toFixed(1)} mV`;
-        document.getElementById('hh-m').textContent = peakM.toFixed(3);
-        document.getElementById('hh-h').textContent = minH.toFixed(3);
-        document.getElementById('hh-n').textContent = peakN.toFixed(3);
+        this.plotHodgkinHuxley(trace.time, trace.V, trace.m, trace.h, trace.n);
+
+        // Extremes are tracked over every solver step, not just the plotted samples
+        document.getElementById('hh-peak').textContent = `${trace.peakV.toFixed(1)} mV`;
+        document.getElementById('hh-m').textContent = trace.maxM.toFixed(3);
+        document.getElementById('hh-h').textContent = trace.minH.toFixed(3);
+        document.getElementById('hh-n').textContent = trace.maxN.toFixed(3);
+
+        const info = document.getElementById('hh-solver-info');
+        if (info) {
+            const rejected = trace.rejected ? ` (${trace.rejected} rejected)` : '';
+            info.textContent = `${trace.steps} steps${rejected}, ${trace.spikeTimes.length} spike(s), ` +
+                `${elapsed.toFixed(1)} ms`;
+        }
+    },
+
+    readHHParams() {
+        const read = (id) => parseFloat(document.getElementById(id)?.value);
+        const temperature = read('hh-temp');
+        return {
+            gNa: read('hh-gna') || 120,
+            gK: read('hh-gk') || 36,
+            gL: read('hh-gl') || 0.3,
+            current: read('hh-current') || 10,
+            temperature: Number.isFinite(temperature) ? temperature : 6.3
+        };
     },
 
     plotHodgkinHuxley(time, voltage, m, h, n) {
@@ -445,6 +409,92 @@ const NeuroscienceTab = {
         Plotly.newPlot(container, traces, layout, { responsive: true });
     },
 
+    async runHHSweep() {
+        const read = (id) => parseFloat(document.getElementById(id)?.value);
+        const status = document.getElementById('hh-sweep-status');
+        const params = this.readHHParams();
+
+        const iMin = Number.isFinite(read('hh-sweep-min')) ? read('hh-sweep-min') : 0;
+        const iMax = Number.isFinite(read('hh-sweep-max')) ? read('hh-sweep-max') : 30;
+        const count = Math.max(2, Math.min(500, Math.round(read('hh-sweep-steps')) || 61));
+        const current = [];
+        for (let i = 0; i < count; i++) {
+            current.push(iMin + (iMax - iMin) * i / (count - 1));
+        }
+
+        const tempText = document.getElementById('hh-sweep-temps')?.value || '';
+        const temperature = tempText.split(',').map(parseFloat).filter(Number.isFinite);
+        if (temperature.length === 0) temperature.push(params.temperature);
+
+        const grid = { current, gNa: [params.gNa], gK: [params.gK], gL: [params.gL], temperature };
+        const options = { tMax: 510, stimStart: 10, stimEnd: 510 };
+
+        if (!this.hhSweepRunner) {
+            this.hhSweepRunner = new HHSweepRunner({
+                onProgress: (fraction) => {
+                    if (status) status.textContent = `Sweeping… ${(fraction * 100).toFixed(0)}%`;
+                }
+            });
+        }
+
+        if (status) status.textContent = `Sweeping ${current.length * temperature.length} neurons…`;
+        const start = performance.now();
+
+        try {
+            const result = await this.hhSweepRunner.run(grid, options);
+            const elapsed = (performance.now() - start) / 1000;
+            this.plotFICurves(result);
+            if (status) {
+                status.textContent = `${result.size} neurons × ${result.steps} steps in ${elapsed.toFixed(2)} s, ` +
+                    `${result.spikeTimes.length} spikes`;
+            }
+        } catch (error) {
+            if (error.name === 'AbortError') return;
+            console.error('Hodgkin-Huxley sweep failed:', error);
+            if (status) status.textContent = `Sweep failed: ${error.message}`;
+        }
+    },
+
+    plotFICurves(result) {
+        const container = document.getElementById('hh-fi-graph');
+        if (!container || typeof Plotly === 'undefined') return;
+
+        const colors = ['#00d4ff', '#00ff88', '#ffcc00', '#ff0088', '#8B00FF', '#FF4444'];
+        const traces = result.fI.map((curve, i) => ({
+            x: curve.current,
+            y: curve.rate,
+            name: `${curve.params.temperature} °C`,
+            mode: 'lines+markers',
+            marker: { size: 4 },
+            line: { color: colors[i % colors.length], width: 2 }
+        }));
+
+        const layout = {
+            paper_bgcolor: 'transparent',
+            plot_bgcolor: 'rgba(0,0,0,0.2)',
+            font: { color: '#e0e0e0', family: 'Inter' },
+            margin: { t: 20, b: 40, l: 50, r: 20 },
+            xaxis: {
+                title: 'Injected Current (μA/cm²)',
+                gridcolor: 'rgba(255,255,255,0.1)',
+                zerolinecolor: 'rgba(255,255,255,0.2)'
+            },
+            yaxis: {
+                title: 'Firing Rate (Hz)',
+                gridcolor: 'rgba(255,255,255,0.1)',
+                zerolinecolor: 'rgba(255,255,255,0.2)',
+                rangemode: 'tozero'
+            },
+            legend: {
+                orientation: 'h',
+                y: 1.1
+            },
+            showlegend: true
+        };
+
+        Plotly.newPlot(container, traces, layout, { responsive: true });
+    },
+
     // ==================== SYNAPTIC TRANSMISSION ====================
 
     triggerSynapticRelease() {
@@ -666,6 +716,10 @@ const NeuroscienceTab = {
             this.hhChart.destroy();
             this.hhChart = null;
         }
+        if (this.hhSweepRunner) {
+            this.hhSweepRunner.terminate();
+            this.hhSweepRunner = null;
+        }
     }
 };
 
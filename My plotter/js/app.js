@@ -12,6 +12,7 @@ const App = {
     angleAssignments: null,
     angleMode: 'target', // 'target' or 'cluster'
     collisionThreshold: 0.05,
+    loadController: null, // AbortController of the load in progress
 
     /**
      * Initialize the application
@@ -113,24 +114,29 @@ const App = {
      * Handle load data button click
      */
     async handleLoadData() {
+        // Clicking again while a load is streaming cancels it
+        if (this.loadController) {
+            this.loadController.abort();
+            return;
+        }
+
         const method = document.getElementById('data-input-method').value;
 
         try {
-            let csvText;
+            let source;
 
             switch (method) {
                 case 'csv':
-                    const file = document.getElementById('csv-file').files[0];
-                    if (!file) {
+                    source = document.getElementById('csv-file').files[0];
+                    if (!source) {
                         this.showError('Please select a CSV file');
                         return;
                     }
-                    csvText = await this.readFile(file);
                     break;
 
                 case 'paste':
-                    csvText = document.getElementById('csv-paste').value;
-                    if (!csvText.trim()) {
+                    source = document.getElementById('csv-paste').value;
+                    if (!source.trim()) {
                         this.showError('Please paste CSV data');
                         return;
                     }
@@ -138,40 +144,74 @@ const App = {
 
                 case 'sample':
                     const sampleId = document.getElementById('sample-select').value;
-                    this.rawData = DataProcessor.loadSampleDataset(sampleId);
-                    this.processLoadedData();
-                    return;
+                    const dataset = DataProcessor.sampleDatasets[sampleId];
+                    if (!dataset) {
+                        throw new Error(`Unknown sample dataset: ${sampleId}`);
+                    }
+                    source = dataset.data;
+                    break;
             }
 
-            this.rawData = DataProcessor.parseCSV(csvText);
+            this.rawData = await this.streamData(source);
             this.processLoadedData();
 
         } catch (error) {
+            if (error.name === 'AbortError') {
+                this.showLoadStatus('Loading cancelled');
+                return;
+            }
             this.showError('Error loading data: ' + error.message);
             console.error(error);
         }
     },
 
     /**
-     * Read file as text
-     * @param {File} file - File object
-     * @returns {Promise<string>} File contents
+     * Stream a CSV file or text into columns, accumulating the column
+     * statistics and correlation matrix in the same pass over the rows
+     * @param {File|string} source - CSV file or text
+     * @returns {Promise<object>} Columnar data with a `statistics` field
      */
-    readFile(file) {
-        return new Promise((resolve, reject) => {
-            const reader = new FileReader();
-            reader.onload = (e) => resolve(e.target.result);
-            reader.onerror = () => reject(new Error('Failed to read file'));
-            reader.readAsText(file);
-        });
+    async streamData(source) {
+        const loadBtn = document.getElementById('load-data-btn');
+        const controller = new AbortController();
+        this.loadController = controller;
+        loadBtn.textContent = 'Cancel';
+
+        let accumulator = null;
+        try {
+            const data = await DataProcessor.streamCSV(source, {
+                signal: controller.signal,
+                onRow: (row) => {
+                    if (!accumulator) accumulator = CorrelationEngine.createAccumulator(row.length);
+                    accumulator.push(row);
+                },
+                onProgress: ({ loaded, total, rows }) => {
+                    const percent = total > 0 ? Math.round(100 * loaded / total) : 100;
+                    this.showLoadStatus(`Loading… ${percent}% (${rows.toLocaleString()} rows)`);
+                }
+            });
+            data.statistics = accumulator.finalize(data.columnIndices);
+            return data;
+        } finally {
+            this.loadController = null;
+            loadBtn.textContent = 'Load Data';
+        }
+    },
+
+    /**
+     * Show a status line in the data summary panel
+     * @param {string} message - Status text
+     */
+    showLoadStatus(message) {
+        document.getElementById('data-summary').innerHTML = `<p class="empty-text">${message}</p>`;
     },
 
     /**
      * Process loaded data and update UI
      */
     processLoadedData() {
-        // Normalize all data
-        this.normalizedData = DataProcessor.normalizeAllColumns(this.rawData);
+        // Normalize all data (statistics were gathered while streaming)
+        this.normalizedData = DataProcessor.normalizeColumnar(this.rawData, this.rawData.statistics);
 
         // Populate target column dropdown
         const targetSelect = document.getElementById('target-column');
@@ -194,7 +234,7 @@ const App = {
         // Update data summary
         this.updateDataSummary();
 
-        console.log('Data loaded:', this.rawData.headers.length, 'columns,', this.rawData.rows.length, 'rows');
+        console.log('Data loaded:', this.rawData.headers.length, 'columns,', this.rawData.rowCount, 'rows');
     },
 
     /**
@@ -202,6 +242,8 @@ const App = {
      */
     updateDataSummary() {
         const summary = document.getElementById('data-summary');
+        const missing = Object.values(this.rawData.missingCounts).reduce((a, b) => a + b, 0);
+        const skipped = this.rawData.skippedColumns;
         summary.innerHTML = `
             <div class="summary-row">
                 <span class="summary-label">Columns</span>
@@ -209,12 +251,22 @@ const App = {
             </div>
             <div class="summary-row">
                 <span class="summary-label">Rows</span>
-                <span class="summary-value">${this.rawData.rows.length}</span>
+                <span class="summary-value">${this.rawData.rowCount.toLocaleString()}</span>
             </div>
             <div class="summary-row">
                 <span class="summary-label">Features</span>
                 <span class="summary-value">${this.rawData.headers.length - 1}</span>
             </div>
+            ${missing > 0 ? `
+            <div class="summary-row">
+                <span class="summary-label">Missing Values</span>
+                <span class="summary-value">${missing.toLocaleString()}</span>
+            </div>` : ''}
+            ${skipped.length > 0 ? `
+            <div class="summary-row">
+                <span class="summary-label">Skipped (text)</span>
+                <span class="summary-value">${skipped.join(', ')}</span>
+            </div>` : ''}
         `;
     },
 
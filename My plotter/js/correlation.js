@@ -47,6 +47,215 @@ const CorrelationEngine = {
         return covariance / (stdX * stdY);
     },
 
+    /**
+     * Create a one-pass covariance accumulator (Welford-style updates).
+     * Rows are pushed one at a time as they are parsed, with NaN marking a
+     * missing value. Complete rows share one count and mean vector, so each
+     * costs one multiply-add per pair. Rows with missing values go to a
+     * pairwise accumulator that keeps a count, means and co-moments for each
+     * pair over the rows where both values are present. The two parts are
+     * merged with Chan's parallel update in finalize().
+     *
+     * Only columns that have held a value so far decide whether a row is
+     * complete, so text columns (NaN on every row) do not push every row
+     * onto the pairwise path. When a column sees its first value, the
+     * complete rows so far are folded into the pairwise part and the shared
+     * block restarts with that column included.
+     * @param {number} columnCount - Values per row
+     * @returns {object} Accumulator with push(row) and finalize(indices)
+     */
+    createAccumulator(columnCount) {
+        const c = columnCount;
+        const size = c * c; // upper triangle (j <= k) of a c x c matrix
+
+        // Columns with at least one value, kept in ascending order
+        const isActive = new Uint8Array(c);
+        const active = new Int32Array(c);
+        let activeCount = 0;
+
+        // Complete rows (over the active columns)
+        let n = 0;
+        const mean = new Float64Array(c);
+        const delta = new Float64Array(c);
+        const comoment = new Float64Array(size);
+
+        // Rows with missing values, created on the first such row
+        let pair = null;
+
+        // Per-column statistics over present values
+        const count = new Float64Array(c);
+        const colMean = new Float64Array(c);
+        const colM2 = new Float64Array(c);
+        const min = new Float64Array(c).fill(Infinity);
+        const max = new Float64Array(c).fill(-Infinity);
+
+        const ensurePair = () => {
+            if (!pair) {
+                pair = {
+                    n: new Float64Array(size),
+                    meanJ: new Float64Array(size),
+                    meanK: new Float64Array(size),
+                    m2J: new Float64Array(size),
+                    m2K: new Float64Array(size),
+                    co: new Float64Array(size)
+                };
+            }
+            return pair;
+        };
+
+        // Merge the complete-row block into the pairwise part and reset it
+        const flushComplete = () => {
+            if (n === 0) return;
+            const { n: pn, meanJ, meanK, m2J, m2K, co } = ensurePair();
+            for (let a = 0; a < activeCount; a++) {
+                const j = active[a];
+                const base = j * c;
+                for (let b = a; b < activeCount; b++) {
+                    const k = active[b];
+                    const jk = base + k;
+                    const nB = pn[jk];
+                    const total = n + nB;
+                    const dj = mean[j] - meanJ[jk];
+                    const dk = mean[k] - meanK[jk];
+                    const w = n * nB / total;
+                    co[jk] += comoment[jk] + dj * dk * w;
+                    m2J[jk] += comoment[j * c + j] + dj * dj * w;
+                    m2K[jk] += comoment[k * c + k] + dk * dk * w;
+                    meanJ[jk] += dj * n / total;
+                    meanK[jk] += dk * n / total;
+                    pn[jk] = total;
+                }
+            }
+            n = 0;
+            mean.fill(0);
+            comoment.fill(0);
+        };
+
+        const activate = (j) => {
+            flushComplete();
+            let a = activeCount++;
+            while (a > 0 && active[a - 1] > j) {
+                active[a] = active[a - 1];
+                a--;
+            }
+            active[a] = j;
+            isActive[j] = 1;
+        };
+
+        // Pair (j, k) combined over complete and incomplete rows
+        const pairMoments = (j, k) => {
+            const jk = j * c + k;
+            const inBlock = n > 0 && isActive[j] && isActive[k];
+            const result = inBlock
+                ? { co: comoment[jk], m2J: comoment[j * c + j], m2K: comoment[k * c + k] }
+                : { co: 0, m2J: 0, m2K: 0 };
+            const nA = inBlock ? n : 0;
+            const nB = pair ? pair.n[jk] : 0;
+            if (nB > 0) {
+                const total = nA + nB;
+                const dj = pair.meanJ[jk] - mean[j];
+                const dk = pair.meanK[jk] - mean[k];
+                const w = nA * nB / total;
+                result.co += pair.co[jk] + dj * dk * w;
+                result.m2J += pair.m2J[jk] + dj * dj * w;
+                result.m2K += pair.m2K[jk] + dk * dk * w;
+            }
+            return result;
+        };
+
+        return {
+            push(row) {
+                let complete = true;
+                for (let j = 0; j < c; j++) {
+                    const x = row[j];
+                    if (x !== x) {
+                        if (isActive[j]) complete = false;
+                        continue;
+                    }
+                    if (!isActive[j]) activate(j);
+                    const m = ++count[j];
+                    const d = x - colMean[j];
+                    colMean[j] += d / m;
+                    colM2[j] += d * (x - colMean[j]);
+                    if (x < min[j]) min[j] = x;
+                    if (x > max[j]) max[j] = x;
+                }
+
+                if (complete) {
+                    n++;
+                    for (let a = 0; a < activeCount; a++) {
+                        const j = active[a];
+                        delta[j] = row[j] - mean[j];
+                        mean[j] += delta[j] / n;
+                    }
+                    for (let a = 0; a < activeCount; a++) {
+                        const j = active[a];
+                        const dj = delta[j];
+                        const base = j * c;
+                        for (let b = a; b < activeCount; b++) {
+                            const k = active[b];
+                            comoment[base + k] += dj * (row[k] - mean[k]);
+                        }
+                    }
+                    return;
+                }
+
+                const { n: pn, meanJ, meanK, m2J, m2K, co } = ensurePair();
+                for (let j = 0; j < c; j++) {
+                    const xj = row[j];
+                    if (xj !== xj) continue;
+                    const base = j * c;
+                    for (let k = j; k < c; k++) {
+                        const xk = row[k];
+                        if (xk !== xk) continue;
+                        const jk = base + k;
+                        const m = ++pn[jk];
+                        const dj = xj - meanJ[jk];
+                        const dk = xk - meanK[jk];
+                        meanJ[jk] += dj / m;
+                        meanK[jk] += dk / m;
+                        co[jk] += dj * (xk - meanK[jk]);
+                        m2J[jk] += dj * (xj - meanJ[jk]);
+                        m2K[jk] += dk * (xk - meanK[jk]);
+                    }
+                }
+            },
+
+            /**
+             * Statistics for the selected columns
+             * @param {number[]} [indices] - Row positions of the columns to report (default all)
+             * @returns {object} { count, mean, std, min, max, correlation: { size, values } }
+             */
+            finalize(indices = Array.from({ length: c }, (_, i) => i)) {
+                const m = indices.length;
+                const values = new Float64Array(m * m);
+                for (let a = 0; a < m; a++) {
+                    values[a * m + a] = 1;
+                    for (let b = a + 1; b < m; b++) {
+                        const j = Math.min(indices[a], indices[b]);
+                        const k = Math.max(indices[a], indices[b]);
+                        const { co, m2J, m2K } = pairMoments(j, k);
+                        // Same convention as pearsonCorrelation: no variation -> 0
+                        const r = m2J > 0 && m2K > 0 ? co / Math.sqrt(m2J * m2K) : 0;
+                        const clamped = Math.max(-1, Math.min(1, r));
+                        values[a * m + b] = clamped;
+                        values[b * m + a] = clamped;
+                    }
+                }
+
+                return {
+                    count: indices.map(j => count[j]),
+                    mean: indices.map(j => count[j] > 0 ? colMean[j] : NaN),
+                    // Population standard deviation, as DataProcessor.standardDeviation
+                    std: indices.map(j => count[j] > 0 ? Math.sqrt(colM2[j] / count[j]) : NaN),
+                    min: indices.map(j => min[j]),
+                    max: indices.map(j => max[j]),
+                    correlation: { size: m, values }
+                };
+            }
+        };
+    },
+
     /**
      * Map correlation value to angle in degrees using R² similarity
      * Uses the formula: θ = arccos(r²)
@@ -90,9 +299,21 @@ const CorrelationEngine = {
      * @returns {object} Correlations object with column names as keys
      */
     calculateTargetCorrelations(normalizedData, targetColumn) {
-        const targetValues = normalizedData.columns[targetColumn];
         const correlations = {};
 
+        // Streamed data carries the full matrix; read the target's row from it
+        const matrix = normalizedData.correlationMatrix;
+        if (matrix) {
+            const headers = normalizedData.headers;
+            const t = headers.indexOf(targetColumn);
+            headers.forEach((header, i) => {
+                if (i !== t) correlations[header] = matrix.values[t * matrix.size + i];
+            });
+            return correlations;
+        }
+
+        const targetValues = normalizedData.columns[targetColumn];
+
         for (const header of normalizedData.headers) {
             if (header !== targetColumn) {
                 const inputValues = normalizedData.columns[header];
@@ -113,6 +334,20 @@ const CorrelationEngine = {
         const inputColumns = normalizedData.headers.filter(h => h !== targetColumn);
         const matrix = {};
 
+        const precomputed = normalizedData.correlationMatrix;
+        if (precomputed) {
+            const position = {};
+            normalizedData.headers.forEach((header, i) => { position[header] = i; });
+            for (const col1 of inputColumns) {
+                matrix[col1] = {};
+                for (const col2 of inputColumns) {
+                    matrix[col1][col2] = col1 === col2 ? 1 :
+                        precomputed.values[position[col1] * precomputed.size + position[col2]];
+                }
+            }
+            return matrix;
+        }
+
         for (const col1 of inputColumns) {
             matrix[col1] = {};
             for (const col2 of inputColumns) {
@@ -103,6 +103,249 @@ const DataProcessor = {
         return { headers, rows };
     },
 
+    /**
+     * Cells read as missing values rather than text (compared lower-cased)
+     */
+    missingTokens: new Set(['', 'na', 'n/a', 'nan', 'null', 'none', '-', '?']),
+
+    /**
+     * Split one CSV record into fields, honouring double-quoted fields
+     * @param {string} line - One record (quoted fields may contain commas)
+     * @returns {string[]} Field values
+     */
+    splitCSVRecord(line) {
+        if (line.indexOf('"') === -1) {
+            return line.split(',');
+        }
+
+        const fields = [];
+        let field = '';
+        let quoted = false;
+        for (let i = 0; i < line.length; i++) {
+            const ch = line[i];
+            if (quoted) {
+                if (ch === '"') {
+                    if (line[i + 1] === '"') {
+                        field += '"';
+                        i++;
+                    } else {
+                        quoted = false;
+                    }
+                } else {
+                    field += ch;
+                }
+            } else if (ch === '"') {
+                quoted = true;
+            } else if (ch === ',') {
+                fields.push(field);
+                field = '';
+            } else {
+                field += ch;
+            }
+        }
+        fields.push(field);
+        return fields;
+    },
+
+    /**
+     * Stream CSV from a File/Blob (or string) into per-column Float64Arrays.
+     * The input is decoded and parsed one chunk at a time, so the raw text is
+     * never held in memory as a whole. Missing or non-numeric cells are stored
+     * as NaN and flagged in a per-column mask. A column whose present cells
+     * are mostly text is typed 'text' and left out of `headers`.
+     * @param {Blob|string} source - CSV file or text
+     * @param {object} [options]
+     * @param {number} [options.chunkSize] - Bytes decoded per step (default 1 MB)
+     * @param {function} [options.onRow] - Called with each row as a reused Float64Array (NaN = missing)
+     * @param {function} [options.onProgress] - Called per chunk with { loaded, total, rows }
+     * @param {AbortSignal} [options.signal] - Cancels the load between chunks
+     * @returns {Promise<object>} Columnar data: { headers, columns, missing, missingCounts,
+     *          columnTypes, skippedColumns, rowCount }
+     */
+    async streamCSV(source, options = {}) {
+        const blob = typeof source === 'string' ? new Blob([source]) : source;
+        const chunkSize = options.chunkSize || (1 << 20);
+        const { onRow, onProgress, signal } = options;
+        const decoder = new TextDecoder();
+
+        let headers = null;
+        let width = 0;
+        let capacity = 1024;
+        let values = [];
+        let masks = [];
+        let numericCounts = null;
+        let textCounts = null;
+        let row = null;
+        let rowCount = 0;
+        let lineNumber = 0;
+        let carry = '';
+
+        const grow = () => {
+            capacity *= 2;
+            values = values.map(col => {
+                const next = new Float64Array(capacity);
+                next.set(col);
+                return next;
+            });
+            masks = masks.map(col => {
+                const next = new Uint8Array(capacity);
+                next.set(col);
+                return next;
+            });
+        };
+
+        const addRecord = (line) => {
+            lineNumber++;
+            if (line.endsWith('\r')) line = line.slice(0, -1);
+
+            if (!headers) {
+                headers = this.splitCSVRecord(line).map(h => h.trim());
+                width = headers.length;
+                values = headers.map(() => new Float64Array(capacity));
+                masks = headers.map(() => new Uint8Array(capacity));
+                numericCounts = new Float64Array(width);
+                textCounts = new Float64Array(width);
+                row = new Float64Array(width);
+                return;
+            }
+            if (line.trim() === '') return;
+
+            const fields = this.splitCSVRecord(line);
+            if (fields.length !== width) {
+                throw new Error(`Row ${lineNumber} has ${fields.length} values, expected ${width}`);
+            }
+            if (rowCount === capacity) grow();
+
+            for (let c = 0; c < width; c++) {
+                const cell = fields[c];
+                const num = +cell;
+                // +'' and +'  ' are 0, so only zeros need the blank check
+                if (num === num && (num !== 0 || cell.trim() !== '')) {
+                    row[c] = num;
+                    numericCounts[c]++;
+                } else {
+                    row[c] = NaN;
+                    masks[c][rowCount] = 1;
+                    if (!this.missingTokens.has(cell.trim().toLowerCase())) textCounts[c]++;
+                }
+                values[c][rowCount] = row[c];
+            }
+            rowCount++;
+            if (onRow) onRow(row, rowCount - 1);
+        };
+
+        // A newline inside an open quoted field does not end the record
+        const addLines = (text, final) => {
+            const lines = (carry + text).split('\n');
+            carry = final ? '' : lines.pop();
+            let pending = null;
+            for (const line of lines) {
+                if (pending === null && line.indexOf('"') === -1) {
+                    addRecord(line);
+                    continue;
+                }
+                const record = pending === null ? line : pending + '\n' + line;
+                if ((record.split('"').length - 1) % 2 === 1) {
+                    pending = record;
+                    continue;
+                }
+                pending = null;
+                addRecord(record);
+            }
+            if (pending !== null) {
+                if (final) throw new Error('Unterminated quoted field at end of CSV');
+                carry = pending + '\n' + carry;
+            }
+        };
+
+        for (let offset = 0; offset < blob.size; offset += chunkSize) {
+            if (signal) signal.throwIfAborted();
+            const buffer = await blob.slice(offset, offset + chunkSize).arrayBuffer();
+            addLines(decoder.decode(buffer, { stream: true }), false);
+            if (onProgress) {
+                onProgress({ loaded: Math.min(offset + chunkSize, blob.size), total: blob.size, rows: rowCount });
+            }
+        }
+        addLines(decoder.decode(), true);
+
+        if (!headers || rowCount === 0) {
+            throw new Error('CSV must have at least a header row and one data row');
+        }
+
+        // Stray text in a numeric column counts as missing; mostly-text columns are skipped
+        const data = {
+            headers: [],
+            columns: {},
+            missing: {},
+            missingCounts: {},
+            columnTypes: {},
+            skippedColumns: [],
+            columnIndices: [],
+            rowCount
+        };
+        headers.forEach((header, c) => {
+            const isNumeric = numericCounts[c] > 0 && textCounts[c] <= 0.05 * (numericCounts[c] + textCounts[c]);
+            data.columnTypes[header] = isNumeric ? 'numeric' : 'text';
+            if (!isNumeric) {
+                data.skippedColumns.push(header);
+                return;
+            }
+            data.headers.push(header);
+            data.columnIndices.push(c);
+            data.columns[header] = values[c].slice(0, rowCount);
+            data.missing[header] = masks[c].slice(0, rowCount);
+            data.missingCounts[header] = rowCount - numericCounts[c];
+        });
+
+        if (data.headers.length === 0) {
+            throw new Error('CSV has no numeric columns');
+        }
+        return data;
+    },
+
+    /**
+     * Min-max normalize columnar data using precomputed column statistics
+     * @param {object} data - Columnar data from streamCSV
+     * @param {object} stats - Column statistics from a CorrelationEngine accumulator
+     * @returns {object} Normalized data with metadata and the correlation matrix
+     */
+    normalizeColumnar(data, stats) {
+        const normalizedData = {
+            headers: data.headers,
+            columns: {},
+            metadata: {},
+            rowCount: data.rowCount,
+            correlationMatrix: stats.correlation
+        };
+
+        data.headers.forEach((header, index) => {
+            const values = data.columns[header];
+            const min = stats.min[index];
+            const max = stats.max[index];
+            const range = max - min;
+            const normalized = new Float64Array(values.length);
+
+            if (range === 0) {
+                // All values are the same
+                for (let i = 0; i < values.length; i++) normalized[i] = values[i] === values[i] ? 0.5 : NaN;
+            } else {
+                for (let i = 0; i < values.length; i++) normalized[i] = (values[i] - min) / range;
+            }
+
+            normalizedData.columns[header] = normalized;
+            normalizedData.metadata[header] = {
+                min,
+                max,
+                range,
+                mean: stats.mean[index],
+                std: stats.std[index],
+                missing: data.missingCounts[header]
+            };
+        });
+
+        return normalizedData;
+    },
+
     /**
      * Get a column of data by index
      * @param {object} data - Parsed data object
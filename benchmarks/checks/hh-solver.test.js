@@ -0,0 +1,64 @@
+/**
+ * HHSolver RK45, exponential Euler and the batched sweep vs the reference
+ * forward Euler scheme at small dt.
+ *
+ *   node --test benchmarks/checks/
+ */
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { loadEngine } = require('../lib/engine-loader');
+
+// μA/cm²: one spike, near the repetitive-firing threshold, default, strong drive
+const CURRENTS = [3, 6.5, 10, 40];
+const REFERENCE_DT = 0.001;
+// ms; forward Euler at dt = 0.001 is itself ~0.03 ms off on later spikes
+const SPIKE_TOLERANCE = 0.1;
+
+function assertSpikesMatch(actual, expected, tolerance, label) {
+    assert.strictEqual(actual.length, expected.length, `${label}: spike count`);
+    for (let s = 0; s < expected.length; s++) {
+        assert.ok(Math.abs(actual[s] - expected[s]) <= tolerance,
+            `${label}: spike ${s} at ${actual[s]} ms, reference ${expected[s]} ms`);
+    }
+}
+
+test('rk45 and exponential Euler match forward Euler at dt = 0.001', () => {
+    const { HHSolver } = loadEngine('neuroscience');
+
+    for (const current of CURRENTS) {
+        const reference = HHSolver.simulate({ current }, { method: 'euler', dt: REFERENCE_DT }).spikeTimes;
+        assert.ok(reference.length > 0, `I=${current}: reference trace has no spikes`);
+
+        for (const method of ['rk45', 'exponential']) {
+            const trace = HHSolver.simulate({ current }, { method });
+            assertSpikesMatch(trace.spikeTimes, reference, SPIKE_TOLERANCE, `${method}, I=${current}`);
+        }
+    }
+});
+
+test('sweep lanes match forward Euler spike times', () => {
+    const { HHSolver } = loadEngine('neuroscience');
+    const result = HHSolver.sweep({ current: CURRENTS });
+
+    CURRENTS.forEach((current, lane) => {
+        const reference = HHSolver.simulate({ current }, { method: 'euler', dt: REFERENCE_DT }).spikeTimes;
+        const spikes = result.spikeTimes.subarray(result.spikeOffsets[lane], result.spikeOffsets[lane + 1]);
+        assertSpikesMatch(spikes, reference, SPIKE_TOLERANCE, `sweep lane ${lane}, I=${current}`);
+    });
+});
+
+test('tight-tolerance rk45 matches Richardson-extrapolated forward Euler', () => {
+    const { HHSolver } = loadEngine('neuroscience');
+
+    for (const current of CURRENTS) {
+        // Forward Euler is first order: 2·T(dt/2) - T(dt) cancels the O(dt) error
+        const coarse = HHSolver.simulate({ current }, { method: 'euler', dt: REFERENCE_DT }).spikeTimes;
+        const fine = HHSolver.simulate({ current }, { method: 'euler', dt: REFERENCE_DT / 2 }).spikeTimes;
+        assert.strictEqual(fine.length, coarse.length, `I=${current}: Euler spike count changed with dt`);
+        const extrapolated = Array.from(fine, (t, s) => 2 * t - coarse[s]);
+
+        const trace = HHSolver.simulate({ current }, { method: 'rk45', rtol: 1e-9, atol: 1e-9 });
+        assertSpikesMatch(trace.spikeTimes, extrapolated, 1e-3, `rk45 (tight), I=${current}`);
+    }
+});
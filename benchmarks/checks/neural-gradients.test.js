@@ -0,0 +1,84 @@
+/**
+ * Finite-difference gradient checks for CNNNetwork and TransformerNetwork
+ * trainStep backpropagation.
+ *
+ *   node --test benchmarks/checks/
+ */
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { loadEngine } = require('../lib/engine-loader');
+
+const EPSILON = 1e-6;
+const TOLERANCE = 1e-8;
+
+// Stands in for the network's optimizer: keeps a copy of the gradients from
+// the first trainStep (at the unperturbed parameters) and never updates them
+function recordingOptimizer() {
+    const grads = new Map();
+    return {
+        grads,
+        incrementT() {},
+        update(param, grad, name) {
+            if (!grads.has(name)) grads.set(name, { param, grad: Float64Array.from(grad.data) });
+        }
+    };
+}
+
+// Compare every recorded gradient entry with a central difference of `loss`
+function checkGradients(network, loss) {
+    const recorder = recordingOptimizer();
+    network.optimizer = recorder;
+    loss();
+
+    assert.ok(recorder.grads.size > 0, 'trainStep passed no gradients to the optimizer');
+    for (const [name, { param, grad }] of recorder.grads) {
+        assert.strictEqual(grad.length, param.data.length, `${name}: gradient size`);
+        for (let i = 0; i < param.data.length; i++) {
+            const saved = param.data[i];
+            param.data[i] = saved + EPSILON;
+            const plus = loss();
+            param.data[i] = saved - EPSILON;
+            const minus = loss();
+            param.data[i] = saved;
+
+            const numeric = (plus - minus) / (2 * EPSILON);
+            const error = Math.abs(numeric - grad[i]);
+            assert.ok(error <= TOLERANCE * Math.max(1, Math.abs(numeric)),
+                `${name}[${i}]: analytic ${grad[i]} vs numeric ${numeric}`);
+        }
+    }
+}
+
+test('CNNNetwork.trainStep gradients match central differences', () => {
+    const { CNNNetwork, random } = loadEngine('neural', { seed: 11 });
+    const size = 8;
+    const image = () => Array.from({ length: size }, () =>
+        Array.from({ length: size }, () => random() * 2 - 1));
+
+    const network = new CNNNetwork(size, 4, { learningRate: 0.05 });
+    // A few real steps so the biases are no longer zero
+    for (let i = 0; i < 3; i++) network.trainStep(image(), i % 4);
+
+    for (let label = 0; label < 4; label++) {
+        const input = image();
+        checkGradients(network, () => network.trainStep(input, label));
+    }
+});
+
+test('TransformerNetwork.trainStep gradients match central differences', () => {
+    const { TransformerNetwork, random } = loadEngine('neural', { seed: 13 });
+    const sequence = (length, width) => Array.from({ length }, () =>
+        Array.from({ length: width }, () => random() * 2 - 1));
+
+    for (const [inputSize, embedDim, outputSize, seqLen] of [[1, 4, 1, 5], [2, 6, 3, 7]]) {
+        const network = new TransformerNetwork(inputSize, embedDim, outputSize, { learningRate: 0.05 });
+        for (let i = 0; i < 3; i++) {
+            network.trainStep(sequence(seqLen, inputSize), sequence(seqLen, outputSize));
+        }
+
+        const input = sequence(seqLen, inputSize);
+        const targets = sequence(seqLen, outputSize);
+        checkGradients(network, () => network.trainStep(input, targets));
+    }
+});
@@ -0,0 +1,112 @@
+/**
+ * StateVectorBackend vs the {re, im} object simulator on random circuits.
+ *
+ *   node --test benchmarks/checks/
+ */
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { loadEngine } = require('../lib/engine-loader');
+
+const TOLERANCE = 1e-10;
+const SINGLE = ['H', 'X', 'Y', 'Z', 'S', 'T', 'I'];
+const INITIAL = ['0', '1', '+', '-', 'i', '-i'];
+
+function randomCircuit(random, qubits, length) {
+    const pick = (list) => list[Math.floor(random() * list.length)];
+    const qubit = () => Math.floor(random() * qubits);
+    const pair = () => {
+        const a = qubit();
+        let b = qubit();
+        while (b === a) b = qubit();
+        return [a, b];
+    };
+
+    const circuit = [];
+    for (let g = 0; g < length; g++) {
+        const roll = random();
+        if (qubits < 2 || roll < 0.6) {
+            circuit.push({ type: pick(SINGLE), qubit: qubit() });
+        } else if (roll < 0.75) {
+            const [control, target] = pair();
+            circuit.push({ type: 'CNOT', control, target });
+        } else if (roll < 0.85) {
+            const [control, target] = pair();
+            circuit.push({ type: 'CZ', control, target });
+        } else if (roll < 0.95) {
+            const [qubit1, qubit2] = pair();
+            circuit.push({ type: 'SWAP', qubit1, qubit2 });
+        } else {
+            circuit.push({ type: random() < 0.5 ? 'QFT' : 'IQFT' });
+        }
+    }
+    return circuit;
+}
+
+// Run one circuit with the typed backend forced on or off
+function simulate(QuantumSimulator, qubits, circuit, initialStates, typed) {
+    const saved = QuantumSimulator.TYPED_BACKEND_MIN_QUBITS;
+    QuantumSimulator.TYPED_BACKEND_MIN_QUBITS = typed ? 1 : Infinity;
+    try {
+        const sim = new QuantumSimulator(qubits);
+        const state = sim.simulate(circuit, initialStates);
+        assert.strictEqual(Boolean(sim.backend), typed);
+        const bloch = [];
+        for (let q = 0; q < qubits; q++) bloch.push(sim.getBlochCoordinates(q));
+        return { state, bloch };
+    } finally {
+        QuantumSimulator.TYPED_BACKEND_MIN_QUBITS = saved;
+    }
+}
+
+function assertClose(actual, expected, label) {
+    assert.ok(Math.abs(actual - expected) <= TOLERANCE, `${label}: ${actual} vs ${expected}`);
+}
+
+test('typed backend matches the object simulator on random circuits', () => {
+    const { QuantumSimulator, random } = loadEngine('quantum', { seed: 7 });
+
+    for (let qubits = 1; qubits <= 10; qubits++) {
+        for (let trial = 0; trial < 5; trial++) {
+            const circuit = randomCircuit(random, qubits, 10 + 4 * qubits);
+            const initialStates = Array.from({ length: qubits }, () => INITIAL[Math.floor(random() * INITIAL.length)]);
+
+            const reference = simulate(QuantumSimulator, qubits, circuit, initialStates, false);
+            const typed = simulate(QuantumSimulator, qubits, circuit, initialStates, true);
+            const where = `${qubits} qubits, trial ${trial}`;
+
+            const a = typed.state.amplitudes;
+            const b = reference.state.amplitudes;
+            assert.strictEqual(a.length, 2 << qubits);
+            for (let i = 0; i < a.length; i++) assertClose(a[i], b[i], `${where}, amplitude[${i}]`);
+
+            let total = 0;
+            for (const p of typed.state.probabilities) total += p;
+            assertClose(total, 1, `${where}, total probability`);
+
+            for (let q = 0; q < qubits; q++) {
+                for (const axis of ['x', 'y', 'z']) {
+                    assertClose(typed.bloch[q][axis], reference.bloch[q][axis], `${where}, bloch q${q}.${axis}`);
+                }
+            }
+        }
+    }
+});
+
+test('describeStates keeps the most probable states in basis order', () => {
+    const { QuantumSimulator } = loadEngine('quantum');
+    const sim = new QuantumSimulator(3);
+    const state = {
+        numQubits: 3,
+        amplitudes: new Float64Array(16),
+        probabilities: Float64Array.from([0.05, 0.3, 0, 0.1, 0.4, 0, 0.15, 0])
+    };
+
+    const top = sim.describeStates(state, { limit: 3, minProbability: 1e-6 });
+    assert.deepStrictEqual(Array.from(top, s => s.index), [1, 4, 6]);
+    assert.strictEqual(top[0].basis, '|100⟩');
+
+    const nonZero = sim.describeStates(state, { minProbability: 1e-6 });
+    assert.deepStrictEqual(Array.from(nonZero, s => s.index), [0, 1, 3, 4, 6]);
+    assert.strictEqual(sim.getState().amplitudes.length, 8);
+});
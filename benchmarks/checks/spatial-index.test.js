@@ -0,0 +1,85 @@
+/**
+ * KDTree k-nearest and radius queries vs a brute-force scan, plus the
+ * block-refined region rasterizer vs per-pixel labels.
+ *
+ *   node --test benchmarks/checks/
+ */
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { loadEngine } = require('../lib/engine-loader');
+
+const METRICS = {
+    euclidean: (dx, dy) => Math.sqrt(dx * dx + dy * dy),
+    manhattan: (dx, dy) => Math.abs(dx) + Math.abs(dy),
+    chebyshev: (dx, dy) => Math.max(Math.abs(dx), Math.abs(dy))
+};
+
+function clusteredPoints(random, n) {
+    const points = [];
+    for (let i = 0; i < n; i++) {
+        const cx = i % 2 ? -0.5 : 0.5;
+        points.push({ x: cx + (random() - 0.5) * 0.5, y: (random() - 0.5) * 0.5 });
+    }
+    return points;
+}
+
+test('nearest matches a brute-force scan, including queries far from the data', () => {
+    const { KDTree, random } = loadEngine('ml', { seed: 5 });
+
+    for (const n of [1, 7, 300]) {
+        const points = clusteredPoints(random, n);
+        const tree = new KDTree(points);
+
+        for (const [name, distance] of Object.entries(METRICS)) {
+            for (const k of [1, 5, 12]) {
+                for (let q = 0; q < 40; q++) {
+                    const x = (random() - 0.5) * 6;
+                    const y = (random() - 0.5) * 6;
+                    const expected = points
+                        .map(p => distance(p.x - x, p.y - y))
+                        .sort((a, b) => a - b)
+                        .slice(0, k);
+                    const actual = Array.from(tree.nearest(x, y, k, name), r => r.distance);
+                    assert.deepStrictEqual(actual, expected, `${name}, n=${n}, k=${k}`);
+                }
+            }
+        }
+    }
+});
+
+test('withinRadius matches a brute-force scan', () => {
+    const { KDTree, random } = loadEngine('ml', { seed: 6 });
+    const points = clusteredPoints(random, 500);
+    const tree = new KDTree(points);
+
+    for (const [name, distance] of Object.entries(METRICS)) {
+        for (let q = 0; q < 40; q++) {
+            const x = (random() - 0.5) * 2;
+            const y = (random() - 0.5) * 2;
+            const radius = random() * 0.3;
+            const expected = [];
+            points.forEach((p, i) => {
+                if (distance(p.x - x, p.y - y) <= radius) expected.push(i);
+            });
+            const actual = Array.from(tree.withinRadius(x, y, radius, name)).sort((a, b) => a - b);
+            assert.deepStrictEqual(actual, expected, name);
+        }
+    }
+});
+
+test('rasterizeRegions reproduces per-pixel Voronoi labels', () => {
+    const { KDTree, rasterizeRegions, random } = loadEngine('ml', { seed: 8 });
+    const centroids = Array.from({ length: 6 }, () => ({ x: random() * 2 - 1, y: random() * 2 - 1 }));
+    const tree = new KDTree(centroids);
+    const width = 203;
+    const height = 117;
+    const regionAt = (px, py) => tree.nearestHeap(px / 100 - 1, py / 58 - 1, 1).index[0];
+
+    const labels = rasterizeRegions(width, height, 8, regionAt);
+    for (let py = 0; py < height; py++) {
+        for (let px = 0; px < width; px++) {
+            assert.strictEqual(labels[py * width + px], regionAt(px, py), `pixel (${px}, ${py})`);
+        }
+    }
+});
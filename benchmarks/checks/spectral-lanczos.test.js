@@ -0,0 +1,128 @@
+/**
+ * SpectralEngine sparse Lanczos path vs the dense Jacobi path on small graphs.
+ *
+ *   node --test benchmarks/checks/
+ */
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { loadEngine } = require('../lib/engine-loader');
+
+const TOLERANCE = 1e-8;
+const TYPES = ['combinatorial', 'normalized', 'randomwalk'];
+
+// Block-diagonal union of two graphs
+function disjointUnion(A, B) {
+    const n = A.length + B.length;
+    const M = Array.from({ length: n }, () => new Array(n).fill(0));
+    A.forEach((row, i) => row.forEach((v, j) => { M[i][j] = v; }));
+    B.forEach((row, i) => row.forEach((v, j) => { M[A.length + i][A.length + j] = v; }));
+    return M;
+}
+
+function graphs(SpectralEngine) {
+    return {
+        'path 6': SpectralEngine.createPathGraph(6),
+        'path 30': SpectralEngine.createPathGraph(30),
+        'cycle 7': SpectralEngine.createCycleGraph(7),
+        'cycle 24': SpectralEngine.createCycleGraph(24),
+        'complete 8': SpectralEngine.createCompleteGraph(8),
+        'random 45': SpectralEngine.createRandomGraph(45, 0.2),
+        'path 5 + cycle 6 + isolated node': disjointUnion(
+            disjointUnion(SpectralEngine.createPathGraph(5), SpectralEngine.createCycleGraph(6)), [[0]])
+    };
+}
+
+// ||M v - λ v|| for a dense matrix M
+function residual(M, vector, value) {
+    let sum = 0;
+    for (let i = 0; i < M.length; i++) {
+        let mv = 0;
+        for (let j = 0; j < M.length; j++) mv += M[i][j] * vector[j];
+        sum += (mv - value * vector[i]) ** 2;
+    }
+    return Math.sqrt(sum);
+}
+
+test('Lanczos eigenpairs agree with dense Jacobi on paths, cycles and a disconnected graph', () => {
+    const { SpectralEngine } = loadEngine('spectral', { seed: 3 });
+
+    for (const [name, adjacency] of Object.entries(graphs(SpectralEngine))) {
+        for (const type of TYPES) {
+            const engine = new SpectralEngine();
+            engine.setAdjacencyMatrix(adjacency);
+            engine.laplacianType = type;
+
+            const n = adjacency.length;
+            const k = Math.min(n, 10);
+            const dense = engine.computeDenseEigendecomposition();
+            const sparse = engine.computeSparseEigenpairs(k);
+            const L = engine.getLaplacian();
+            const where = `${name}, ${type}`;
+
+            assert.strictEqual(dense.eigenvalues.length, n, where);
+            assert.strictEqual(sparse.eigenvalues.length, k, where);
+            for (let i = 0; i < k; i++) {
+                const diff = Math.abs(sparse.eigenvalues[i] - dense.eigenvalues[i]);
+                assert.ok(diff < TOLERANCE, `${where}, λ${i}: ${sparse.eigenvalues[i]} vs ${dense.eigenvalues[i]}`);
+            }
+
+            // Repeated eigenvalues leave the basis free, so compare eigenvectors by residual
+            for (const [label, result] of [['sparse', sparse], ['dense', dense]]) {
+                for (let i = 0; i < k; i++) {
+                    const r = residual(L, result.eigenvectors[i], result.eigenvalues[i]);
+                    assert.ok(r < 1e-6, `${where}, ${label} eigenvector ${i} residual ${r}`);
+                }
+            }
+        }
+    }
+});
+
+test('disconnected graphs have one zero eigenvalue per component', () => {
+    const { SpectralEngine } = loadEngine('spectral');
+    const engine = new SpectralEngine();
+    engine.setAdjacencyMatrix(disjointUnion(SpectralEngine.createPathGraph(4), SpectralEngine.createCycleGraph(5)));
+
+    const dense = engine.computeDenseEigendecomposition();
+    const sparse = engine.computeSparseEigenpairs(4);
+    assert.deepStrictEqual(Array.from(dense.eigenvalues.slice(0, 2)), [0, 0]);
+    assert.deepStrictEqual(Array.from(sparse.eigenvalues.slice(0, 2)), [0, 0]);
+    assert.ok(sparse.eigenvalues[2] > 1e-6);
+});
+
+test('cached spectra are read-only', () => {
+    const { SpectralEngine } = loadEngine('spectral');
+    const engine = new SpectralEngine();
+    engine.setAdjacencyMatrix(SpectralEngine.createCycleGraph(6));
+
+    const first = engine.computeEigendecomposition();
+    assert.throws(() => { 'use strict'; first.eigenvalues[0] = 42; });
+    assert.throws(() => { 'use strict'; first.eigenvectors[1][0] = 42; });
+
+    const again = engine.computeEigendecomposition();
+    assert.strictEqual(again.eigenvalues[0], 0);
+    assert.strictEqual(engine.getAlgebraicConnectivity(), again.eigenvalues[1]);
+});
+
+test('sparse spectral radius matches the largest dense eigenvalue', () => {
+    const { SpectralEngine } = loadEngine('spectral', { seed: 4 });
+    const cases = {
+        ...graphs(SpectralEngine),
+        'random 240': SpectralEngine.createRandomGraph(240, 0.05)
+    };
+
+    for (const [name, adjacency] of Object.entries(cases)) {
+        for (const type of TYPES) {
+            const engine = new SpectralEngine();
+            engine.setAdjacencyMatrix(adjacency);
+            engine.laplacianType = type;
+
+            const dense = engine.computeDenseEigendecomposition().eigenvalues;
+            const expected = dense[dense.length - 1];
+            const actual = engine.getSpectralRadius();
+            const sparse = engine.computeSparseSpectralRadius();
+            assert.ok(Math.abs(actual - expected) < TOLERANCE, `${name}, ${type}: ${actual} vs ${expected}`);
+            assert.ok(Math.abs(sparse - expected) < TOLERANCE, `${name}, ${type}: sparse ${sparse} vs ${expected}`);
+        }
+    }
+});
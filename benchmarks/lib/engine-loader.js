@@ -0,0 +1,118 @@
+/**
+ * Headless Engine Loader
+ * Runs the browser engine scripts in plain Node: each engine group gets its own
+ * vm context whose global doubles as `window` (the same trick the Web Workers
+ * use with `self.window = self`), loaded in the order the pages load them.
+ * No DOM is provided - anything touching `document` at load time fails loudly.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const ROOT = path.resolve(__dirname, '..', '..');
+
+// Script lists mirror the <script> order of each tool page
+const ENGINES = {
+    neural: {
+        scripts: [
+            'tools/neural-network/nn-engine.js',
+            'tools/neural-network/nn-batch-engine.js',
+            'tools/neural-network/rnn-engine.js',
+            'tools/neural-network/lstm-engine.js',
+            'tools/neural-network/tensor-kernels.js',
+            'tools/neural-network/transformer-engine.js',
+            'tools/neural-network/cnn-engine.js'
+        ],
+        exports: [
+            'NeuralNetwork', 'BatchEngine', 'RecurrentNeuralNetwork', 'RNNDatasets',
+            'LSTMNetwork', 'Tensor', 'TensorKernels', 'TransformerNetwork',
+            'TransformerDatasets', 'CNNNetwork', 'CNNDatasets'
+        ]
+    },
+    quantum: {
+        scripts: [
+            'tools/quantum-circuits/statevector-backend.js',
+            'tools/quantum-circuits/quantum-simulator.js'
+        ],
+        exports: ['StateVectorBackend', 'QuantumSimulator']
+    },
+    spectral: {
+        scripts: ['tools/spectral-graph/spectral-engine.js'],
+        exports: ['SpectralEngine']
+    },
+    ml: {
+        scripts: [
+            'tools/ml-algorithms/js/spatial-index.js',
+            'tools/ml-algorithms/js/ml-core.js'
+        ],
+        exports: ['KDTree', 'rasterizeRegions', 'MLCore']
+    },
+    probability: {
+        scripts: ['tools/probability/distributions.js'],
+        exports: ['normalSample', 'gammaSample', 'DISTRIBUTIONS']
+    },
+    triangles: {
+        scripts: ['tools/combinatorics-triangles/triangle-engine.js'],
+        exports: ['TRIANGLES', 'generateTriangle', 'getAllTriangleIds']
+    },
+    neuroscience: {
+        scripts: ['All in one lab/renderer/tabs/neuroscience/hh-solver.js'],
+        exports: ['HHSolver']
+    }
+};
+
+// Small deterministic PRNG so every run benchmarks the same workloads
+function mulberry32(seed) {
+    let a = seed >>> 0;
+    return () => {
+        a = (a + 0x6D2B79F5) >>> 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * Load a list of scripts (paths relative to the repo root) into one fresh
+ * context. Top-level classes and consts stay visible across scripts, as they
+ * do between <script> tags on a page.
+ */
+function loadScripts(scripts, options = {}) {
+    const context = vm.createContext({ console, performance });
+    context.window = context;
+    context.self = context;
+    if (options.seed !== undefined) {
+        vm.runInContext('Math', context).random = mulberry32(options.seed);
+    }
+
+    for (const script of scripts) {
+        const file = path.join(ROOT, script);
+        vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+    }
+    return context;
+}
+
+/**
+ * Load an engine group by name and return its exported globals, e.g.
+ *   const { QuantumSimulator, random } = loadEngine('quantum');
+ * options: { seed } - seeds Math.random inside the engine context
+ */
+function loadEngine(name, options = {}) {
+    const engine = ENGINES[name];
+    if (!engine) {
+        throw new Error(`Unknown engine "${name}" (expected one of: ${Object.keys(ENGINES).join(', ')})`);
+    }
+
+    const context = loadScripts(engine.scripts, options);
+    // `random` is the context's Math.random, so workload data follows the seed too
+    const api = { context, random: vm.runInContext('Math.random', context) };
+    for (const symbol of engine.exports) {
+        // Lexical bindings (const/class) are not properties of the global object
+        api[symbol] = vm.runInContext(symbol, context);
+    }
+    return api;
+}
+
+module.exports = { ENGINES, ROOT, loadEngine, loadScripts, mulberry32 };
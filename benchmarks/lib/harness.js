@@ -0,0 +1,206 @@
+/**
+ * Benchmark Harness
+ * Times one workload at a time and reports:
+ *   - ops/sec: median over several samples, each sized to a time budget
+ *   - spread: median absolute deviation of the samples, as a % of the median
+ *   - alloc/op: heap + external (ArrayBuffer) bytes allocated per call, i.e.
+ *     the heap delta plus everything GCs reclaimed inside the window
+ *   - heap growth: memory still retained after the timed run (leaks, caches)
+ *   - GC count and pause time during the timed run
+ * plus a log-log fit of time/op against workload size (the scaling exponent)
+ * and a comparison against stored JSON baselines.
+ */
+
+const os = require('os');
+const v8 = require('v8');
+const vm = require('vm');
+
+// Forced GC keeps memory figures comparable between cases
+v8.setFlagsFromString('--expose-gc');
+const gc = global.gc || vm.runInNewContext('gc');
+
+const MIN_WARMUP_CALLS = 3;
+const ALLOC_WINDOW_NS = 50e6;
+const ALLOC_WINDOW_MAX_CALLS = 1000;
+
+// Second pass picks up objects released by finalizers during the first
+function collect() {
+    gc();
+    gc();
+}
+
+function memoryInUse() {
+    const stats = v8.getHeapStatistics();
+    return stats.used_heap_size + stats.external_memory;
+}
+
+const usedBytes = (snapshot) => snapshot.heapStatistics.usedHeapSize + snapshot.heapStatistics.externalMemory;
+
+// Run `body` under a GCProfiler and total what the collections did
+function profileGC(body) {
+    const profiler = new v8.GCProfiler();
+    profiler.start();
+    body();
+    const { statistics } = profiler.stop();
+
+    let freed = 0;
+    let cost = 0;
+    for (const entry of statistics) {
+        freed += usedBytes(entry.beforeGC) - usedBytes(entry.afterGC);
+        cost += entry.cost;
+    }
+    return { count: statistics.length, ms: cost / 1000, freedBytes: freed };
+}
+
+function now() {
+    return Number(process.hrtime.bigint());
+}
+
+function median(values) {
+    const sorted = [...values].sort((a, b) => a - b);
+    const mid = sorted.length >> 1;
+    return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+// Call `fn` `count` times and return elapsed nanoseconds
+function timeCalls(fn, count) {
+    const start = now();
+    for (let i = 0; i < count; i++) fn();
+    return now() - start;
+}
+
+function measureAllocation(fn, nsPerCall) {
+    const calls = Math.max(1, Math.min(Math.ceil(ALLOC_WINDOW_NS / nsPerCall), ALLOC_WINDOW_MAX_CALLS));
+
+    collect();
+    const before = memoryInUse();
+    const gcStats = profileGC(() => {
+        for (let i = 0; i < calls; i++) fn();
+    });
+    const allocated = memoryInUse() - before + gcStats.freedBytes;
+    return Math.max(0, allocated / calls);
+}
+
+/**
+ * Measure one workload. `fn` is a zero-argument closure that performs one op.
+ * options: { minTime (ms across all samples), samples, warmup (ms) }
+ */
+function measure(fn, options = {}) {
+    const minTime = (options.minTime || 400) * 1e6;
+    const sampleCount = options.samples || 7;
+    const warmup = (options.warmup !== undefined ? options.warmup : minTime / 4e6) * 1e6;
+
+    // Warm up (JIT, workspace caches) and estimate the cost of one call
+    let calls = 0;
+    let elapsed = 0;
+    while (elapsed < warmup || calls < MIN_WARMUP_CALLS) {
+        elapsed += timeCalls(fn, 1);
+        calls++;
+    }
+    const estimate = elapsed / calls;
+
+    const allocBytesPerOp = measureAllocation(fn, estimate);
+
+    const perSample = Math.max(1, Math.round(minTime / sampleCount / estimate));
+    const nsPerOp = [];
+    collect();
+    const heapBefore = memoryInUse();
+    const gcStats = profileGC(() => {
+        for (let s = 0; s < sampleCount; s++) {
+            nsPerOp.push(timeCalls(fn, perSample) / perSample);
+        }
+    });
+    collect();
+    const heapGrowth = memoryInUse() - heapBefore;
+
+    const mid = median(nsPerOp);
+    const mad = median(nsPerOp.map(t => Math.abs(t - mid)));
+
+    return {
+        opsPerSec: 1e9 / mid,
+        nsPerOp: mid,
+        spread: mid > 0 ? mad / mid : 0,
+        samples: sampleCount,
+        callsPerSample: perSample,
+        allocBytesPerOp,
+        heapGrowthBytes: heapGrowth,
+        gcCount: gcStats.count,
+        gcMs: gcStats.ms
+    };
+}
+
+/**
+ * Least-squares slope of log(ns/op) against log(size): ~1 is linear, ~2
+ * quadratic. Needs at least two distinct positive sizes.
+ */
+function scalingExponent(points) {
+    const usable = points.filter(p => p.size > 0 && p.nsPerOp > 0);
+    if (usable.length < 2) return null;
+
+    const xs = usable.map(p => Math.log(p.size));
+    const ys = usable.map(p => Math.log(p.nsPerOp));
+    const mx = xs.reduce((a, b) => a + b, 0) / xs.length;
+    const my = ys.reduce((a, b) => a + b, 0) / ys.length;
+    let sxy = 0, sxx = 0;
+    for (let i = 0; i < xs.length; i++) {
+        sxy += (xs[i] - mx) * (ys[i] - my);
+        sxx += (xs[i] - mx) * (xs[i] - mx);
+    }
+    return sxx > 0 ? sxy / sxx : null;
+}
+
+// Allocation changes below this many bytes/op are treated as noise
+const ALLOC_NOISE_BYTES = 1024;
+
+/**
+ * Compare results against a baseline. Throughput drops (or allocation
+ * growth) beyond `threshold` (a fraction, e.g. 0.2) are regressions.
+ */
+function compareToBaseline(results, baseline, threshold) {
+    const regressions = [];
+    const improvements = [];
+    const missing = [];
+
+    for (const [key, current] of Object.entries(results)) {
+        const base = baseline.results[key];
+        if (!base) {
+            missing.push(key);
+            continue;
+        }
+
+        const speed = current.opsPerSec / base.opsPerSec;
+        // Noisy cases get extra headroom so jitter is not reported as a change
+        const tolerance = threshold + Math.max(current.spread, base.spread || 0);
+
+        if (speed < 1 - tolerance) {
+            regressions.push({ key, metric: 'opsPerSec', baseline: base.opsPerSec, current: current.opsPerSec, ratio: speed });
+        } else if (speed > 1 + tolerance) {
+            improvements.push({ key, metric: 'opsPerSec', baseline: base.opsPerSec, current: current.opsPerSec, ratio: speed });
+        }
+
+        const allocGrowth = current.allocBytesPerOp - base.allocBytesPerOp;
+        if (allocGrowth > ALLOC_NOISE_BYTES && current.allocBytesPerOp > base.allocBytesPerOp * (1 + threshold)) {
+            regressions.push({
+                key,
+                metric: 'allocBytesPerOp',
+                baseline: base.allocBytesPerOp,
+                current: current.allocBytesPerOp,
+                ratio: current.allocBytesPerOp / Math.max(base.allocBytesPerOp, 1)
+            });
+        }
+    }
+
+    return { regressions, improvements, missing };
+}
+
+function environment() {
+    const cpus = os.cpus();
+    return {
+        node: process.version,
+        platform: `${process.platform}-${process.arch}`,
+        cpu: cpus.length ? cpus[0].model.trim() : 'unknown',
+        cores: cpus.length
+    };
+}
+
+module.exports = { measure, scalingExponent, compareToBaseline, environment, median };
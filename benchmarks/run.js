@@ -0,0 +1,334 @@
+#!/usr/bin/env node
+/**
+ * Engine Benchmark Runner
+ *
+ *   node benchmarks/run.js [filter...] [options]
+ *
+ * filter            only run benchmarks whose name contains one of these (e.g. nn. ml.dbscan)
+ * --quick           smaller parameter sets and shorter samples (smoke run)
+ * --list            print the available benchmarks and exit
+ * --min-time <ms>   timed budget per case, split across samples (default 400, quick 120)
+ * --samples <n>     timed samples per case (default 7, quick 5)
+ * --trials <n>      runs per case, each in its own Node process (default 3, quick 1)
+ * --seed <n>        Math.random seed inside the engine contexts (default 1)
+ * --baseline <file> baseline JSON to compare against (default baselines/baseline.json)
+ * --threshold <f>   fractional change treated as a regression (default 0.25)
+ * --save-baseline   merge this run's results into the baseline file
+ * --json <file>     also write the full report as JSON
+ *
+ * Exits with status 1 when a compared case regressed.
+ *
+ * Correctness checks for the same engines live in checks/:
+ *   node --test benchmarks/checks/
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { spawnSync } = require('child_process');
+const { loadEngine } = require('./lib/engine-loader');
+const { measure, scalingExponent, compareToBaseline, environment, median } = require('./lib/harness');
+
+const SUITES = ['neural', 'quantum', 'spectral', 'ml', 'probability', 'triangles', 'neuroscience'];
+const DEFAULT_BASELINE = path.join(__dirname, 'baselines', 'baseline.json');
+
+function parseArgs(argv) {
+    const args = {
+        filters: [],
+        quick: false,
+        list: false,
+        minTime: null,
+        samples: null,
+        trials: null,
+        seed: 1,
+        baseline: DEFAULT_BASELINE,
+        threshold: 0.25,
+        saveBaseline: false,
+        json: null,
+        child: null
+    };
+
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        const value = () => {
+            if (i + 1 >= argv.length) throw new Error(`${arg} needs a value`);
+            return argv[++i];
+        };
+
+        switch (arg) {
+            case '--quick': args.quick = true; break;
+            case '--list': args.list = true; break;
+            case '--min-time': args.minTime = parseFloat(value()); break;
+            case '--samples': args.samples = parseInt(value(), 10); break;
+            case '--trials': args.trials = parseInt(value(), 10); break;
+            case '--seed': args.seed = parseInt(value(), 10); break;
+            case '--baseline': args.baseline = path.resolve(value()); break;
+            case '--threshold': args.threshold = parseFloat(value()); break;
+            case '--save-baseline': args.saveBaseline = true; break;
+            case '--json': args.json = path.resolve(value()); break;
+            // Internal: measure a single case and print the result as JSON
+            case '--child': args.child = { name: value(), value: JSON.parse(value()) }; break;
+            default:
+                if (arg.startsWith('--')) throw new Error(`Unknown option ${arg}`);
+                args.filters.push(arg);
+        }
+    }
+
+    if (args.minTime === null) args.minTime = args.quick ? 120 : 400;
+    if (args.samples === null) args.samples = args.quick ? 5 : 7;
+    if (args.trials === null) args.trials = args.quick ? 1 : 3;
+    return args;
+}
+
+function loadBenchmarks(filters) {
+    const all = [];
+    for (const suite of SUITES) {
+        all.push(...require(`./suites/${suite}`));
+    }
+    return filters.length ? all.filter(b => filters.some(f => b.name.includes(f))) : all;
+}
+
+// ==================== FORMATTING ====================
+
+function formatOps(ops) {
+    if (ops >= 1e6) return `${(ops / 1e6).toFixed(2)}M`;
+    if (ops >= 1e3) return `${(ops / 1e3).toFixed(2)}k`;
+    return ops >= 10 ? ops.toFixed(1) : ops.toFixed(3);
+}
+
+function formatTime(ns) {
+    if (ns >= 1e9) return `${(ns / 1e9).toFixed(2)} s`;
+    if (ns >= 1e6) return `${(ns / 1e6).toFixed(2)} ms`;
+    if (ns >= 1e3) return `${(ns / 1e3).toFixed(2)} µs`;
+    return `${ns.toFixed(0)} ns`;
+}
+
+function formatBytes(bytes) {
+    const sign = bytes < 0 ? '-' : '';
+    const abs = Math.abs(bytes);
+    if (abs >= 1 << 20) return `${sign}${(abs / (1 << 20)).toFixed(1)} MB`;
+    if (abs >= 1 << 10) return `${sign}${(abs / (1 << 10)).toFixed(1)} KB`;
+    return `${sign}${Math.round(abs)} B`;
+}
+
+function formatChange(ratio) {
+    const pct = (ratio - 1) * 100;
+    return `${pct >= 0 ? '+' : ''}${pct.toFixed(1)}%`;
+}
+
+const COLUMNS = [
+    ['ops/sec', 11], ['±', 7], ['time/op', 11], ['alloc/op', 10], ['heap Δ', 10], ['GC n/ms', 11], ['vs base', 9]
+];
+
+function row(cells, firstWidth) {
+    return '  ' + cells.map((cell, i) => i === 0 ? String(cell).padEnd(firstWidth) : String(cell).padStart(COLUMNS[i - 1][1])).join(' ');
+}
+
+// ==================== RUN ====================
+
+const caseKey = (bench, value) => `${bench.name}[${bench.param}=${value}]`;
+
+/**
+ * Measure one case in a fresh Node process. Speed depends on where V8 lays
+ * out code and data, which is fixed per process: the same case can land
+ * ~20-40% apart in two processes while trials inside one process agree.
+ * Separate processes sample that variation instead of repeating one draw.
+ */
+function runTrial(bench, value, args) {
+    const child = spawnSync(process.execPath, [
+        __filename,
+        '--child', bench.name, JSON.stringify(value),
+        '--min-time', String(args.minTime),
+        '--samples', String(args.samples),
+        '--seed', String(args.seed)
+    ], { encoding: 'utf8', maxBuffer: 16 * 1024 * 1024 });
+
+    if (child.status !== 0) {
+        throw new Error(`${caseKey(bench, value)} failed:\n${child.stderr || child.error}`);
+    }
+    return JSON.parse(child.stdout);
+}
+
+// Median trial by throughput; the spread also covers disagreement between trials
+function combineTrials(trials) {
+    const sorted = [...trials].sort((a, b) => a.opsPerSec - b.opsPerSec);
+    const mid = sorted[(sorted.length - 1) >> 1];
+    const ops = trials.map(trial => trial.opsPerSec);
+    const trialSpread = median(ops.map(o => Math.abs(o - mid.opsPerSec))) / mid.opsPerSec;
+
+    return {
+        ...mid,
+        spread: Math.max(mid.spread, trialSpread),
+        trialOpsPerSec: ops
+    };
+}
+
+function runChild(args) {
+    const bench = loadBenchmarks([]).find(b => b.name === args.child.name);
+    if (!bench) throw new Error(`Unknown benchmark ${args.child.name}`);
+
+    const api = loadEngine(bench.engine, { seed: args.seed });
+    const fn = bench.setup(api, args.child.value);
+    process.stdout.write(JSON.stringify(measure(fn, { minTime: args.minTime, samples: args.samples })));
+    return 0;
+}
+
+function runBenchmark(bench, args, baseline) {
+    const values = args.quick && bench.quick ? bench.quick : bench.values;
+    const firstWidth = Math.max(bench.param.length, ...values.map(v => String(v).length)) + 2;
+
+    console.log(`\n${bench.name} - ${bench.description}`);
+    console.log(row([bench.param, ...COLUMNS.map(c => c[0])], firstWidth));
+
+    const results = {};
+    const curve = [];
+    for (const value of values) {
+        const trials = [];
+        for (let t = 0; t < args.trials; t++) trials.push(runTrial(bench, value, args));
+        const result = combineTrials(trials);
+
+        const key = caseKey(bench, value);
+        results[key] = {
+            benchmark: bench.name,
+            param: bench.param,
+            value,
+            ...result
+        };
+
+        const base = baseline && Boolean(baseline.options.quick) === args.quick && baseline.results[key];
+        const sizeOf = bench.size === undefined ? (v => v) : bench.size;
+        if (sizeOf) curve.push({ value, size: sizeOf(value), nsPerOp: result.nsPerOp });
+
+        console.log(row([
+            value,
+            formatOps(result.opsPerSec),
+            `${(result.spread * 100).toFixed(1)}%`,
+            formatTime(result.nsPerOp),
+            formatBytes(result.allocBytesPerOp),
+            formatBytes(result.heapGrowthBytes),
+            `${result.gcCount}/${result.gcMs.toFixed(1)}`,
+            base ? formatChange(result.opsPerSec / base.opsPerSec) : '-'
+        ], firstWidth));
+    }
+
+    const exponent = scalingExponent(curve);
+    if (exponent !== null) {
+        const unit = bench.size ? 'workload size' : bench.param;
+        console.log(`  scaling: time/op ~ ${unit}^${exponent.toFixed(2)}`);
+    }
+
+    return { results, scaling: { benchmark: bench.name, param: bench.param, exponent, curve } };
+}
+
+function readBaseline(file) {
+    if (!fs.existsSync(file)) return null;
+    return JSON.parse(fs.readFileSync(file, 'utf8'));
+}
+
+function reportComparison(comparison, threshold) {
+    const describe = (entry) => entry.metric === 'opsPerSec'
+        ? `${formatOps(entry.baseline)} -> ${formatOps(entry.current)} ops/sec (${formatChange(entry.ratio)})`
+        : `${formatBytes(entry.baseline)} -> ${formatBytes(entry.current)} alloc/op (${formatChange(entry.ratio)})`;
+
+    console.log(`\nBaseline comparison (threshold ${(threshold * 100).toFixed(0)}% + measured spread):`);
+    if (comparison.improvements.length) {
+        console.log('  faster:');
+        for (const entry of comparison.improvements) console.log(`    ${entry.key}: ${describe(entry)}`);
+    }
+    if (comparison.regressions.length) {
+        console.log('  REGRESSIONS:');
+        for (const entry of comparison.regressions) console.log(`    ${entry.key}: ${describe(entry)}`);
+    } else {
+        console.log('  no regressions');
+    }
+    if (comparison.missing.length) {
+        console.log(`  ${comparison.missing.length} case(s) not in baseline (run with --save-baseline to add them)`);
+    }
+}
+
+function main() {
+    const args = parseArgs(process.argv.slice(2));
+    if (args.child) return runChild(args);
+
+    const benchmarks = loadBenchmarks(args.filters);
+
+    if (args.list) {
+        for (const bench of benchmarks) {
+            console.log(`${bench.name.padEnd(28)} ${bench.param}=${bench.values.join(',')}  ${bench.description}`);
+        }
+        return 0;
+    }
+    if (!benchmarks.length) {
+        console.error(`No benchmarks match: ${args.filters.join(' ')}`);
+        return 1;
+    }
+
+    const env = environment();
+    const baseline = readBaseline(args.baseline);
+    console.log(`Node ${env.node} on ${env.platform}, ${env.cpu} (${env.cores} cores)`);
+    if (baseline) {
+        const same = baseline.environment.node === env.node && baseline.environment.cpu === env.cpu;
+        console.log(`Baseline: ${path.relative(process.cwd(), args.baseline)} (${baseline.created})` +
+            (same ? '' : ` - recorded on Node ${baseline.environment.node}, ${baseline.environment.cpu}; expect drift`));
+    } else {
+        console.log('No baseline found; run with --save-baseline to record one');
+    }
+
+    const results = {};
+    const scaling = [];
+    for (const bench of benchmarks) {
+        const run = runBenchmark(bench, args, baseline);
+        Object.assign(results, run.results);
+        scaling.push(run.scaling);
+    }
+
+    // Quick runs warm up for less time, so their figures are not comparable
+    // with a full baseline (and vice versa)
+    const comparable = baseline && Boolean(baseline.options.quick) === args.quick;
+    if (baseline && !comparable) {
+        console.log(`\nSkipping baseline comparison: baseline was recorded ${baseline.options.quick ? 'with' : 'without'} --quick`);
+    }
+
+    let comparison = null;
+    if (comparable) {
+        comparison = compareToBaseline(results, baseline, args.threshold);
+        reportComparison(comparison, args.threshold);
+    }
+
+    const report = {
+        created: new Date().toISOString(),
+        environment: env,
+        options: { quick: args.quick, minTime: args.minTime, samples: args.samples, trials: args.trials, seed: args.seed },
+        results,
+        scaling,
+        comparison
+    };
+
+    if (args.json) {
+        fs.writeFileSync(args.json, JSON.stringify(report, null, 2) + '\n');
+        console.log(`\nReport written to ${path.relative(process.cwd(), args.json)}`);
+    }
+
+    if (args.saveBaseline) {
+        // Merge so a filtered run only refreshes the cases it measured; a
+        // run in the other mode replaces the file rather than mixing modes
+        const merged = {
+            created: report.created,
+            environment: env,
+            options: report.options,
+            results: { ...(comparable ? baseline.results : {}), ...results }
+        };
+        fs.mkdirSync(path.dirname(args.baseline), { recursive: true });
+        fs.writeFileSync(args.baseline, JSON.stringify(merged, null, 2) + '\n');
+        console.log(`Baseline saved to ${path.relative(process.cwd(), args.baseline)}`);
+        return 0;
+    }
+
+    return comparison && comparison.regressions.length ? 1 : 0;
+}
+
+try {
+    process.exitCode = main();
+} catch (err) {
+    console.error(err.stack || err.message);
+    process.exitCode = 1;
+}
@@ -0,0 +1,68 @@
+/**
+ * ml-algorithms loops the explorer pages run: MLCore k-means and DBSCAN
+ * (kmeans-explorer.html, dbscan-explorer.html) and the KDTree behind them and
+ * knn-explorer.html.
+ */
+
+// Gaussian blobs around `centers` random centres in [-1, 1]^2
+function blobs(random, n, centers = 5) {
+    const means = [];
+    for (let c = 0; c < centers; c++) {
+        means.push({ x: random() * 1.6 - 0.8, y: random() * 1.6 - 0.8 });
+    }
+
+    const data = [];
+    for (let i = 0; i < n; i++) {
+        const c = i % centers;
+        const r = Math.sqrt(-2 * Math.log(1 - random())) * 0.12;
+        const a = random() * 2 * Math.PI;
+        data.push({ x: means[c].x + r * Math.cos(a), y: means[c].y + r * Math.sin(a) });
+    }
+    return data;
+}
+
+module.exports = [
+    {
+        name: 'ml.kmeans-step',
+        engine: 'ml',
+        description: 'MLCore.kmeansStep, one Lloyd iteration with k = 5',
+        param: 'points',
+        values: [1000, 10000, 100000],
+        quick: [1000, 10000],
+        setup({ MLCore, random }, n) {
+            const data = blobs(random, n);
+            const centroids = data.slice(0, 5).map(p => ({ x: p.x, y: p.y }));
+            const assignments = new Array(n).fill(-1);
+            return () => MLCore.kmeansStep(data, centroids, assignments);
+        }
+    },
+    {
+        name: 'ml.dbscan',
+        engine: 'ml',
+        description: 'MLCore.dbscan (KDTree region queries), eps = 0.05, minPts = 5',
+        param: 'points',
+        values: [500, 2000, 8000],
+        quick: [500, 2000],
+        setup({ MLCore, random }, n) {
+            const data = blobs(random, n);
+            return () => MLCore.dbscan(data, 0.05, 5);
+        }
+    },
+    {
+        name: 'ml.kdtree-knn',
+        engine: 'ml',
+        description: 'KDTree build + 256 five-nearest queries',
+        param: 'points',
+        values: [1000, 10000, 100000],
+        quick: [1000, 10000],
+        setup({ KDTree, random }, n) {
+            const data = blobs(random, n);
+            const queries = blobs(random, 256);
+            return () => {
+                const tree = new KDTree(data);
+                for (const q of queries) tree.nearest(q.x, q.y, 5);
+                return tree;
+            };
+        }
+    }
+];
@@ -0,0 +1,129 @@
+/**
+ * Neural network engines: MLP (per-sample and mini-batch), RNN, LSTM, CNN,
+ * Transformer and the shared tensor matmul kernel.
+ */
+
+function regressionData(random, count) {
+    const inputs = [];
+    const targets = [];
+    for (let i = 0; i < count; i++) {
+        const x = random() * 2 - 1;
+        const y = random() * 2 - 1;
+        inputs.push([x, y]);
+        targets.push([Math.sin(3 * x) * Math.cos(2 * y)]);
+    }
+    return { inputs, targets };
+}
+
+function randomImage(random, size) {
+    const img = [];
+    for (let y = 0; y < size; y++) {
+        const row = [];
+        for (let x = 0; x < size; x++) row.push(random());
+        img.push(row);
+    }
+    return img;
+}
+
+module.exports = [
+    {
+        name: 'nn.train-epoch',
+        engine: 'neural',
+        description: 'NeuralNetwork.train, per-sample Adam over 64 points, layers [2, w, w, 1]',
+        param: 'width',
+        values: [8, 32, 128],
+        quick: [8, 32],
+        size: w => w * w,
+        setup({ NeuralNetwork, random }, width) {
+            const net = new NeuralNetwork([2, width, width, 1], 'tanh', 'adam', 0.01);
+            const { inputs, targets } = regressionData(random, 64);
+            return () => net.train(inputs, targets);
+        }
+    },
+    {
+        name: 'nn.batch-epoch',
+        engine: 'neural',
+        description: 'NeuralNetwork.train through BatchEngine (batch 32) over 256 points, layers [2, w, w, 1]',
+        param: 'width',
+        values: [8, 32, 128],
+        quick: [8, 32],
+        size: w => w * w,
+        setup({ NeuralNetwork, random }, width) {
+            const net = new NeuralNetwork([2, width, width, 1], 'tanh', 'adam', 0.01);
+            net.setBatchSize(32);
+            const { inputs, targets } = regressionData(random, 256);
+            return () => net.train(inputs, targets);
+        }
+    },
+    {
+        name: 'rnn.train-step',
+        engine: 'neural',
+        description: 'RecurrentNeuralNetwork.trainStep on one 20-step sine sequence',
+        param: 'hidden',
+        values: [8, 32, 64],
+        quick: [8, 32],
+        size: h => h * h,
+        setup({ RecurrentNeuralNetwork, RNNDatasets }, hidden) {
+            const net = new RecurrentNeuralNetwork(1, hidden, 1);
+            const { sequences, targets } = RNNDatasets.sineWave(20, 1);
+            return () => net.trainStep(sequences[0], targets[0]);
+        }
+    },
+    {
+        name: 'lstm.train-step',
+        engine: 'neural',
+        description: 'LSTMNetwork.trainStep on one 20-step sine sequence',
+        param: 'hidden',
+        values: [8, 32, 64],
+        quick: [8, 32],
+        size: h => h * h,
+        setup({ LSTMNetwork, RNNDatasets }, hidden) {
+            const net = new LSTMNetwork(1, hidden, 1);
+            const { sequences, targets } = RNNDatasets.sineWave(20, 1);
+            return () => net.trainStep(sequences[0], targets[0]);
+        }
+    },
+    {
+        name: 'cnn.train-step',
+        engine: 'neural',
+        description: 'CNNNetwork.trainStep (conv 3x3 -> ReLU -> max-pool -> dense) on one image',
+        param: 'image',
+        values: [8, 16, 32, 64],
+        quick: [8, 16],
+        size: s => s * s,
+        setup({ CNNNetwork, random }, size) {
+            const net = new CNNNetwork(size, 4);
+            const image = randomImage(random, size);
+            return () => net.trainStep(image, 2);
+        }
+    },
+    {
+        name: 'transformer.train-step',
+        engine: 'neural',
+        description: 'TransformerNetwork.trainStep on one 10-token copy sequence',
+        param: 'embed',
+        values: [8, 16, 32, 64],
+        quick: [8, 16],
+        size: e => e * e,
+        setup({ TransformerNetwork, TransformerDatasets }, embedDim) {
+            const net = new TransformerNetwork(1, embedDim, 1);
+            const { sequences, targets } = TransformerDatasets.copy(10, 1);
+            return () => net.trainStep(sequences[0], targets[0]);
+        }
+    },
+    {
+        name: 'tensor.matmul',
+        engine: 'neural',
+        description: 'TensorKernels.matmul, square n x n product',
+        param: 'n',
+        values: [32, 64, 128, 256],
+        quick: [32, 64],
+        size: n => n * n * n,
+        setup({ Tensor, TensorKernels }, n) {
+            const A = Tensor.random([n, n], 1);
+            const B = Tensor.random([n, n], 1);
+            const C = new Tensor([n, n]);
+            return () => TensorKernels.matmul(A, B, C);
+        }
+    }
+];
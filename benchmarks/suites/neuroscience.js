@@ -0,0 +1,31 @@
+/**
+ * Hodgkin-Huxley solver (All in one lab neuroscience tab).
+ */
+
+module.exports = [
+    {
+        name: 'hh.simulate-rk45',
+        engine: 'neuroscience',
+        description: 'HHSolver.simulate, adaptive RK45, default 50 ms protocol',
+        param: 'current',
+        values: [0, 10, 40],
+        quick: [10],
+        size: null,
+        setup({ HHSolver }, current) {
+            return () => HHSolver.simulate({ current }, { method: 'rk45' });
+        }
+    },
+    {
+        name: 'hh.sweep',
+        engine: 'neuroscience',
+        description: 'HHSolver.sweep, exponential Euler lanes over current x 2 temperatures',
+        param: 'lanes',
+        values: [8, 32, 128],
+        quick: [8, 32],
+        setup({ HHSolver }, lanes) {
+            const perCurve = lanes / 2;
+            const current = Array.from({ length: perCurve }, (_, i) => 2 + 48 * i / Math.max(1, perCurve - 1));
+            return () => HHSolver.sweep({ current, temperature: [6.3, 16.3] });
+        }
+    }
+];
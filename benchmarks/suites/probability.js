@@ -0,0 +1,41 @@
+/**
+ * Probability samplers from tools/probability/distributions.js.
+ */
+
+const BATCH = 10000;
+
+module.exports = [
+    {
+        name: 'probability.normal-sample',
+        engine: 'probability',
+        description: 'normalSample (Box-Muller) into a Float64Array batch',
+        param: 'batch',
+        values: [1000, 10000, 100000],
+        quick: [1000, 10000],
+        setup({ normalSample }, batch) {
+            const out = new Float64Array(batch);
+            return () => {
+                for (let i = 0; i < batch; i++) out[i] = normalSample();
+                return out;
+            };
+        }
+    },
+    {
+        // Shape changes the rejection rate (and adds a boost step below 1),
+        // not the amount of work per batch, so there is no scaling curve
+        name: 'probability.gamma-sample',
+        engine: 'probability',
+        description: `gammaSample (Marsaglia-Tsang), batch of ${BATCH}`,
+        param: 'shape',
+        values: [0.5, 2, 10],
+        quick: [0.5, 2],
+        size: null,
+        setup({ gammaSample }, shape) {
+            const out = new Float64Array(BATCH);
+            return () => {
+                for (let i = 0; i < BATCH; i++) out[i] = gammaSample(shape);
+                return out;
+            };
+        }
+    }
+];
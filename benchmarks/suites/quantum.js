@@ -0,0 +1,54 @@
+/**
+ * QuantumSimulator gate application. Below TYPED_BACKEND_MIN_QUBITS the
+ * simulator uses {re, im} objects, above it the Float64Array backend.
+ */
+
+// Two entangling layers: H on every qubit, a CNOT ladder, then T on every qubit
+function layeredCircuit(qubits) {
+    const circuit = [];
+    for (let layer = 0; layer < 2; layer++) {
+        for (let q = 0; q < qubits; q++) circuit.push({ type: 'H', qubit: q });
+        for (let q = 0; q + 1 < qubits; q++) circuit.push({ type: 'CNOT', control: q, target: q + 1 });
+        for (let q = 0; q < qubits; q++) circuit.push({ type: 'T', qubit: q });
+    }
+    return circuit;
+}
+
+function runCircuit(sim, circuit) {
+    sim.reset();
+    for (const gate of circuit) sim.applyGate(gate);
+    if (sim.backend) sim.backend.flushAll();
+}
+
+module.exports = [
+    {
+        name: 'quantum.layers',
+        engine: 'quantum',
+        description: 'Reset + two layers of H / CNOT ladder / T on every qubit',
+        param: 'qubits',
+        values: [4, 8, 12, 16],
+        quick: [4, 8, 12],
+        size: n => n * Math.pow(2, n),
+        setup({ QuantumSimulator }, qubits) {
+            const sim = new QuantumSimulator(qubits);
+            const circuit = layeredCircuit(qubits);
+            return () => runCircuit(sim, circuit);
+        }
+    },
+    {
+        name: 'quantum.qft',
+        engine: 'quantum',
+        description: 'Reset + H on every qubit + full QFT',
+        param: 'qubits',
+        values: [4, 8, 12],
+        quick: [4, 8],
+        size: n => n * n * Math.pow(2, n),
+        setup({ QuantumSimulator }, qubits) {
+            const sim = new QuantumSimulator(qubits);
+            const circuit = [];
+            for (let q = 0; q < qubits; q++) circuit.push({ type: 'H', qubit: q });
+            circuit.push({ type: 'QFT' });
+            return () => runCircuit(sim, circuit);
+        }
+    }
+];
@@ -0,0 +1,54 @@
+/**
+ * SpectralEngine Laplacian eigensolvers: dense Jacobi for small graphs,
+ * sparse Lanczos at and above SPARSE_MIN_NODES.
+ */
+
+// Ring plus `chords` random edges per node: connected, sparse, irregular
+function sparseGraph(random, n, chords) {
+    const A = Array(n).fill(0).map(() => Array(n).fill(0));
+    for (let i = 0; i < n; i++) {
+        A[i][(i + 1) % n] = A[(i + 1) % n][i] = 1;
+        for (let c = 0; c < chords; c++) {
+            const j = Math.floor(random() * n);
+            if (j !== i) A[i][j] = A[j][i] = 1;
+        }
+    }
+    return A;
+}
+
+module.exports = [
+    {
+        name: 'spectral.dense',
+        engine: 'spectral',
+        description: 'setAdjacencyMatrix + full eigendecomposition (Jacobi), random graph density 0.2',
+        param: 'nodes',
+        values: [20, 40, 80],
+        quick: [20, 40],
+        size: n => n * n * n,
+        setup({ SpectralEngine }, nodes) {
+            const engine = new SpectralEngine();
+            const A = SpectralEngine.createRandomGraph(nodes, 0.2);
+            return () => {
+                engine.setAdjacencyMatrix(A);
+                return engine.computeEigendecomposition();
+            };
+        }
+    },
+    {
+        name: 'spectral.lanczos',
+        engine: 'spectral',
+        description: 'setAdjacencyMatrix + smallest SPARSE_EIGENPAIRS (Lanczos), ring + 2 chords/node',
+        param: 'nodes',
+        values: [200, 400, 800],
+        quick: [200, 400],
+        size: n => n,
+        setup({ SpectralEngine, random }, nodes) {
+            const engine = new SpectralEngine();
+            const A = sparseGraph(random, nodes, 2);
+            return () => {
+                engine.setAdjacencyMatrix(A);
+                return engine.computeEigendecomposition();
+            };
+        }
+    }
+];
@@ -0,0 +1,31 @@
+/**
+ * Combinatorics triangle generators (triangle-engine.js).
+ */
+
+module.exports = [
+    {
+        name: 'triangles.pascal',
+        engine: 'triangles',
+        description: "generateTriangle('pascal', rows)",
+        param: 'rows',
+        values: [50, 200, 800],
+        quick: [50, 200],
+        size: r => r * r,
+        setup({ generateTriangle }, rows) {
+            return () => generateTriangle('pascal', rows);
+        }
+    },
+    {
+        name: 'triangles.all',
+        engine: 'triangles',
+        description: 'generateTriangle for every registered triangle',
+        param: 'rows',
+        values: [10, 20, 40],
+        quick: [10, 20],
+        size: r => r * r,
+        setup({ generateTriangle, getAllTriangleIds }, rows) {
+            const ids = getAllTriangleIds();
+            return () => ids.map(id => generateTriangle(id, rows));
+        }
+    }
+];
@@ -189,6 +189,14 @@ const CATEGORIES = {
                 path: 'tools/ml-algorithms/knn.html',
                 category: 'Supervised Learning'
             },
+            {
+                id: 'knn-map',
+                name: 'kNN Decision Map',
+                icon: '🗺️',
+                description: 'Full-resolution decision map over up to 20,000 points, with k-d tree neighbor search.',
+                path: 'tools/ml-algorithms/knn-explorer.html',
+                category: 'Supervised Learning'
+            },
             {
                 id: 'svm',
                 name: 'Support Vector Machine',
@@ -214,6 +222,14 @@ const CATEGORIES = {
                 path: 'tools/ml-algorithms/kmeans.html',
                 category: 'Unsupervised Learning'
             },
+            {
+                id: 'kmeans-explorer',
+                name: 'K-Means Explorer',
+                icon: '🔷',
+                description: 'Lloyd iterations and Voronoi regions on datasets of up to 20,000 points.',
+                path: 'tools/ml-algorithms/kmeans-explorer.html',
+                category: 'Unsupervised Learning'
+            },
             {
                 id: 'dbscan',
                 name: 'DBSCAN',
@@ -222,6 +238,14 @@ const CATEGORIES = {
                 path: 'tools/ml-algorithms/dbscan.html',
                 category: 'Unsupervised Learning'
             },
+            {
+                id: 'dbscan-explorer',
+                name: 'DBSCAN Explorer',
+                icon: '🟥',
+                description: 'Density clustering on up to 20,000 points with k-d tree region queries.',
+                path: 'tools/ml-algorithms/dbscan-explorer.html',
+                category: 'Unsupervised Learning'
+            },
             {
                 id: 'pca',
                 name: 'PCA',
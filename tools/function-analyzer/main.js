@@ -158,15 +158,13 @@ function plot2D() {
     if (!expression || isNaN(xMin) || isNaN(xMax) || xMin >= xMax) return;
 
     try {
-        const compiledFunc = math.compile(expression);
-        const step = (xMax - xMin) / 500;
-        const xValues = math.range(xMin, xMax, step).toArray();
+        const compiledFunc = ExpressionCompiler.compile(expression);
         const data = [];
 
-        // 1. Original Function
-        const yValues = xValues.map(x => {
-            try { return compiledFunc.evaluate({ x: x }); } catch (e) { return null; }
-        });
+        // 1. Original Function (sampled densely only where it bends or breaks)
+        const samples = ExpressionCompiler.sampleAdaptive(compiledFunc, xMin, xMax);
+        const xValues = samples.x;
+        const yValues = samples.y;
 
         data.push({
             x: xValues,
@@ -181,8 +179,8 @@ function plot2D() {
         if (showDerivativeToggle.checked) {
             try {
                 const derivative = math.derivative(expression, 'x');
-                const compiledDerivative = derivative.compile();
-                const yDerivative = xValues.map(x => compiledDerivative.evaluate({ x: x }));
+                const compiledDerivative = ExpressionCompiler.compile(derivative);
+                const yDerivative = compiledDerivative.evaluateBatch(xValues);
 
                 data.push({
                     x: xValues,
@@ -197,18 +195,19 @@ function plot2D() {
 
         // 3. Indefinite Integral Curve (Cumulative Sum)
         if (showIndefIntegralToggle.checked) {
-            // Approx: F(x) = sum(y * dx)
+            // Approx: F(x) = sum(y * dx), trapezoids over the (non-uniform) samples
             let cumSum = 0;
-            const yIntegral = [];
+            const yIntegral = new Float64Array(yValues.length);
             // Assuming start from 0 or xMin. Let's start integral from 0 if in range, else xMin.
             // Actually simple cumulative sum trace is best for visualizing shape.
             // We'll reset integral to 0 at x=0 if possible for nicer alignment, or just accumulated from xMin.
 
             // accumulate from start
-            for (let i = 0; i < yValues.length; i++) {
-                const y = yValues[i] || 0;
-                cumSum += y * step;
-                yIntegral.push(cumSum);
+            for (let i = 1; i < yValues.length; i++) {
+                const y0 = Number.isFinite(yValues[i - 1]) ? yValues[i - 1] : 0;
+                const y1 = Number.isFinite(yValues[i]) ? yValues[i] : 0;
+                cumSum += (y0 + y1) * (xValues[i] - xValues[i - 1]) / 2;
+                yIntegral[i] = cumSum;
             }
 
             // Optional: Shift so F(0) = 0 if 0 is in range?
@@ -229,8 +228,14 @@ function plot2D() {
             const intMin = parseFloat(intMinInput.value);
             const intMax = parseFloat(intMaxInput.value);
             if (!isNaN(intMin) && !isNaN(intMax) && intMin < intMax) {
-                const xArea = xValues.filter(x => x >= intMin && x <= intMax);
-                const yArea = xArea.map(x => compiledFunc.evaluate({ x: x }));
+                const xArea = [];
+                const yArea = [];
+                for (let i = 0; i < xValues.length; i++) {
+                    if (xValues[i] >= intMin && xValues[i] <= intMax) {
+                        xArea.push(xValues[i]);
+                        yArea.push(yValues[i]);
+                    }
+                }
                 const xFill = [intMin, ...xArea, intMax];
                 const yFill = [0, ...yArea, 0];
 
@@ -249,12 +254,9 @@ function plot2D() {
                 let area = 0;
                 const n = 200;
                 const d = (intMax - intMin) / n;
+                const yNodes = compiledFunc.evaluateBatch(ExpressionCompiler.linspace(intMin, intMax, n + 1));
                 for (let i = 0; i < n; i++) {
-                    const x1 = intMin + i * d;
-                    const x2 = intMin + (i + 1) * d;
-                    const y1 = compiledFunc.evaluate({ x: x1 });
-                    const y2 = compiledFunc.evaluate({ x: x2 });
-                    area += (y1 + y2) * d / 2;
+                    area += (yNodes[i] + yNodes[i + 1]) * d / 2;
                 }
                 areaResult.textContent = area.toFixed(4);
             }
@@ -269,8 +271,7 @@ function plot2D() {
                 let terms = [];
                 let displayTerms = []; // Human-readable
                 for (let i = 0; i <= order; i++) {
-                    const compiledDeriv = currentDeriv.compile();
-                    const coeffVal = compiledDeriv.evaluate({ x: center });
+                    const coeffVal = ExpressionCompiler.compile(currentDeriv).evaluate(center);
                     const factorial = math.factorial(i);
                     const coeff = coeffVal / factorial;
                     if (Math.abs(coeff) > 1e-10) {
@@ -307,8 +308,8 @@ function plot2D() {
                     currentDeriv = math.derivative(currentDeriv, 'x');
                 }
                 const taylorString = terms.join(' + ') || '0';
-                const compiledTaylor = math.compile(taylorString);
-                const yTaylor = xValues.map(x => compiledTaylor.evaluate({ x: x }));
+                const compiledTaylor = ExpressionCompiler.compile(taylorString);
+                const yTaylor = compiledTaylor.evaluateBatch(xValues);
 
                 data.push({
                     x: xValues,
@@ -354,7 +355,7 @@ function plot3D() {
     const yMax = parseFloat(y3dMaxInput.value);
 
     try {
-        const compiledFunc = math.compile(expression);
+        const compiledFunc = ExpressionCompiler.compile(expression, ['x', 'y']);
 
         // Create easier grid
         const steps = 40;
@@ -366,21 +367,24 @@ function plot3D() {
         const zValues = [];
 
         for (let y = yMin; y <= yMax; y += yStep) {
-            const zRow = [];
             const yRow = [];
             const xRow = [];
             for (let x = xMin; x <= xMax; x += xStep) {
                 xRow.push(x);
                 yRow.push(y);
-                let zVal = 0;
-                try {
-                    zVal = compiledFunc.evaluate({ x: x, y: y });
-                } catch (e) { zVal = null; }
-                zRow.push(zVal);
             }
             xValues.push(xRow); // Creating 2D arrays for surface
             yValues.push(yRow);
-            zValues.push(zRow);
+        }
+
+        // Evaluate the whole grid in one batch, then split it back into rows
+        const gridX = Float64Array.from(xValues.flat());
+        const gridY = Float64Array.from(yValues.flat());
+        const gridZ = compiledFunc.evaluateBatch([gridX, gridY]);
+        let offset = 0;
+        for (const row of xValues) {
+            zValues.push(Array.from(gridZ.subarray(offset, offset + row.length)));
+            offset += row.length;
         }
 
         const data = [{
@@ -10,6 +10,7 @@ class DBSCANApp {
         this.epsilon = 0.15;
         this.minPts = 4;
         this.corePoints = new Set();
+        this.index = null;
 
         this.colors = [
             '#6366f1', '#10b981', '#f59e0b', '#ec4899',
@@ -38,6 +39,10 @@ class DBSCANApp {
     }
 
     setupEventListeners() {
+        document.getElementById('num-points').addEventListener('input', (e) => {
+            document.getElementById('num-points-value').textContent = e.target.value;
+        });
+
         document.getElementById('dataset-select').addEventListener('change', () => this.generateData());
         document.getElementById('generate-btn').addEventListener('click', () => this.generateData());
 
@@ -55,6 +60,7 @@ class DBSCANApp {
     }
 
     generateData() {
+        const n = parseInt(document.getElementById('num-points').value);
         const dataset = document.getElementById('dataset-select').value;
         this.data = [];
         this.labels = [];
@@ -62,16 +68,16 @@ class DBSCANApp {
 
         switch (dataset) {
             case 'blobs':
-                this.generateBlobs();
+                this.generateBlobs(n);
                 break;
             case 'moons':
-                this.generateMoons();
+                this.generateMoons(n);
                 break;
             case 'circles':
-                this.generateCircles();
+                this.generateCircles(n);
                 break;
             case 'noise':
-                this.generateWithNoise();
+                this.generateWithNoise(n);
                 break;
         }
 
@@ -79,7 +85,7 @@ class DBSCANApp {
         this.render();
     }
 
-    generateBlobs() {
+    generateBlobs(n) {
         const centers = [
             { x: -0.5, y: 0.4 },
             { x: 0.5, y: 0.4 },
@@ -87,7 +93,7 @@ class DBSCANApp {
         ];
 
         for (const c of centers) {
-            for (let i = 0; i < 30; i++) {
+            for (let i = 0; i < n / 3; i++) {
                 this.data.push({
                     x: c.x + (Math.random() - 0.5) * 0.3,
                     y: c.y + (Math.random() - 0.5) * 0.3
@@ -96,9 +102,10 @@ class DBSCANApp {
         }
     }
 
-    generateMoons() {
-        for (let i = 0; i < 60; i++) {
-            const angle = (i / 60) * Math.PI;
+    generateMoons(n) {
+        const half = Math.ceil(n / 2);
+        for (let i = 0; i < half; i++) {
+            const angle = (i / half) * Math.PI;
             const noise = (Math.random() - 0.5) * 0.08;
 
             // Upper moon
@@ -115,9 +122,10 @@ class DBSCANApp {
         }
     }
 
-    generateCircles() {
-        for (let i = 0; i < 50; i++) {
-            const angle = (i / 50) * Math.PI * 2;
+    generateCircles(n) {
+        const half = Math.ceil(n / 2);
+        for (let i = 0; i < half; i++) {
+            const angle = (i / half) * Math.PI * 2;
             const noise = (Math.random() - 0.5) * 0.05;
 
             // Inner circle
@@ -134,9 +142,9 @@ class DBSCANApp {
         }
     }
 
-    generateWithNoise() {
-        // Two clusters
-        for (let i = 0; i < 30; i++) {
+    generateWithNoise(n) {
+        // Two clusters (3/8 of the points each)
+        for (let i = 0; i < n * 3 / 8; i++) {
             this.data.push({
                 x: -0.4 + (Math.random() - 0.5) * 0.3,
                 y: 0 + (Math.random() - 0.5) * 0.3
@@ -148,7 +156,7 @@ class DBSCANApp {
         }
 
         // Random noise
-        for (let i = 0; i < 20; i++) {
+        for (let i = 0; i < n / 4; i++) {
             this.data.push({
                 x: (Math.random() - 0.5) * 1.6,
                 y: (Math.random() - 0.5) * 1.2
@@ -156,76 +164,17 @@ class DBSCANApp {
         }
     }
 
-    distance(a, b) {
-        return Math.sqrt(Math.pow(a.x - b.x, 2) + Math.pow(a.y - b.y, 2));
-    }
-
-    getNeighbors(pointIdx) {
-        const neighbors = [];
-        for (let i = 0; i < this.data.length; i++) {
-            if (i !== pointIdx && this.distance(this.data[pointIdx], this.data[i]) <= this.epsilon) {
-                neighbors.push(i);
-            }
-        }
-        return neighbors;
-    }
-
+    // Region queries run through the k-d tree MLCore.dbscan builds
     runDBSCAN() {
-        const n = this.data.length;
-        this.labels = new Array(n).fill(-1); // -1 = unvisited, -2 = noise
-        this.corePoints = new Set();
-        let clusterId = 0;
-
-        for (let i = 0; i < n; i++) {
-            if (this.labels[i] !== -1) continue;
-
-            const neighbors = this.getNeighbors(i);
-
-            if (neighbors.length < this.minPts - 1) {
-                this.labels[i] = -2; // Noise
-            } else {
-                this.corePoints.add(i);
-                this.expandCluster(i, neighbors, clusterId);
-                clusterId++;
-            }
-        }
+        const { labels, corePoints, index } = MLCore.dbscan(this.data, this.epsilon, this.minPts);
+        this.labels = labels;
+        this.corePoints = corePoints;
+        this.index = index;
 
         this.updateStats();
         this.render();
     }
 
-    expandCluster(pointIdx, neighbors, clusterId) {
-        this.labels[pointIdx] = clusterId;
-
-        const queue = [...neighbors];
-        const visited = new Set([pointIdx]);
-
-        while (queue.length > 0) {
-            const current = queue.shift();
-
-            if (visited.has(current)) continue;
-            visited.add(current);
-
-            if (this.labels[current] === -2) {
-                this.labels[current] = clusterId; // Border point
-            }
-
-            if (this.labels[current] !== -1) continue;
-
-            this.labels[current] = clusterId;
-
-            const currentNeighbors = this.getNeighbors(current);
-            if (currentNeighbors.length >= this.minPts - 1) {
-                this.corePoints.add(current);
-                for (const n of currentNeighbors) {
-                    if (!visited.has(n)) {
-                        queue.push(n);
-                    }
-                }
-            }
-        }
-    }
-
     updateStats() {
         const clusters = new Set(this.labels.filter(l => l >= 0));
         const noise = this.labels.filter(l => l === -2).length;
@@ -248,8 +197,9 @@ class DBSCANApp {
         const cx = w / 2;
         const cy = h / 2;
 
-        // Draw epsilon circles for core points
-        for (const idx of this.corePoints) {
+        // Draw epsilon circles for core points (too dense to read on large datasets)
+        const showCircles = this.corePoints.size <= 2000;
+        for (const idx of showCircles ? this.corePoints : []) {
             const p = this.data[idx];
             const px = cx + p.x * scale;
             const py = cy - p.y * scale;
@@ -263,7 +213,8 @@ class DBSCANApp {
             ctx.stroke();
         }
 
-        // Draw data points
+        // Draw data points (smaller dots for large datasets)
+        const radius = this.data.length > 2000 ? 2 : this.data.length > 400 ? 3 : 5;
         for (let i = 0; i < this.data.length; i++) {
             const p = this.data[i];
             const px = cx + p.x * scale;
@@ -279,7 +230,7 @@ class DBSCANApp {
             }
 
             ctx.beginPath();
-            ctx.arc(px, py, isCore ? 8 : 5, 0, Math.PI * 2);
+            ctx.arc(px, py, isCore ? radius + 3 : radius, 0, Math.PI * 2);
             ctx.fillStyle = color;
             ctx.fill();
 
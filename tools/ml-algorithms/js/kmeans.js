@@ -193,49 +193,9 @@ class KMeansApp {
     step() {
         if (this.converged) return;
 
-        // Assign points to nearest centroid
-        const oldAssignments = [...this.assignments];
+        const { centroids, moved } = MLCore.kmeansStep(this.data, this.centroids, this.assignments);
 
-        for (let i = 0; i < this.data.length; i++) {
-            let minDist = Infinity;
-            let nearest = 0;
-
-            for (let j = 0; j < this.centroids.length; j++) {
-                const dist = this.distance(this.data[i], this.centroids[j]);
-                if (dist < minDist) {
-                    minDist = dist;
-                    nearest = j;
-                }
-            }
-
-            this.assignments[i] = nearest;
-        }
-
-        // Update centroids
-        const newCentroids = [];
-
-        for (let j = 0; j < this.k; j++) {
-            const assigned = this.data.filter((_, i) => this.assignments[i] === j);
-
-            if (assigned.length > 0) {
-                const meanX = assigned.reduce((sum, p) => sum + p.x, 0) / assigned.length;
-                const meanY = assigned.reduce((sum, p) => sum + p.y, 0) / assigned.length;
-                newCentroids.push({ x: meanX, y: meanY });
-            } else {
-                newCentroids.push(this.centroids[j]);
-            }
-        }
-
-        // Check convergence
-        let moved = false;
-        for (let j = 0; j < this.k; j++) {
-            if (this.distance(this.centroids[j], newCentroids[j]) > 0.001) {
-                moved = true;
-                break;
-            }
-        }
-
-        this.centroids = newCentroids;
+        this.centroids = centroids;
         this.iteration++;
 
         if (!moved || this.iteration >= 100) {
@@ -252,19 +212,8 @@ class KMeansApp {
         this.render();
     }
 
-    distance(a, b) {
-        return Math.sqrt(Math.pow(a.x - b.x, 2) + Math.pow(a.y - b.y, 2));
-    }
-
     computeInertia() {
-        let inertia = 0;
-        for (let i = 0; i < this.data.length; i++) {
-            if (this.assignments[i] >= 0) {
-                const dist = this.distance(this.data[i], this.centroids[this.assignments[i]]);
-                inertia += dist * dist;
-            }
-        }
-        return inertia;
+        return MLCore.kmeansInertia(this.data, this.centroids, this.assignments);
     }
 
     updateStats() {
@@ -296,6 +245,30 @@ class KMeansApp {
         ctx.fillStyle = '#0a0a0f';
         ctx.fillRect(0, 0, w, h);
 
+        const scale = Math.min(w, h) * 0.4;
+        const cx = w / 2;
+        const cy = h / 2;
+
+        // Voronoi regions at full resolution. Cells are convex, so a block
+        // whose corners share a nearest centroid lies wholly inside that cell.
+        if (this.iteration > 0 && w > 0 && h > 0) {
+            const index = new KDTree(this.centroids);
+            const labels = rasterizeRegions(w, h, 8, (px, py) =>
+                index.nearestHeap((px - cx) / scale, (cy - py) / scale, 1).index[0]);
+
+            const fills = this.colors.map(c => this.blendOver(c, '#0a0a0f', 0.08));
+            const image = ctx.createImageData(w, h);
+            const pixels = image.data;
+            for (let i = 0; i < labels.length; i++) {
+                const [r, g, b] = fills[labels[i]];
+                pixels[4 * i] = r;
+                pixels[4 * i + 1] = g;
+                pixels[4 * i + 2] = b;
+                pixels[4 * i + 3] = 255;
+            }
+            ctx.putImageData(image, 0, 0);
+        }
+
         // Grid
         ctx.strokeStyle = 'rgba(255, 255, 255, 0.03)';
         ctx.lineWidth = 1;
@@ -315,35 +288,8 @@ class KMeansApp {
             ctx.stroke();
         }
 
-        const scale = Math.min(w, h) * 0.4;
-        const cx = w / 2;
-        const cy = h / 2;
-
-        // Draw Voronoi regions (simplified)
-        if (this.iteration > 0) {
-            for (let px = 0; px < w; px += 10) {
-                for (let py = 0; py < h; py += 10) {
-                    const x = (px - cx) / scale;
-                    const y = (cy - py) / scale;
-
-                    let minDist = Infinity;
-                    let nearest = 0;
-
-                    for (let j = 0; j < this.centroids.length; j++) {
-                        const dist = Math.pow(x - this.centroids[j].x, 2) + Math.pow(y - this.centroids[j].y, 2);
-                        if (dist < minDist) {
-                            minDist = dist;
-                            nearest = j;
-                        }
-                    }
-
-                    ctx.fillStyle = this.hexToRgba(this.colors[nearest], 0.08);
-                    ctx.fillRect(px, py, 10, 10);
-                }
-            }
-        }
-
-        // Draw data points
+        // Draw data points (smaller dots for large datasets)
+        const radius = this.data.length > 2000 ? 2 : this.data.length > 400 ? 3 : 5;
         for (let i = 0; i < this.data.length; i++) {
             const point = this.data[i];
             const px = cx + point.x * scale;
@@ -352,7 +298,7 @@ class KMeansApp {
             const color = this.assignments[i] >= 0 ? this.colors[this.assignments[i]] : '#666';
 
             ctx.beginPath();
-            ctx.arc(px, py, 5, 0, Math.PI * 2);
+            ctx.arc(px, py, radius, 0, Math.PI * 2);
             ctx.fillStyle = color;
             ctx.fill();
         }
@@ -388,11 +334,10 @@ class KMeansApp {
         }
     }
 
-    hexToRgba(hex, alpha) {
-        const r = parseInt(hex.slice(1, 3), 16);
-        const g = parseInt(hex.slice(3, 5), 16);
-        const b = parseInt(hex.slice(5, 7), 16);
-        return `rgba(${r}, ${g}, ${b}, ${alpha})`;
+    // Opaque [r, g, b] of `hex` at `alpha` over `background`
+    blendOver(hex, background, alpha) {
+        return [1, 3, 5].map(i => Math.round(
+            parseInt(hex.slice(i, i + 2), 16) * alpha + parseInt(background.slice(i, i + 2), 16) * (1 - alpha)));
     }
 }
 
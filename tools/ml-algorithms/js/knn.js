@@ -11,6 +11,7 @@ class KNNApp {
         this.nearestNeighbors = [];
         this.showBoundary = false;
         this.boundaryCache = null;
+        this.index = null;
 
         this.colors = {
             0: '#6366f1',
@@ -57,6 +58,10 @@ class KNNApp {
             this.render();
         });
 
+        document.getElementById('num-points').addEventListener('input', (e) => {
+            document.getElementById('num-points-value').textContent = e.target.value;
+        });
+
         document.getElementById('dataset-select').addEventListener('change', () => this.generateData());
         document.getElementById('generate-btn').addEventListener('click', () => this.generateData());
 
@@ -84,41 +89,35 @@ class KNNApp {
             this.classify(this.queryPoint);
             this.render();
         });
-
-        // Hover for preview
-        this.canvas.addEventListener('mousemove', (e) => {
-            const rect = this.canvas.getBoundingClientRect();
-            this.hoverX = e.clientX - rect.left;
-            this.hoverY = e.clientY - rect.top;
-            this.render();
-        });
     }
 
     generateData() {
+        const n = parseInt(document.getElementById('num-points').value);
         const dataset = document.getElementById('dataset-select').value;
         this.data = [];
         this.queryPoint = null;
         this.nearestNeighbors = [];
         this.boundaryCache = null;
+        this.index = null;
 
         switch (dataset) {
             case 'two-clusters':
-                this.generateTwoClusters();
+                this.generateTwoClusters(n);
                 break;
             case 'three-clusters':
-                this.generateThreeClusters();
+                this.generateThreeClusters(n);
                 break;
             case 'spiral':
-                this.generateSpiral();
+                this.generateSpiral(n);
                 break;
         }
 
         this.render();
     }
 
-    generateTwoClusters() {
+    generateTwoClusters(n) {
         // Class 0 - top left
-        for (let i = 0; i < 40; i++) {
+        for (let i = 0; i < n / 2; i++) {
             this.data.push({
                 x: -0.5 + (Math.random() - 0.5) * 0.5,
                 y: 0.5 + (Math.random() - 0.5) * 0.5,
@@ -127,7 +126,7 @@ class KNNApp {
         }
 
         // Class 1 - bottom right
-        for (let i = 0; i < 40; i++) {
+        for (let i = 0; i < n / 2; i++) {
             this.data.push({
                 x: 0.5 + (Math.random() - 0.5) * 0.5,
                 y: -0.5 + (Math.random() - 0.5) * 0.5,
@@ -136,7 +135,7 @@ class KNNApp {
         }
     }
 
-    generateThreeClusters() {
+    generateThreeClusters(n) {
         const centers = [
             { x: 0, y: 0.6, class: 0 },
             { x: -0.5, y: -0.4, class: 1 },
@@ -144,7 +143,7 @@ class KNNApp {
         ];
 
         for (const center of centers) {
-            for (let i = 0; i < 30; i++) {
+            for (let i = 0; i < n / 3; i++) {
                 this.data.push({
                     x: center.x + (Math.random() - 0.5) * 0.5,
                     y: center.y + (Math.random() - 0.5) * 0.5,
@@ -154,9 +153,10 @@ class KNNApp {
         }
     }
 
-    generateSpiral() {
-        for (let i = 0; i < 50; i++) {
-            const t = i / 50 * 2 * Math.PI;
+    generateSpiral(n) {
+        const arms = Math.ceil(n / 2);
+        for (let i = 0; i < arms; i++) {
+            const t = i / arms * 2 * Math.PI;
             const r = t / (2 * Math.PI) * 0.6 + 0.1;
 
             // Class 0
@@ -175,6 +175,12 @@ class KNNApp {
         }
     }
 
+    getMetric() {
+        const metric = document.getElementById('distance-metric').value;
+        // Unknown metrics fall back to a linear scan in the index
+        return SpatialMetrics[metric] ? metric : (dx, dy) => this.distance({ x: dx, y: dy }, { x: 0, y: 0 });
+    }
+
     distance(a, b) {
         const metric = document.getElementById('distance-metric').value;
 
@@ -184,33 +190,39 @@ class KNNApp {
         return Math.sqrt(Math.pow(a.x - b.x, 2) + Math.pow(a.y - b.y, 2));
     }
 
-    classify(point) {
-        // Find K nearest neighbors
-        const distances = this.data.map((d, i) => ({
-            index: i,
-            point: d,
-            distance: this.distance(point, d)
-        }));
-
-        distances.sort((a, b) => a.distance - b.distance);
-        this.nearestNeighbors = distances.slice(0, this.k);
-
-        // Vote
-        const votes = {};
-        for (const neighbor of this.nearestNeighbors) {
-            const c = neighbor.point.class;
-            votes[c] = (votes[c] || 0) + 1;
+    // k-d tree over the training data, rebuilt when the data changes
+    getIndex() {
+        if (!this.index) {
+            this.index = new KDTree(this.data);
+        }
+        return this.index;
+    }
+
+    // Majority vote over the first `count` data indices; ties go to the lowest class
+    vote(indices, count = indices.length) {
+        const votes = [0, 0, 0];
+        for (let i = 0; i < count; i++) {
+            votes[this.data[indices[i]].class]++;
         }
 
-        // Find winner
         let maxVotes = 0;
         let predictedClass = 0;
-        for (const [c, count] of Object.entries(votes)) {
-            if (count > maxVotes) {
-                maxVotes = count;
-                predictedClass = parseInt(c);
+        for (let c = 0; c < votes.length; c++) {
+            if (votes[c] > maxVotes) {
+                maxVotes = votes[c];
+                predictedClass = c;
             }
         }
+        return { predictedClass, maxVotes };
+    }
+
+    classify(point) {
+        // Find K nearest neighbors
+        this.nearestNeighbors = this.getIndex()
+            .nearest(point.x, point.y, this.k, this.getMetric())
+            .map(n => ({ index: n.index, point: this.data[n.index], distance: n.distance }));
+
+        const { predictedClass, maxVotes } = this.vote(this.nearestNeighbors.map(n => n.index));
 
         // Update UI
         document.getElementById('query-point').textContent =
@@ -234,6 +246,7 @@ class KNNApp {
         return predictedClass;
     }
 
+    // Full-resolution decision map as ImageData, blended over the background
     computeBoundary() {
         if (this.boundaryCache) return this.boundaryCache;
 
@@ -242,43 +255,28 @@ class KNNApp {
         const scale = Math.min(w, h) * 0.4;
         const cx = w / 2;
         const cy = h / 2;
-        const step = 8;
-
-        const boundary = [];
-
-        for (let px = 0; px < w; px += step) {
-            for (let py = 0; py < h; py += step) {
-                const x = (px - cx) / scale;
-                const y = (cy - py) / scale;
-
-                // Find nearest neighbors
-                const distances = this.data.map(d => ({
-                    d,
-                    dist: this.distance({ x, y }, d)
-                }));
-                distances.sort((a, b) => a.dist - b.dist);
-
-                const nearest = distances.slice(0, this.k);
-                const votes = {};
-                for (const n of nearest) {
-                    votes[n.d.class] = (votes[n.d.class] || 0) + 1;
-                }
-
-                let maxVotes = 0;
-                let predictedClass = 0;
-                for (const [c, count] of Object.entries(votes)) {
-                    if (count > maxVotes) {
-                        maxVotes = count;
-                        predictedClass = parseInt(c);
-                    }
-                }
-
-                boundary.push({ px, py, class: predictedClass });
-            }
+        const index = this.getIndex();
+        const metric = this.getMetric();
+
+        // Bounded-heap k-nearest queries, only where block corners disagree
+        const labels = rasterizeRegions(w, h, 4, (px, py) => {
+            const heap = index.nearestHeap((px - cx) / scale, (cy - py) / scale, this.k, metric);
+            return this.vote(heap.index, heap.size).predictedClass;
+        });
+
+        const fills = Object.values(this.colors).map(c => this.blendOver(c, '#0a0a0f', 0.15));
+        const image = this.ctx.createImageData(w, h);
+        const pixels = image.data;
+        for (let i = 0; i < labels.length; i++) {
+            const [r, g, b] = fills[labels[i]];
+            pixels[4 * i] = r;
+            pixels[4 * i + 1] = g;
+            pixels[4 * i + 2] = b;
+            pixels[4 * i + 3] = 255;
         }
 
-        this.boundaryCache = boundary;
-        return boundary;
+        this.boundaryCache = image;
+        return image;
     }
 
     render() {
@@ -297,14 +295,8 @@ class KNNApp {
         const cy = h / 2;
 
         // Decision boundary
-        if (this.showBoundary && this.data.length > 0) {
-            const boundary = this.computeBoundary();
-            const step = 8;
-
-            for (const b of boundary) {
-                ctx.fillStyle = this.hexToRgba(this.colors[b.class], 0.15);
-                ctx.fillRect(b.px, b.py, step, step);
-            }
+        if (this.showBoundary && this.data.length > 0 && w > 0 && h > 0) {
+            ctx.putImageData(this.computeBoundary(), 0, 0);
         }
 
         // Grid
@@ -346,15 +338,18 @@ class KNNApp {
             }
         }
 
-        // Draw training data
-        for (const point of this.data) {
+        // Draw training data (smaller dots for large datasets)
+        const neighbors = new Set(this.nearestNeighbors.map(n => n.index));
+        const radius = this.data.length > 2000 ? 2 : this.data.length > 400 ? 4 : 6;
+        for (let i = 0; i < this.data.length; i++) {
+            const point = this.data[i];
             const px = cx + point.x * scale;
             const py = cy - point.y * scale;
 
-            const isNeighbor = this.nearestNeighbors.some(n => n.point === point);
+            const isNeighbor = neighbors.has(i);
 
             ctx.beginPath();
-            ctx.arc(px, py, isNeighbor ? 10 : 6, 0, Math.PI * 2);
+            ctx.arc(px, py, isNeighbor ? radius + 4 : radius, 0, Math.PI * 2);
             ctx.fillStyle = this.colors[point.class];
             ctx.fill();
 
@@ -400,11 +395,10 @@ class KNNApp {
         }
     }
 
-    hexToRgba(hex, alpha) {
-        const r = parseInt(hex.slice(1, 3), 16);
-        const g = parseInt(hex.slice(3, 5), 16);
-        const b = parseInt(hex.slice(5, 7), 16);
-        return `rgba(${r}, ${g}, ${b}, ${alpha})`;
+    // Opaque [r, g, b] of `hex` at `alpha` over `background`
+    blendOver(hex, background, alpha) {
+        return [1, 3, 5].map(i => Math.round(
+            parseInt(hex.slice(i, i + 2), 16) * alpha + parseInt(background.slice(i, i + 2), 16) * (1 - alpha)));
     }
 }
 
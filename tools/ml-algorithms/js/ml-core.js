@@ -0,0 +1,130 @@
+/**
+ * ML Core
+ * DOM-free k-means and DBSCAN loops behind the explorer apps (js/kmeans.js,
+ * js/dbscan.js). The apps own state and rendering and call in here for the
+ * math; load it after spatial-index.js (MLCore.dbscan builds a KDTree) and
+ * before the app script.
+ */
+
+const MLCore = {
+    distance(a, b) {
+        return Math.sqrt(Math.pow(a.x - b.x, 2) + Math.pow(a.y - b.y, 2));
+    },
+
+    // ============================================
+    // K-MEANS
+    // ============================================
+
+    // One Lloyd iteration: fills `assignments` in place and returns the new
+    // centroids plus whether any of them moved more than the tolerance
+    kmeansStep(data, centroids, assignments, tolerance = 0.001) {
+        const k = centroids.length;
+
+        for (let i = 0; i < data.length; i++) {
+            let minDist = Infinity;
+            let nearest = 0;
+
+            for (let j = 0; j < k; j++) {
+                const dist = MLCore.distance(data[i], centroids[j]);
+                if (dist < minDist) {
+                    minDist = dist;
+                    nearest = j;
+                }
+            }
+
+            assignments[i] = nearest;
+        }
+
+        // Single pass accumulating per-cluster sums
+        const sumX = new Float64Array(k);
+        const sumY = new Float64Array(k);
+        const counts = new Int32Array(k);
+        for (let i = 0; i < data.length; i++) {
+            const j = assignments[i];
+            sumX[j] += data[i].x;
+            sumY[j] += data[i].y;
+            counts[j]++;
+        }
+
+        const next = [];
+        let moved = false;
+        for (let j = 0; j < k; j++) {
+            next.push(counts[j] > 0 ? { x: sumX[j] / counts[j], y: sumY[j] / counts[j] } : centroids[j]);
+            if (MLCore.distance(centroids[j], next[j]) > tolerance) moved = true;
+        }
+
+        return { centroids: next, moved };
+    },
+
+    kmeansInertia(data, centroids, assignments) {
+        let inertia = 0;
+        for (let i = 0; i < data.length; i++) {
+            if (assignments[i] >= 0) {
+                const dist = MLCore.distance(data[i], centroids[assignments[i]]);
+                inertia += dist * dist;
+            }
+        }
+        return inertia;
+    },
+
+    // ============================================
+    // DBSCAN
+    // ============================================
+
+    // Labels: cluster id >= 0, -2 = noise. Region queries go through a KDTree.
+    dbscan(data, epsilon, minPts) {
+        const n = data.length;
+        const labels = new Array(n).fill(-1); // -1 = unvisited
+        const corePoints = new Set();
+        const index = new KDTree(data);
+        const visited = new Uint8Array(n);
+        let clusterId = 0;
+
+        const neighborsOf = (i) => index.withinRadius(data[i].x, data[i].y, epsilon).filter(j => j !== i);
+
+        for (let i = 0; i < n; i++) {
+            if (labels[i] !== -1) continue;
+
+            const neighbors = neighborsOf(i);
+            if (neighbors.length < minPts - 1) {
+                labels[i] = -2;
+                continue;
+            }
+
+            // Expand the cluster breadth-first from core point i
+            corePoints.add(i);
+            labels[i] = clusterId;
+            visited.fill(0);
+            visited[i] = 1;
+
+            const queue = neighbors;
+            let head = 0;
+            while (head < queue.length) {
+                const current = queue[head++];
+
+                if (visited[current]) continue;
+                visited[current] = 1;
+
+                if (labels[current] === -2) {
+                    labels[current] = clusterId; // Border point
+                }
+                if (labels[current] !== -1) continue;
+
+                labels[current] = clusterId;
+
+                const currentNeighbors = neighborsOf(current);
+                if (currentNeighbors.length >= minPts - 1) {
+                    corePoints.add(current);
+                    for (const j of currentNeighbors) {
+                        if (!visited[j]) queue.push(j);
+                    }
+                }
+            }
+            clusterId++;
+        }
+
+        return { labels, corePoints, index };
+    }
+};
+
+window.MLCore = MLCore;
@@ -0,0 +1,313 @@
+/**
+ * Spatial Index
+ * 2D k-d tree with bounded-heap k-nearest and radius queries.
+ * Shared by the kNN, DBSCAN and k-means explorer apps (js/knn.js, dbscan.js,
+ * kmeans.js; load before them), plus a block-refined region rasterizer for
+ * their decision and Voronoi maps.
+ */
+
+// Metrics that grow with each per-axis offset can prune k-d tree branches by
+// the distance to a subtree's bounding box; any other metric falls back to a
+// linear scan.
+const SpatialMetrics = {
+    euclidean: {
+        distance: (dx, dy) => Math.sqrt(dx * dx + dy * dy),
+        prunable: true
+    },
+    manhattan: {
+        distance: (dx, dy) => Math.abs(dx) + Math.abs(dy),
+        prunable: true
+    },
+    chebyshev: {
+        distance: (dx, dy) => Math.max(Math.abs(dx), Math.abs(dy)),
+        prunable: true
+    }
+};
+
+// ============================================
+// BOUNDED MAX-HEAP (keeps the k smallest distances)
+// ============================================
+
+class BoundedHeap {
+    constructor(capacity) {
+        this.capacity = capacity;
+        this.size = 0;
+        this.dist = new Float64Array(capacity);
+        this.index = new Int32Array(capacity);
+    }
+
+    clear() {
+        this.size = 0;
+    }
+
+    // Largest distance kept so far (Infinity until full)
+    worst() {
+        return this.size < this.capacity ? Infinity : this.dist[0];
+    }
+
+    push(distance, index) {
+        if (this.size < this.capacity) {
+            let i = this.size++;
+            // Sift up
+            while (i > 0) {
+                const parent = (i - 1) >> 1;
+                if (this.dist[parent] >= distance) break;
+                this.dist[i] = this.dist[parent];
+                this.index[i] = this.index[parent];
+                i = parent;
+            }
+            this.dist[i] = distance;
+            this.index[i] = index;
+        } else if (distance < this.dist[0]) {
+            // Replace root and sift down
+            let i = 0;
+            const n = this.size;
+            while (true) {
+                const left = 2 * i + 1;
+                if (left >= n) break;
+                const right = left + 1;
+                const child = right < n && this.dist[right] > this.dist[left] ? right : left;
+                if (this.dist[child] <= distance) break;
+                this.dist[i] = this.dist[child];
+                this.index[i] = this.index[child];
+                i = child;
+            }
+            this.dist[i] = distance;
+            this.index[i] = index;
+        }
+    }
+
+    // Results sorted by ascending distance
+    toSortedArray() {
+        const result = [];
+        for (let i = 0; i < this.size; i++) {
+            result.push({ index: this.index[i], distance: this.dist[i] });
+        }
+        return result.sort((a, b) => a.distance - b.distance || a.index - b.index);
+    }
+}
+
+// ============================================
+// K-D TREE
+// ============================================
+
+class KDTree {
+    // points: array of {x, y}; indices returned by queries refer to this array
+    constructor(points) {
+        const n = points.length;
+        this.size = n;
+        this.xs = new Float64Array(n);
+        this.ys = new Float64Array(n);
+        this.order = new Int32Array(n);
+
+        // Bounding box of each subtree, stored at its node's slot in `order`
+        this.minX = new Float64Array(n);
+        this.maxX = new Float64Array(n);
+        this.minY = new Float64Array(n);
+        this.maxY = new Float64Array(n);
+
+        for (let i = 0; i < n; i++) {
+            this.xs[i] = points[i].x;
+            this.ys[i] = points[i].y;
+            this.order[i] = i;
+        }
+
+        this.build(0, n, 0);
+        this.heap = null;
+    }
+
+    // Implicit tree: the median of each range is the node, split on x then y
+    build(lo, hi, depth) {
+        if (hi <= lo) return;
+        const mid = (lo + hi) >> 1;
+        if (hi - lo > 1) {
+            this.select(lo, hi - 1, mid, depth & 1 ? this.ys : this.xs);
+            this.build(lo, mid, depth + 1);
+            this.build(mid + 1, hi, depth + 1);
+        }
+
+        const idx = this.order[mid];
+        let minX = this.xs[idx], maxX = minX;
+        let minY = this.ys[idx], maxY = minY;
+        for (const child of [mid > lo ? (lo + mid) >> 1 : -1, mid + 1 < hi ? (mid + 1 + hi) >> 1 : -1]) {
+            if (child < 0) continue;
+            minX = Math.min(minX, this.minX[child]);
+            maxX = Math.max(maxX, this.maxX[child]);
+            minY = Math.min(minY, this.minY[child]);
+            maxY = Math.max(maxY, this.maxY[child]);
+        }
+        this.minX[mid] = minX;
+        this.maxX[mid] = maxX;
+        this.minY[mid] = minY;
+        this.maxY[mid] = maxY;
+    }
+
+    // Quickselect on `order` so order[k] holds the k-th smallest coordinate
+    select(left, right, k, coords) {
+        const order = this.order;
+        while (right > left) {
+            const pivot = coords[order[(left + right) >> 1]];
+            let i = left;
+            let j = right;
+            while (i <= j) {
+                while (coords[order[i]] < pivot) i++;
+                while (coords[order[j]] > pivot) j--;
+                if (i <= j) {
+                    const tmp = order[i];
+                    order[i] = order[j];
+                    order[j] = tmp;
+                    i++;
+                    j--;
+                }
+            }
+            if (k <= j) right = j;
+            else if (k >= i) left = i;
+            else break;
+        }
+    }
+
+    // k nearest points to (x, y) as [{index, distance}] sorted ascending
+    nearest(x, y, k, metric = 'euclidean') {
+        const heap = this.nearestHeap(x, y, k, metric);
+        return heap ? heap.toSortedArray() : [];
+    }
+
+    // Same query without sorting or allocating: the k nearest sit unordered
+    // in heap.index / heap.dist, and the heap is reused by the next query
+    nearestHeap(x, y, k, metric = 'euclidean') {
+        k = Math.min(k, this.size);
+        if (k <= 0) return null;
+
+        if (!this.heap || this.heap.capacity !== k) {
+            this.heap = new BoundedHeap(k);
+        }
+        const heap = this.heap;
+        heap.clear();
+
+        const spec = typeof metric === 'function' ? null : SpatialMetrics[metric];
+        if (spec && spec.prunable) {
+            this.searchNearest(0, this.size, 0, x, y, spec.distance, heap);
+        } else {
+            // Fallback: linear scan, still bounded-heap instead of a full sort
+            const distance = spec ? spec.distance : metric;
+            for (let i = 0; i < this.size; i++) {
+                heap.push(distance(this.xs[i] - x, this.ys[i] - y), i);
+            }
+        }
+
+        return heap;
+    }
+
+    searchNearest(lo, hi, depth, x, y, distance, heap) {
+        if (lo >= hi) return;
+        const mid = (lo + hi) >> 1;
+
+        // Skip the subtree when its bounding box is farther than the k-th best
+        const bx = x < this.minX[mid] ? this.minX[mid] - x : x > this.maxX[mid] ? x - this.maxX[mid] : 0;
+        const by = y < this.minY[mid] ? this.minY[mid] - y : y > this.maxY[mid] ? y - this.maxY[mid] : 0;
+        if (distance(bx, by) > heap.worst()) return;
+
+        const idx = this.order[mid];
+        const px = this.xs[idx];
+        const py = this.ys[idx];
+
+        heap.push(distance(px - x, py - y), idx);
+        if (hi - lo === 1) return;
+
+        const diff = depth & 1 ? y - py : x - px;
+        const nearLo = diff < 0;
+
+        // Near side first so the far side is usually pruned by its box
+        if (nearLo) {
+            this.searchNearest(lo, mid, depth + 1, x, y, distance, heap);
+            this.searchNearest(mid + 1, hi, depth + 1, x, y, distance, heap);
+        } else {
+            this.searchNearest(mid + 1, hi, depth + 1, x, y, distance, heap);
+            this.searchNearest(lo, mid, depth + 1, x, y, distance, heap);
+        }
+    }
+
+    // Indices of all points within `radius` of (x, y) (inclusive)
+    withinRadius(x, y, radius, metric = 'euclidean') {
+        const result = [];
+        const spec = typeof metric === 'function' ? null : SpatialMetrics[metric];
+
+        if (spec && spec.prunable) {
+            this.searchRadius(0, this.size, 0, x, y, radius, spec.distance, result);
+        } else {
+            const distance = spec ? spec.distance : metric;
+            for (let i = 0; i < this.size; i++) {
+                if (distance(this.xs[i] - x, this.ys[i] - y) <= radius) result.push(i);
+            }
+        }
+
+        return result;
+    }
+
+    searchRadius(lo, hi, depth, x, y, radius, distance, result) {
+        if (lo >= hi) return;
+        const mid = (lo + hi) >> 1;
+        const idx = this.order[mid];
+        const px = this.xs[idx];
+        const py = this.ys[idx];
+
+        if (distance(px - x, py - y) <= radius) result.push(idx);
+        if (hi - lo === 1) return;
+
+        // Left half has coordinates <= the split, right half >= it
+        const diff = depth & 1 ? y - py : x - px;
+        if (diff <= radius) this.searchRadius(lo, mid, depth + 1, x, y, radius, distance, result);
+        if (diff >= -radius) this.searchRadius(mid + 1, hi, depth + 1, x, y, radius, distance, result);
+    }
+}
+
+// ============================================
+// REGION MAPS
+// ============================================
+
+// Label every pixel of a width x height map with regionAt(px, py). Only
+// block corners are queried up front: a block whose four corners agree is
+// filled with that label, any other block is resolved pixel by pixel. Exact
+// for convex regions (Voronoi cells); a kNN island smaller than a block can
+// be missed. Returns row-major labels.
+function rasterizeRegions(width, height, block, regionAt) {
+    const labels = new Int32Array(width * height);
+    if (width === 0 || height === 0) return labels;
+
+    const cols = Math.ceil(width / block);
+    const rows = Math.ceil(height / block);
+    const stride = cols + 1;
+    const corners = new Int32Array(stride * (rows + 1));
+    for (let j = 0; j <= rows; j++) {
+        const py = Math.min(j * block, height - 1);
+        for (let i = 0; i <= cols; i++) {
+            corners[j * stride + i] = regionAt(Math.min(i * block, width - 1), py);
+        }
+    }
+
+    for (let j = 0; j < rows; j++) {
+        const y0 = j * block;
+        const y1 = Math.min(y0 + block, height);
+        for (let i = 0; i < cols; i++) {
+            const x0 = i * block;
+            const x1 = Math.min(x0 + block, width);
+            const c = j * stride + i;
+            const label = corners[c];
+            const uniform = corners[c + 1] === label &&
+                corners[c + stride] === label && corners[c + stride + 1] === label;
+
+            for (let py = y0; py < y1; py++) {
+                const row = py * width;
+                for (let px = x0; px < x1; px++) {
+                    labels[row + px] = uniform ? label : regionAt(px, py);
+                }
+            }
+        }
+    }
+    return labels;
+}
+
+window.SpatialMetrics = SpatialMetrics;
+window.BoundedHeap = BoundedHeap;
+window.KDTree = KDTree;
+window.rasterizeRegions = rasterizeRegions;
@@ -24,6 +24,12 @@ class App {
         this.stepSize = 5;
         this.accuracyHistory = [];
 
+        // Mini-batch / background training
+        this.batchSize = 1;
+        this.useWorker = false;
+        this.trainingWorker = null;
+        this.renderPending = false;
+
         // Initialize components
         this.initNetwork();
         this.initVisualizers();
@@ -58,6 +64,7 @@ class App {
             this.optimizerName,
             this.learningRate
         );
+        this.network.setBatchSize(this.batchSize);
     }
 
     initVisualizers() {
@@ -212,6 +219,7 @@ class App {
         document.getElementById('activation-select').addEventListener('change', (e) => {
             this.activationName = e.target.value;
             this.network.setActivation(this.activationName);
+            this.syncWorkerConfig();
             this.updateAllVisualizers();
         });
 
@@ -219,12 +227,14 @@ class App {
         document.getElementById('optimizer-select').addEventListener('change', (e) => {
             this.optimizerName = e.target.value;
             this.network.setOptimizer(this.optimizerName, this.learningRate);
+            this.syncWorkerConfig();
         });
 
         // Learning rate
         document.getElementById('learning-rate').addEventListener('change', (e) => {
             this.learningRate = parseFloat(e.target.value) || 0.01;
             this.network.setOptimizer(this.optimizerName, this.learningRate);
+            this.syncWorkerConfig();
         });
 
         // Loss function select
@@ -267,6 +277,21 @@ class App {
             this.stepSize = parseInt(e.target.value) || 5;
         });
 
+        // Batch size (1 = per-sample updates)
+        document.getElementById('batch-size').addEventListener('change', (e) => {
+            this.batchSize = parseInt(e.target.value) || 1;
+            this.network.setBatchSize(this.batchSize);
+            this.syncWorkerConfig();
+        });
+
+        // Training thread
+        document.getElementById('training-thread').addEventListener('change', (e) => {
+            const wasPlaying = this.isPlaying;
+            this.stop();
+            this.useWorker = e.target.value === 'worker';
+            if (wasPlaying) this.play();
+        });
+
         // Fullscreen toggles
         const fsCurve = document.getElementById('btn-fullscreen-curve');
         if (fsCurve) {
@@ -324,6 +349,7 @@ class App {
             dropoutSlider.addEventListener('input', (e) => {
                 const rate = parseFloat(e.target.value);
                 this.network.setDropoutRate(rate);
+                this.syncWorkerConfig();
                 if (dropoutValue) {
                     dropoutValue.textContent = `${Math.round(rate * 100)}%`;
                 }
@@ -399,7 +425,10 @@ class App {
                 const json = JSON.parse(e.target.result);
 
                 // Restore network
+                this.stop();
+                this.releaseWorker();
                 this.network = NeuralNetwork.importModel(json);
+                this.network.setBatchSize(this.batchSize);
                 this.layerSizes = [...json.layerSizes];
                 this.activationName = json.activationName;
                 this.optimizerName = json.optimizerName;
@@ -585,6 +614,7 @@ class App {
 
     rebuildNetwork() {
         this.stop();
+        this.releaseWorker();
         this.initNetwork();
         this.networkViz.setNetwork(this.network);
         this.curveViz.setNetwork(this.network);
@@ -611,7 +641,11 @@ class App {
         this.isPlaying = true;
         this.playBtn.innerHTML = '<span class="icon">⏸</span> Pause';
         this.playBtn.classList.add('playing');
-        this.trainingLoop();
+        if (this.useWorker && TrainingWorker.isSupported()) {
+            this.startWorkerTraining();
+        } else {
+            this.trainingLoop();
+        }
     }
 
     stop() {
@@ -622,6 +656,56 @@ class App {
             cancelAnimationFrame(this.animationId);
             this.animationId = null;
         }
+        if (this.trainingWorker) {
+            this.trainingWorker.stop();
+        }
+    }
+
+    // Train in a Web Worker; the UI only renders the posted snapshots
+    startWorkerTraining() {
+        if (!this.trainingWorker) {
+            this.trainingWorker = new TrainingWorker(this.network, {
+                onProgress: () => this.scheduleRender(),
+                onError: (err) => {
+                    console.warn('Training worker failed, falling back to main thread:', err.message);
+                    this.trainingWorker = null;
+                    this.useWorker = false;
+                    if (this.isPlaying) this.trainingLoop();
+                }
+            });
+        }
+        this.trainingWorker.batchSize = this.batchSize;
+        this.trainingWorker.reportEvery = this.stepSize;
+
+        try {
+            this.trainingWorker.start(this.trainingInputs, this.trainingTargets);
+        } catch (err) {
+            // Workers are unavailable (e.g. opened from file://)
+            this.trainingWorker.onError(err);
+        }
+    }
+
+    // Settings edited mid-run reach a running worker straight away
+    syncWorkerConfig() {
+        if (!this.trainingWorker) return;
+        this.trainingWorker.batchSize = this.batchSize;
+        this.trainingWorker.updateConfig();
+    }
+
+    releaseWorker() {
+        if (this.trainingWorker) {
+            this.trainingWorker.terminate();
+            this.trainingWorker = null;
+        }
+    }
+
+    scheduleRender() {
+        if (this.renderPending) return;
+        this.renderPending = true;
+        requestAnimationFrame(() => {
+            this.renderPending = false;
+            this.updateAllVisualizers();
+        });
     }
 
     trainingLoop() {
@@ -1,6 +1,8 @@
 /**
  * CNN (Convolutional Neural Network) Engine
- * 2D convolution, pooling, and fully connected layers
+ * 2D convolution, pooling, and fully connected layers on flat tensors
+ * (tensor-kernels.js): im2col convolution, argmax max-pooling and full
+ * backpropagation through every layer
  */
 
 // ============================================
@@ -15,105 +17,64 @@ class Conv2D {
         this.stride = stride;
         this.padding = padding;
 
-        // Initialize filters: [outputChannels][inputChannels][kernelSize][kernelSize]
-        this.filters = [];
-        for (let o = 0; o < outputChannels; o++) {
-            const filter = [];
-            for (let i = 0; i < inputChannels; i++) {
-                const kernel = this.initKernel(kernelSize);
-                filter.push(kernel);
-            }
-            this.filters.push(filter);
-        }
+        // Filters as rows of [outputChannels x inputChannels·k·k] (im2col layout)
+        const limit = Math.sqrt(6 / (kernelSize * kernelSize * 2));
+        this.weights = Tensor.random([outputChannels, inputChannels * kernelSize * kernelSize], limit);
+        this.biases = new Tensor([outputChannels]);
 
-        this.biases = new Array(outputChannels).fill(0);
+        this.gradWeights = new Tensor(this.weights.shape);
+        this.gradBiases = new Tensor([outputChannels]);
 
-        // Cache
+        // Cache (workspace tensors, valid until the next forward)
+        this.workspace = new TensorWorkspace();
         this.lastInput = null;
         this.lastOutput = null;
+        this.lastCols = null;
     }
 
-    initKernel(size) {
-        const limit = Math.sqrt(6 / (size * size * 2));
-        const kernel = [];
-        for (let i = 0; i < size; i++) {
-            const row = [];
-            for (let j = 0; j < size; j++) {
-                row.push((Math.random() * 2 - 1) * limit);
-            }
-            kernel.push(row);
-        }
-        return kernel;
+    // Nested [outputChannels][inputChannels][k][k] copy of the filters
+    get filters() {
+        const k = this.kernelSize;
+        return this.weights.reshape([this.outputChannels, this.inputChannels, k, k]).toNested();
     }
 
-    // Pad input with zeros
-    pad(input, padding) {
-        if (padding === 0) return input;
-
-        const channels = input.length;
-        const h = input[0].length;
-        const w = input[0][0].length;
-
-        const padded = [];
-        for (let c = 0; c < channels; c++) {
-            const channel = [];
-            for (let i = 0; i < h + 2 * padding; i++) {
-                const row = [];
-                for (let j = 0; j < w + 2 * padding; j++) {
-                    if (i < padding || i >= h + padding || j < padding || j >= w + padding) {
-                        row.push(0);
-                    } else {
-                        row.push(input[c][i - padding][j - padding]);
-                    }
-                }
-                channel.push(row);
-            }
-            padded.push(channel);
-        }
-        return padded;
+    outputShape(inputShape) {
+        const [, h, w] = inputShape;
+        return [
+            this.outputChannels,
+            TensorKernels.convOutputSize(h, this.kernelSize, this.stride, this.padding),
+            TensorKernels.convOutputSize(w, this.kernelSize, this.stride, this.padding)
+        ];
     }
 
-    // Forward pass
+    // Forward pass: input Tensor [channels x height x width]
     forward(input) {
-        // input: [channels][height][width]
-        this.lastInput = input;
-
-        const paddedInput = this.pad(input, this.padding);
-        const inH = paddedInput[0].length;
-        const inW = paddedInput[0][0].length;
-
-        const outH = Math.floor((inH - this.kernelSize) / this.stride) + 1;
-        const outW = Math.floor((inW - this.kernelSize) / this.stride) + 1;
+        const [outC, outH, outW] = this.outputShape(input.shape);
+        const cols = this.workspace.get('cols', [this.weights.shape[1], outH * outW]);
+        const output = this.workspace.get('output', [outC, outH, outW]);
 
-        const output = [];
+        TensorKernels.conv2dForward(input, this.weights, this.biases,
+            this.kernelSize, this.stride, this.padding, cols, output);
 
-        for (let o = 0; o < this.outputChannels; o++) {
-            const channel = [];
-            for (let i = 0; i < outH; i++) {
-                const row = [];
-                for (let j = 0; j < outW; j++) {
-                    let sum = this.biases[o];
-
-                    // Convolve
-                    for (let c = 0; c < this.inputChannels; c++) {
-                        for (let ki = 0; ki < this.kernelSize; ki++) {
-                            for (let kj = 0; kj < this.kernelSize; kj++) {
-                                const ii = i * this.stride + ki;
-                                const jj = j * this.stride + kj;
-                                sum += paddedInput[c][ii][jj] * this.filters[o][c][ki][kj];
-                            }
-                        }
-                    }
+        this.lastInput = input;
+        this.lastCols = cols;
+        this.lastOutput = output;
+        return output;
+    }
 
-                    row.push(sum);
-                }
-                channel.push(row);
-            }
-            output.push(channel);
+    // Fills gradWeights/gradBiases; returns dInput only when requested
+    backward(dOutput, needInputGrad = false) {
+        let dCols = null;
+        let dInput = null;
+        if (needInputGrad) {
+            dCols = this.workspace.get('dCols', this.lastCols.shape);
+            dInput = this.workspace.get('dInput', this.lastInput.shape);
         }
 
-        this.lastOutput = output;
-        return output;
+        TensorKernels.conv2dBackward(dOutput, this.weights, this.lastCols,
+            this.kernelSize, this.stride, this.padding,
+            this.gradWeights, this.gradBiases, dCols, dInput);
+        return dInput;
     }
 }
 
@@ -126,63 +87,35 @@ class MaxPool2D {
         this.poolSize = poolSize;
         this.stride = stride;
 
+        this.workspace = new TensorWorkspace();
         this.lastInput = null;
         this.lastOutput = null;
+        // Flat input index of each output's maximum, reused by backward()
         this.lastMaxIndices = null;
     }
 
     forward(input) {
-        // input: [channels][height][width]
-        this.lastInput = input;
-
-        const channels = input.length;
-        const inH = input[0].length;
-        const inW = input[0][0].length;
-
+        // input: Tensor [channels x height x width]
+        const [channels, inH, inW] = input.shape;
         const outH = Math.floor((inH - this.poolSize) / this.stride) + 1;
         const outW = Math.floor((inW - this.poolSize) / this.stride) + 1;
 
-        const output = [];
-        const maxIndices = [];
-
-        for (let c = 0; c < channels; c++) {
-            const channel = [];
-            const indices = [];
-
-            for (let i = 0; i < outH; i++) {
-                const row = [];
-                const idxRow = [];
-
-                for (let j = 0; j < outW; j++) {
-                    let maxVal = -Infinity;
-                    let maxI = 0, maxJ = 0;
-
-                    for (let pi = 0; pi < this.poolSize; pi++) {
-                        for (let pj = 0; pj < this.poolSize; pj++) {
-                            const ii = i * this.stride + pi;
-                            const jj = j * this.stride + pj;
-                            if (input[c][ii][jj] > maxVal) {
-                                maxVal = input[c][ii][jj];
-                                maxI = ii;
-                                maxJ = jj;
-                            }
-                        }
-                    }
-
-                    row.push(maxVal);
-                    idxRow.push([maxI, maxJ]);
-                }
-                channel.push(row);
-                indices.push(idxRow);
-            }
-            output.push(channel);
-            maxIndices.push(indices);
+        const output = this.workspace.get('output', [channels, outH, outW]);
+        if (!this.lastMaxIndices || this.lastMaxIndices.length !== output.size) {
+            this.lastMaxIndices = new Int32Array(output.size);
         }
 
+        TensorKernels.maxPool2dForward(input, this.poolSize, this.stride, output, this.lastMaxIndices);
+
+        this.lastInput = input;
         this.lastOutput = output;
-        this.lastMaxIndices = maxIndices;
         return output;
     }
+
+    backward(dOutput) {
+        const dInput = this.workspace.get('dInput', this.lastInput.shape);
+        return TensorKernels.maxPool2dBackward(dOutput, this.lastMaxIndices, dInput);
+    }
 }
 
 // ============================================
@@ -190,7 +123,12 @@ class MaxPool2D {
 // ============================================
 
 function flatten(input) {
-    // input: [channels][height][width] -> [flat array]
+    // Tensor [channels x height x width] -> 1-D view of the same data
+    if (input instanceof Tensor) {
+        return input.reshape([input.size]);
+    }
+
+    // Nested [channels][height][width] -> [flat array]
     const flat = [];
     for (const channel of input) {
         for (const row of channel) {
@@ -214,20 +152,13 @@ class CNNNetwork {
         this.learningRate = config.learningRate || 0.01;
         this.optimizerName = config.optimizerName || 'adam';
 
-        // Conv layer: 1 input channel, 4 output channels, 3x3 kernel
-        this.conv1 = new Conv2D(1, 4, 3, 1, 1); // With padding to maintain size
-
-        // Pool layer: 2x2
-        this.pool1 = new MaxPool2D(2, 2);
-
         // Calculate flattened size after conv+pool
         const afterConv = inputSize; // Same due to padding
         const afterPool = Math.floor(afterConv / 2);
         this.flatSize = 4 * afterPool * afterPool;
 
-        // Dense layer
-        this.W_fc = this.initMatrix(numClasses, this.flatSize);
-        this.b_fc = new Array(numClasses).fill(0);
+        this.workspace = new TensorWorkspace();
+        this.buildLayers();
 
         // Optimizer
         this.optimizer = this.createOptimizer();
@@ -236,98 +167,48 @@ class CNNNetwork {
         this.epoch = 0;
         this.lossHistory = [];
 
-        // Cache
-        this.lastConvOutput = null;
-        this.lastPoolOutput = null;
-        this.lastFlat = null;
+        // Cache (tensors from the last forward pass)
+        this.convActivation = null;
+        this.poolActivation = null;
         this.lastOutput = null;
         this.lastPrediction = null;
+        this.nestedCache = {};
     }
 
-    initMatrix(rows, cols) {
-        const limit = Math.sqrt(6 / (rows + cols));
-        const matrix = [];
-        for (let i = 0; i < rows; i++) {
-            const row = [];
-            for (let j = 0; j < cols; j++) {
-                row.push((Math.random() * 2 - 1) * limit);
-            }
-            matrix.push(row);
-        }
-        return matrix;
+    buildLayers() {
+        // Conv layer: 1 input channel, 4 output channels, 3x3 kernel
+        this.conv1 = new Conv2D(1, 4, 3, 1, 1); // With padding to maintain size
+
+        // Pool layer: 2x2
+        this.pool1 = new MaxPool2D(2, 2);
+
+        // Dense layer
+        this.W_fc = Tensor.glorot(this.numClasses, this.flatSize);
+        this.b_fc = new Tensor([this.numClasses]);
+        this.gradW_fc = new Tensor(this.W_fc.shape);
     }
 
     createOptimizer() {
-        const lr = this.learningRate;
-
-        if (this.optimizerName === 'adam') {
-            let t = 0;
-            const beta1 = 0.9, beta2 = 0.999, epsilon = 1e-8;
-            const moments = new Map();
-
-            return {
-                type: 'adam',
-                incrementT: () => { t++; },
-                update: (mat, grad, key) => {
-                    if (!moments.has(key)) {
-                        moments.set(key, {
-                            m: mat.map(row => row.map(() => 0)),
-                            v: mat.map(row => row.map(() => 0))
-                        });
-                    }
-                    const mom = moments.get(key);
-                    const beta1Corr = 1 - Math.pow(beta1, t);
-                    const beta2Corr = 1 - Math.pow(beta2, t);
-
-                    for (let i = 0; i < mat.length; i++) {
-                        for (let j = 0; j < mat[i].length; j++) {
-                            mom.m[i][j] = beta1 * mom.m[i][j] + (1 - beta1) * grad[i][j];
-                            mom.v[i][j] = beta2 * mom.v[i][j] + (1 - beta2) * grad[i][j] ** 2;
-                            const mHat = mom.m[i][j] / beta1Corr;
-                            const vHat = mom.v[i][j] / beta2Corr;
-                            mat[i][j] -= lr * mHat / (Math.sqrt(vHat) + epsilon);
-                        }
-                    }
-                },
-                updateVector: (vec, grad, key) => {
-                    if (!moments.has(key)) {
-                        moments.set(key, { m: vec.map(() => 0), v: vec.map(() => 0) });
-                    }
-                    const mom = moments.get(key);
-                    const beta1Corr = 1 - Math.pow(beta1, t);
-                    const beta2Corr = 1 - Math.pow(beta2, t);
-
-                    for (let i = 0; i < vec.length; i++) {
-                        mom.m[i] = beta1 * mom.m[i] + (1 - beta1) * grad[i];
-                        mom.v[i] = beta2 * mom.v[i] + (1 - beta2) * grad[i] ** 2;
-                        const mHat = mom.m[i] / beta1Corr;
-                        const vHat = mom.v[i] / beta2Corr;
-                        vec[i] -= lr * mHat / (Math.sqrt(vHat) + epsilon);
-                    }
-                }
-            };
-        }
+        return TensorKernels.createOptimizer(this.optimizerName, this.learningRate);
+    }
 
-        return {
-            type: 'sgd',
-            incrementT: () => { },
-            update: (mat, grad) => {
-                for (let i = 0; i < mat.length; i++) {
-                    for (let j = 0; j < mat[i].length; j++) {
-                        mat[i][j] -= lr * grad[i][j];
-                    }
-                }
-            },
-            updateVector: (vec, grad) => {
-                for (let i = 0; i < vec.length; i++) {
-                    vec[i] -= lr * grad[i];
-                }
-            }
-        };
+    // Nested views for the visualizers, built on first access after a forward pass
+    get lastConvOutput() {
+        return this.nestedView('conv', this.convActivation);
     }
 
-    relu(x) {
-        return Math.max(0, x);
+    get lastPoolOutput() {
+        return this.nestedView('pool', this.poolActivation);
+    }
+
+    get lastFlat() {
+        return this.poolActivation ? Array.from(this.poolActivation.data) : null;
+    }
+
+    nestedView(key, tensor) {
+        if (!tensor) return null;
+        if (!this.nestedCache[key]) this.nestedCache[key] = tensor.toNested();
+        return this.nestedCache[key];
     }
 
     softmax(logits) {
@@ -337,45 +218,40 @@ class CNNNetwork {
         return exp.map(x => x / sum);
     }
 
-    forward(input) {
-        // input: 2D array [height][width] or [1][height][width]
-        let x;
-        if (input.length === this.inputSize) {
-            // 2D input, add channel dimension
-            x = [input];
-        } else {
-            x = input;
+    // Copy a 2D [height][width] or 3D [channels][height][width] input into a tensor
+    toInputTensor(input) {
+        if (input instanceof Tensor) {
+            return input.shape.length === 2 ? input.reshape([1, ...input.shape]) : input;
         }
+        const shape = Tensor.shapeOf(input);
+        if (shape.length === 2) shape.unshift(1);
+        return this.workspace.get('input', shape).copyFromNested(input);
+    }
+
+    forward(input) {
+        const x = this.toInputTensor(input);
 
         // Conv + ReLU
-        const conv1Out = this.conv1.forward(x);
-        const relu1Out = conv1Out.map(ch =>
-            ch.map(row => row.map(val => this.relu(val)))
-        );
-        this.lastConvOutput = relu1Out;
+        const conv1Out = TensorKernels.relu(this.conv1.forward(x));
+        this.convActivation = conv1Out;
 
         // Pool
-        const pool1Out = this.pool1.forward(relu1Out);
-        this.lastPoolOutput = pool1Out;
-
-        // Flatten
-        const flat = flatten(pool1Out);
-        this.lastFlat = flat;
+        const pool1Out = this.pool1.forward(conv1Out);
+        this.poolActivation = pool1Out;
 
-        // Dense
-        const logits = new Array(this.numClasses).fill(0);
+        // Dense on the flattened pool output
+        const logits = this.workspace.get('logits', [this.numClasses, 1]);
+        TensorKernels.matmul(this.W_fc, pool1Out.reshape([this.flatSize, 1]), logits);
         for (let i = 0; i < this.numClasses; i++) {
-            let sum = this.b_fc[i];
-            for (let j = 0; j < flat.length; j++) {
-                sum += this.W_fc[i][j] * flat[j];
-            }
-            logits[i] = sum;
+            logits.data[i] += this.b_fc.data[i];
         }
 
         // Softmax
-        const probs = this.softmax(logits);
+        const logitArray = Array.from(logits.data);
+        const probs = this.softmax(logitArray);
 
-        this.lastOutput = logits;
+        this.nestedCache = {};
+        this.lastOutput = logitArray;
         this.lastPrediction = probs;
 
         return probs;
@@ -388,23 +264,27 @@ class CNNNetwork {
         const loss = -Math.log(probs[label] + 1e-10);
 
         // Gradient of cross-entropy + softmax
-        const dLogits = probs.map((p, i) => i === label ? p - 1 : p);
-
-        // Update dense layer
-        this.optimizer.incrementT();
-
-        const gradW = this.W_fc.map(row => row.map(() => 0));
-        const gradB = new Array(this.numClasses).fill(0);
-
+        const dLogits = this.workspace.get('dLogits', [this.numClasses, 1]);
         for (let i = 0; i < this.numClasses; i++) {
-            gradB[i] = dLogits[i];
-            for (let j = 0; j < this.lastFlat.length; j++) {
-                gradW[i][j] = dLogits[i] * this.lastFlat[j];
-            }
+            dLogits.data[i] = i === label ? probs[i] - 1 : probs[i];
         }
 
-        this.optimizer.update(this.W_fc, gradW, 'W_fc');
-        this.optimizer.updateVector(this.b_fc, gradB, 'b_fc');
+        // Dense layer: dW = dLogits · flatᵀ, dFlat = Wᵀ · dLogits
+        const flat = this.poolActivation.reshape([this.flatSize, 1]);
+        TensorKernels.matmul(dLogits, flat, this.gradW_fc, false, true);
+        const dFlat = this.workspace.get('dFlat', [this.flatSize, 1]);
+        TensorKernels.matmul(this.W_fc, dLogits, dFlat, true, false);
+
+        // Pool (argmax routing) -> ReLU mask -> conv filters
+        const dConv = this.pool1.backward(dFlat.reshape(this.poolActivation.shape));
+        TensorKernels.reluBackward(dConv, this.convActivation);
+        this.conv1.backward(dConv);
+
+        this.optimizer.incrementT();
+        this.optimizer.update(this.W_fc, this.gradW_fc, 'W_fc');
+        this.optimizer.update(this.b_fc, dLogits, 'b_fc');
+        this.optimizer.update(this.conv1.weights, this.conv1.gradWeights, 'conv1_W');
+        this.optimizer.update(this.conv1.biases, this.conv1.gradBiases, 'conv1_b');
 
         return loss;
     }
@@ -426,26 +306,15 @@ class CNNNetwork {
     }
 
     getWeightStats() {
-        let count = 0;
-        for (const filter of this.conv1.filters) {
-            for (const channel of filter) {
-                for (const row of channel) {
-                    count += row.length;
-                }
-            }
-        }
-        for (const row of this.W_fc) {
-            count += row.length;
-        }
-        return { count };
+        return { count: this.conv1.weights.size + this.W_fc.size };
     }
 
     reinitialize() {
-        this.conv1 = new Conv2D(1, 4, 3, 1, 1);
-        this.pool1 = new MaxPool2D(2, 2);
-        this.W_fc = this.initMatrix(this.numClasses, this.flatSize);
-        this.b_fc = new Array(this.numClasses).fill(0);
+        this.buildLayers();
         this.optimizer = this.createOptimizer();
+        this.convActivation = null;
+        this.poolActivation = null;
+        this.nestedCache = {};
         this.epoch = 0;
         this.lossHistory = [];
     }
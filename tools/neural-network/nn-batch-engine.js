@@ -0,0 +1,546 @@
+/**
+ * Batched Training Engine
+ * Flat Float64Array weights/gradients, preallocated activation buffers and
+ * mini-batch forward/backward passes, plus a Web Worker training runner
+ */
+
+// ============================================
+// BATCH ENGINE
+// ============================================
+
+class BatchEngine {
+    constructor(network, batchSize = 32) {
+        this.network = network;
+        this.batchSize = Math.max(1, batchSize | 0);
+        this.optimizer = null;
+
+        const sizes = network.layerSizes;
+        this.layerCount = sizes.length - 1;
+
+        // Weights are row-major [outputSize x inputSize] per layer
+        this.weights = [];
+        this.biases = [];
+        this.weightGradients = [];
+        this.biasGradients = [];
+        for (let l = 0; l < this.layerCount; l++) {
+            this.weights.push(new Float64Array(sizes[l + 1] * sizes[l]));
+            this.biases.push(new Float64Array(sizes[l + 1]));
+            this.weightGradients.push(new Float64Array(sizes[l + 1] * sizes[l]));
+            this.biasGradients.push(new Float64Array(sizes[l + 1]));
+        }
+
+        // Packed training data (rebuilt only when the data arrays change)
+        this.dataInputs = null;
+        this.dataTargets = null;
+        this.dataRows = 0;
+        this.X = new Float64Array(0);
+        this.Y = new Float64Array(0);
+
+        // Grown on demand in trainEpochs()
+        this.allocateActivations(Math.min(this.batchSize, 256));
+    }
+
+    allocateActivations(rows) {
+        const sizes = this.network.layerSizes;
+        this.capacity = rows;
+
+        // activations[0] is a view into the packed inputs
+        this.activations = [null];
+        this.preActivations = [];
+        this.deltas = [];
+        this.dropoutMasks = [];
+        for (let l = 1; l < sizes.length; l++) {
+            this.activations.push(new Float64Array(rows * sizes[l]));
+            this.preActivations.push(new Float64Array(rows * sizes[l]));
+            this.deltas.push(new Float64Array(rows * sizes[l]));
+            this.dropoutMasks.push(l < sizes.length - 1 ? new Uint8Array(rows * sizes[l]) : null);
+        }
+    }
+
+    setBatchSize(size) {
+        this.batchSize = Math.max(1, size | 0);
+    }
+
+    // Copy nested network weights into flat buffers (picks up UI edits)
+    pullParameters() {
+        const net = this.network;
+        for (let l = 0; l < this.layerCount; l++) {
+            const W = this.weights[l];
+            const b = this.biases[l];
+            const rows = net.weights[l];
+            const inSize = net.layerSizes[l];
+            for (let j = 0; j < rows.length; j++) {
+                const row = rows[j];
+                const offset = j * inSize;
+                for (let k = 0; k < inSize; k++) {
+                    W[offset + k] = row[k];
+                }
+                b[j] = net.biases[l][j];
+            }
+        }
+    }
+
+    // Write flat buffers back into the nested arrays the visualizers read
+    pushParameters() {
+        const net = this.network;
+        for (let l = 0; l < this.layerCount; l++) {
+            writeNested(net.weights[l], this.weights[l], net.layerSizes[l + 1], net.layerSizes[l]);
+            const b = this.biases[l];
+            for (let j = 0; j < b.length; j++) {
+                net.biases[l][j] = b[j];
+            }
+        }
+    }
+
+    // Bind the network's optimizer to the flat buffers (new optimizer => fresh state)
+    ensureOptimizer() {
+        const optimizer = this.network.optimizer;
+        if (optimizer === this.optimizer) return;
+
+        optimizer.initializeFlat(this.weights.map((W, l) => ({
+            weights: W.length,
+            biases: this.biases[l].length
+        })));
+        this.optimizer = optimizer;
+    }
+
+    loadData(inputs, targets) {
+        if (inputs === this.dataInputs && targets === this.dataTargets && inputs.length === this.dataRows) {
+            return;
+        }
+
+        const sizes = this.network.layerSizes;
+        const inSize = sizes[0];
+        const outSize = sizes[sizes.length - 1];
+        const n = inputs.length;
+
+        if (this.X.length !== n * inSize) this.X = new Float64Array(n * inSize);
+        if (this.Y.length !== n * outSize) this.Y = new Float64Array(n * outSize);
+
+        for (let i = 0; i < n; i++) {
+            const input = inputs[i];
+            const target = targets[i];
+            if (Array.isArray(input)) {
+                for (let k = 0; k < inSize; k++) this.X[i * inSize + k] = input[k];
+            } else {
+                this.X[i * inSize] = input;
+            }
+            if (Array.isArray(target)) {
+                for (let k = 0; k < outSize; k++) this.Y[i * outSize + k] = target[k];
+            } else {
+                this.Y[i * outSize] = target;
+            }
+        }
+
+        this.dataInputs = inputs;
+        this.dataTargets = targets;
+        this.dataRows = n;
+    }
+
+    // Z = A W^T + b, A = f(Z) for a batch of `rows` samples
+    forwardBatch(rows, training) {
+        const net = this.network;
+        const sizes = net.layerSizes;
+        const activation = net.activation.fn;
+        const dropoutRate = training && net.isTraining ? net.dropoutRate : 0;
+        const keepScale = 1 / (1 - dropoutRate);
+
+        for (let l = 0; l < this.layerCount; l++) {
+            const inSize = sizes[l];
+            const outSize = sizes[l + 1];
+            const A = this.activations[l];
+            const W = this.weights[l];
+            const b = this.biases[l];
+            const Z = this.preActivations[l];
+            const out = this.activations[l + 1];
+            const mask = this.dropoutMasks[l];
+            const isOutput = l === this.layerCount - 1;
+
+            for (let r = 0; r < rows; r++) {
+                const aOffset = r * inSize;
+                const zOffset = r * outSize;
+                for (let j = 0; j < outSize; j++) {
+                    const wOffset = j * inSize;
+                    let sum = b[j];
+                    for (let k = 0; k < inSize; k++) {
+                        sum += A[aOffset + k] * W[wOffset + k];
+                    }
+                    Z[zOffset + j] = sum;
+
+                    if (isOutput) {
+                        out[zOffset + j] = sum; // Linear output
+                    } else if (dropoutRate > 0) {
+                        const dropped = Math.random() < dropoutRate;
+                        mask[zOffset + j] = dropped ? 1 : 0;
+                        out[zOffset + j] = dropped ? 0 : activation(sum) * keepScale;
+                    } else {
+                        mask[zOffset + j] = 0;
+                        out[zOffset + j] = activation(sum);
+                    }
+                }
+            }
+        }
+
+        return this.activations[this.layerCount];
+    }
+
+    // Batch-averaged gradients; returns the summed squared error of the batch
+    backwardBatch(rows, targetOffset) {
+        const net = this.network;
+        const sizes = net.layerSizes;
+        const derivative = net.activation.derivative;
+        const dropoutRate = net.isTraining ? net.dropoutRate : 0;
+        const keepScale = 1 / (1 - dropoutRate);
+        const outSize = sizes[sizes.length - 1];
+        const outputs = this.activations[this.layerCount];
+        const outDeltas = this.deltas[this.layerCount - 1];
+        const Y = this.Y;
+
+        // Output layer errors (linear output derivative is 1)
+        let sse = 0;
+        for (let i = 0; i < rows * outSize; i++) {
+            const e = outputs[i] - Y[targetOffset + i];
+            outDeltas[i] = e;
+            sse += e * e;
+        }
+
+        const invRows = 1 / rows;
+        for (let l = this.layerCount - 1; l >= 0; l--) {
+            const inSize = sizes[l];
+            const outSize = sizes[l + 1];
+            const D = this.deltas[l];
+            const A = this.activations[l];
+            const W = this.weights[l];
+            const gW = this.weightGradients[l];
+            const gb = this.biasGradients[l];
+
+            // gW = D^T A / rows, gb = colsum(D) / rows
+            gW.fill(0);
+            gb.fill(0);
+            for (let r = 0; r < rows; r++) {
+                const dOffset = r * outSize;
+                const aOffset = r * inSize;
+                for (let j = 0; j < outSize; j++) {
+                    const d = D[dOffset + j];
+                    if (d === 0) continue;
+                    gb[j] += d;
+                    const wOffset = j * inSize;
+                    for (let k = 0; k < inSize; k++) {
+                        gW[wOffset + k] += d * A[aOffset + k];
+                    }
+                }
+            }
+            for (let i = 0; i < gW.length; i++) gW[i] *= invRows;
+            for (let j = 0; j < outSize; j++) gb[j] *= invRows;
+
+            if (l === 0) break;
+
+            // D_prev = (D W) * f'(Z_prev)
+            const prev = this.deltas[l - 1];
+            const Zprev = this.preActivations[l - 1];
+            const mask = this.dropoutMasks[l - 1];
+            prev.fill(0, 0, rows * inSize);
+            for (let r = 0; r < rows; r++) {
+                const dOffset = r * outSize;
+                const pOffset = r * inSize;
+                for (let j = 0; j < outSize; j++) {
+                    const d = D[dOffset + j];
+                    if (d === 0) continue;
+                    const wOffset = j * inSize;
+                    for (let k = 0; k < inSize; k++) {
+                        prev[pOffset + k] += d * W[wOffset + k];
+                    }
+                }
+                for (let k = 0; k < inSize; k++) {
+                    const idx = pOffset + k;
+                    if (dropoutRate > 0) {
+                        if (mask[idx]) {
+                            prev[idx] = 0;
+                            continue;
+                        }
+                        // Undo the dropout scale to recover f(z) for the derivative
+                        const output = A[idx] / keepScale;
+                        prev[idx] *= derivative(Zprev[idx], output) * keepScale;
+                    } else {
+                        prev[idx] *= derivative(Zprev[idx], A[idx]);
+                    }
+                }
+            }
+        }
+
+        return sse;
+    }
+
+    // Train `epochs` full passes over the data; returns the last epoch's average loss
+    trainEpochs(inputs, targets, epochs = 1) {
+        const net = this.network;
+        const n = inputs.length;
+        if (n === 0) return 0;
+
+        const sizes = net.layerSizes;
+        const inSize = sizes[0];
+        const outSize = sizes[sizes.length - 1];
+        const batchSize = Math.min(this.batchSize, n);
+        if (batchSize > this.capacity) {
+            this.allocateActivations(batchSize);
+        }
+
+        this.loadData(inputs, targets);
+        this.pullParameters();
+        this.ensureOptimizer();
+
+        let avgLoss = 0;
+        let lastRows = 0;
+        for (let e = 0; e < epochs; e++) {
+            let totalLoss = 0;
+            for (let start = 0; start < n; start += batchSize) {
+                const rows = Math.min(batchSize, n - start);
+                this.activations[0] = this.X.subarray(start * inSize, (start + rows) * inSize);
+                this.forwardBatch(rows, true);
+                totalLoss += this.backwardBatch(rows, start * outSize);
+
+                for (let l = 0; l < this.layerCount; l++) {
+                    this.optimizer.updateFlat(
+                        this.weights[l],
+                        this.biases[l],
+                        this.weightGradients[l],
+                        this.biasGradients[l],
+                        l
+                    );
+                }
+                lastRows = rows;
+            }
+
+            avgLoss = totalLoss / n;
+            net.lossHistory.push(avgLoss);
+            net.epoch++;
+        }
+
+        this.pushParameters();
+        this.publishState(lastRows);
+
+        return avgLoss;
+    }
+
+    // Run the network over many inputs at once; returns a flat [n x outputs] array
+    predictBatch(inputs) {
+        const n = inputs.length;
+        const sizes = this.network.layerSizes;
+        const inSize = sizes[0];
+        const outSize = sizes[sizes.length - 1];
+        const result = new Float64Array(n * outSize);
+
+        this.loadData(inputs, inputs.map(() => 0));
+        this.pullParameters();
+        for (let start = 0; start < n; start += this.capacity) {
+            const rows = Math.min(this.capacity, n - start);
+            this.activations[0] = this.X.subarray(start * inSize, (start + rows) * inSize);
+            const out = this.forwardBatch(rows, false);
+            result.set(out.subarray(0, rows * outSize), start * outSize);
+        }
+        this.dataInputs = null;
+
+        return result;
+    }
+
+    // Expose the last batch in the shape the visualizers expect
+    publishState(rows) {
+        const net = this.network;
+        const sizes = net.layerSizes;
+        const last = rows - 1;
+
+        net.maxGradientMagnitude = 0;
+        net.layerGradientMagnitudes = [];
+        if (net.weightGradients.length !== this.layerCount) net.weightGradients = [];
+        if (net.biasGradients.length !== this.layerCount) net.biasGradients = [];
+
+        for (let l = 0; l < this.layerCount; l++) {
+            const gW = this.weightGradients[l];
+            if (!net.weightGradients[l]) net.weightGradients[l] = [];
+            writeNested(net.weightGradients[l], gW, sizes[l + 1], sizes[l]);
+            net.biasGradients[l] = Array.from(this.biasGradients[l]);
+
+            let layerSum = 0;
+            for (let i = 0; i < gW.length; i++) {
+                const mag = Math.abs(gW[i]);
+                layerSum += mag;
+                if (mag > net.maxGradientMagnitude) net.maxGradientMagnitude = mag;
+            }
+            net.layerGradientMagnitudes.push(gW.length > 0 ? layerSum / gW.length : 0);
+        }
+
+        if (last < 0) return;
+
+        net.deltaValues = this.deltas.map((D, l) =>
+            Array.from(D.subarray(last * sizes[l + 1], (last + 1) * sizes[l + 1]))
+        );
+        net.layerOutputs = this.activations.map((A, l) =>
+            Array.from(A.subarray(last * sizes[l], (last + 1) * sizes[l]))
+        );
+        net.preActivations = this.preActivations.map((Z, l) =>
+            Array.from(Z.subarray(last * sizes[l + 1], (last + 1) * sizes[l + 1]))
+        );
+        net.dropoutMasks = net.dropoutRate > 0
+            ? this.dropoutMasks.map((mask, l) => mask
+                ? Array.from(mask.subarray(last * sizes[l + 1], (last + 1) * sizes[l + 1]), m => m === 1)
+                : null)
+            : [];
+    }
+}
+
+// Copy a flat row-major matrix into a nested array, reusing existing rows
+function writeNested(nested, flat, rows, cols) {
+    for (let j = 0; j < rows; j++) {
+        let row = nested[j];
+        if (!row || row.length !== cols) {
+            row = nested[j] = new Array(cols);
+        }
+        const offset = j * cols;
+        for (let k = 0; k < cols; k++) {
+            row[k] = flat[offset + k];
+        }
+    }
+    nested.length = rows;
+}
+
+// ============================================
+// WORKER RUNNER
+// ============================================
+
+class TrainingWorker {
+    constructor(network, options = {}) {
+        this.network = network;
+        this.batchSize = options.batchSize || network.batchSize || 32;
+        this.reportEvery = options.reportEvery || 10;
+        this.scriptUrl = options.scriptUrl || 'nn-train-worker.js';
+        this.onProgress = options.onProgress || null;
+        this.onError = options.onError || null;
+
+        this.worker = null;
+        this.running = false;
+        this.signature = null;
+        this.syncedEpoch = -1;
+        // Tags each run so snapshots still in flight after stop() are dropped
+        this.runId = 0;
+    }
+
+    static isSupported() {
+        return typeof Worker !== 'undefined';
+    }
+
+    // Configuration the worker's network must share with ours
+    getSignature() {
+        const net = this.network;
+        return JSON.stringify([
+            net.layerSizes, net.activationName, net.optimizerName,
+            net.learningRate, net.dropoutRate, this.batchSize
+        ]);
+    }
+
+    start(inputs, targets, epochs = Infinity) {
+        if (!this.worker) {
+            this.worker = new Worker(this.scriptUrl);
+            this.worker.onmessage = (e) => this.handleMessage(e.data);
+            this.worker.onerror = (e) => {
+                this.terminate();
+                if (this.onError) this.onError(e);
+            };
+        }
+
+        const signature = this.getSignature();
+        if (signature !== this.signature || this.syncedEpoch !== this.network.epoch) {
+            // Fresh worker state (optimizer moments restart)
+            this.worker.postMessage({
+                type: 'init',
+                model: this.network.exportModel(),
+                batchSize: this.batchSize
+            });
+            this.signature = signature;
+        } else {
+            // Same run resumed: only sync weights in case they were edited,
+            // and the epoch in case a dropped snapshot had moved the worker on
+            this.worker.postMessage({
+                type: 'weights',
+                weights: this.network.weights,
+                biases: this.network.biases,
+                epoch: this.network.epoch
+            });
+        }
+
+        this.worker.postMessage({ type: 'data', inputs, targets });
+        this.worker.postMessage({ type: 'start', epochs, reportEvery: this.reportEvery, runId: ++this.runId });
+        this.running = true;
+    }
+
+    // Push batch size / optimizer / activation / dropout edits to a worker
+    // without restarting it. A new optimizer restarts its moments, as
+    // setOptimizer() does locally.
+    updateConfig() {
+        if (!this.worker || this.signature === null) return;
+
+        const net = this.network;
+        this.worker.postMessage({
+            type: 'config',
+            batchSize: this.batchSize,
+            optimizerName: net.optimizerName,
+            learningRate: net.learningRate,
+            activationName: net.activationName,
+            dropoutRate: net.dropoutRate
+        });
+        this.signature = this.getSignature();
+    }
+
+    stop() {
+        if (this.worker && this.running) {
+            this.worker.postMessage({ type: 'stop' });
+        }
+        this.running = false;
+        this.runId++;
+    }
+
+    terminate() {
+        if (this.worker) {
+            this.worker.terminate();
+            this.worker = null;
+        }
+        this.running = false;
+        this.signature = null;
+        this.runId++;
+    }
+
+    handleMessage(msg) {
+        // Snapshots from a stopped run would overwrite a reset or edited network
+        if (msg.type !== 'progress' || !this.running || msg.runId !== this.runId) return;
+        this.applySnapshot(msg);
+        this.syncedEpoch = this.network.epoch;
+        if (msg.done) this.running = false;
+        if (this.onProgress) this.onProgress(msg);
+    }
+
+    applySnapshot(msg) {
+        const net = this.network;
+        const sizes = net.layerSizes;
+
+        for (let l = 0; l < msg.weights.length; l++) {
+            writeNested(net.weights[l], msg.weights[l], sizes[l + 1], sizes[l]);
+            for (let j = 0; j < msg.biases[l].length; j++) {
+                net.biases[l][j] = msg.biases[l][j];
+            }
+            if (!net.weightGradients[l]) net.weightGradients[l] = [];
+            writeNested(net.weightGradients[l], msg.weightGradients[l], sizes[l + 1], sizes[l]);
+            net.biasGradients[l] = Array.from(msg.biasGradients[l]);
+        }
+
+        for (const loss of msg.losses) {
+            net.lossHistory.push(loss);
+        }
+        net.epoch = msg.epoch;
+        net.deltaValues = msg.deltaValues;
+        net.layerGradientMagnitudes = msg.layerGradientMagnitudes;
+        net.maxGradientMagnitude = msg.maxGradientMagnitude;
+    }
+}
+
+// Export for use in other files
+window.BatchEngine = BatchEngine;
+window.TrainingWorker = TrainingWorker;
@@ -234,6 +234,38 @@ class Optimizer {
     update(weights, biases, weightGradients, biasGradients, layerIndex) {
         // Override in subclasses
     }
+
+    // Flat (Float64Array) variant used by the batched engine.
+    // shapes: [{ weights: count, biases: count }] per layer
+    initializeFlat(shapes) {
+        this.flatState = shapes.map(shape => ({
+            w: this.createFlatBuffers(shape.weights),
+            b: this.createFlatBuffers(shape.biases)
+        }));
+    }
+
+    // Number of per-parameter state buffers the optimizer needs
+    get flatBufferCount() {
+        return 0;
+    }
+
+    createFlatBuffers(size) {
+        const buffers = [];
+        for (let i = 0; i < this.flatBufferCount; i++) {
+            buffers.push(new Float64Array(size));
+        }
+        return buffers;
+    }
+
+    updateFlat(weights, biases, weightGradients, biasGradients, layerIndex) {
+        const state = this.flatState[layerIndex];
+        this.stepFlat(weights, weightGradients, state.w);
+        this.stepFlat(biases, biasGradients, state.b);
+    }
+
+    stepFlat(params, grads, buffers) {
+        // Override in subclasses
+    }
 }
 
 class SGD extends Optimizer {
@@ -247,6 +279,13 @@ class SGD extends Optimizer {
             biases[i] -= this.learningRate * biasGradients[i];
         }
     }
+
+    stepFlat(params, grads) {
+        const lr = this.learningRate;
+        for (let i = 0; i < params.length; i++) {
+            params[i] -= lr * grads[i];
+        }
+    }
 }
 
 class Momentum extends Optimizer {
@@ -282,6 +321,19 @@ class Momentum extends Optimizer {
             biases[i] += this.velocityB[layerIndex][i];
         }
     }
+
+    get flatBufferCount() {
+        return 1;
+    }
+
+    stepFlat(params, grads, [velocity]) {
+        const lr = this.learningRate;
+        const mu = this.momentum;
+        for (let i = 0; i < params.length; i++) {
+            velocity[i] = mu * velocity[i] - lr * grads[i];
+            params[i] += velocity[i];
+        }
+    }
 }
 
 class RMSprop extends Optimizer {
@@ -320,6 +372,20 @@ class RMSprop extends Optimizer {
                 (Math.sqrt(this.cacheB[layerIndex][i]) + this.epsilon);
         }
     }
+
+    get flatBufferCount() {
+        return 1;
+    }
+
+    stepFlat(params, grads, [cache]) {
+        const lr = this.learningRate;
+        const decay = this.decay;
+        for (let i = 0; i < params.length; i++) {
+            const g = grads[i];
+            cache[i] = decay * cache[i] + (1 - decay) * g * g;
+            params[i] -= lr * g / (Math.sqrt(cache[i]) + this.epsilon);
+        }
+    }
 }
 
 class Adam extends Optimizer {
@@ -333,6 +399,7 @@ class Adam extends Optimizer {
         this.mB = [];
         this.vB = [];
         this.t = 0;
+        this.flatT = 0;
     }
 
     initialize(network) {
@@ -384,6 +451,37 @@ class Adam extends Optimizer {
             biases[i] -= this.learningRate * mHat / (Math.sqrt(vHat) + this.epsilon);
         }
     }
+
+    get flatBufferCount() {
+        return 2;
+    }
+
+    // The flat path keeps its own step count so it never bias-corrects the
+    // nested moment buffers (or vice versa) when the batch size switches
+    initializeFlat(shapes) {
+        super.initializeFlat(shapes);
+        this.flatT = 0;
+    }
+
+    updateFlat(weights, biases, weightGradients, biasGradients, layerIndex) {
+        if (layerIndex === 0) this.flatT++;
+        super.updateFlat(weights, biases, weightGradients, biasGradients, layerIndex);
+    }
+
+    stepFlat(params, grads, [m, v]) {
+        const b1 = this.beta1;
+        const b2 = this.beta2;
+        const beta1Corr = 1 - Math.pow(b1, this.flatT);
+        const beta2Corr = 1 - Math.pow(b2, this.flatT);
+        for (let i = 0; i < params.length; i++) {
+            const g = grads[i];
+            m[i] = b1 * m[i] + (1 - b1) * g;
+            v[i] = b2 * v[i] + (1 - b2) * g * g;
+            const mHat = m[i] / beta1Corr;
+            const vHat = v[i] / beta2Corr;
+            params[i] -= this.learningRate * mHat / (Math.sqrt(vHat) + this.epsilon);
+        }
+    }
 }
 
 class AdaGrad extends Optimizer {
@@ -417,6 +515,19 @@ class AdaGrad extends Optimizer {
                 (Math.sqrt(this.cacheB[layerIndex][i]) + this.epsilon);
         }
     }
+
+    get flatBufferCount() {
+        return 1;
+    }
+
+    stepFlat(params, grads, [cache]) {
+        const lr = this.learningRate;
+        for (let i = 0; i < params.length; i++) {
+            const g = grads[i];
+            cache[i] += g * g;
+            params[i] -= lr * g / (Math.sqrt(cache[i]) + this.epsilon);
+        }
+    }
 }
 
 class Nadam extends Optimizer {
@@ -430,6 +541,7 @@ class Nadam extends Optimizer {
         this.mB = [];
         this.vB = [];
         this.t = 0;
+        this.flatT = 0;
     }
 
     initialize(network) {
@@ -488,6 +600,36 @@ class Nadam extends Optimizer {
             biases[i] -= this.learningRate * mNesterov / (Math.sqrt(vHat) + this.epsilon);
         }
     }
+
+    get flatBufferCount() {
+        return 2;
+    }
+
+    initializeFlat(shapes) {
+        super.initializeFlat(shapes);
+        this.flatT = 0;
+    }
+
+    updateFlat(weights, biases, weightGradients, biasGradients, layerIndex) {
+        if (layerIndex === 0) this.flatT++;
+        super.updateFlat(weights, biases, weightGradients, biasGradients, layerIndex);
+    }
+
+    stepFlat(params, grads, [m, v]) {
+        const b1 = this.beta1;
+        const b2 = this.beta2;
+        const beta1Corr = 1 - Math.pow(b1, this.flatT);
+        const beta2Corr = 1 - Math.pow(b2, this.flatT);
+        for (let i = 0; i < params.length; i++) {
+            const g = grads[i];
+            m[i] = b1 * m[i] + (1 - b1) * g;
+            v[i] = b2 * v[i] + (1 - b2) * g * g;
+            const mHat = m[i] / beta1Corr;
+            const vHat = v[i] / beta2Corr;
+            const mNesterov = b1 * mHat + (1 - b1) * g / beta1Corr;
+            params[i] -= this.learningRate * mNesterov / (Math.sqrt(vHat) + this.epsilon);
+        }
+    }
 }
 
 // Optimizer factory
@@ -704,6 +846,10 @@ class NeuralNetwork {
         this.dropoutMasks = [];  // Boolean masks for each layer
         this.isTraining = true;  // Controls dropout behavior
 
+        // Mini-batch training (1 = per-sample SGD; >1 uses BatchEngine)
+        this.batchSize = 1;
+        this.batchEngine = null;
+
         // Training stats
         this.epoch = 0;
         this.lossHistory = [];
@@ -920,6 +1066,10 @@ class NeuralNetwork {
     }
 
     train(inputs, targets) {
+        if (this.batchSize > 1 && typeof BatchEngine !== 'undefined') {
+            return this.getBatchEngine().trainEpochs(inputs, targets, 1);
+        }
+
         let totalLoss = 0;
 
         for (let i = 0; i < inputs.length; i++) {
@@ -937,6 +1087,21 @@ class NeuralNetwork {
         return this.forward(input);
     }
 
+    // Lazily created flat-buffer engine shared by train() and the worker
+    getBatchEngine() {
+        if (!this.batchEngine) {
+            this.batchEngine = new BatchEngine(this, this.batchSize);
+        }
+        return this.batchEngine;
+    }
+
+    setBatchSize(size) {
+        this.batchSize = Math.max(1, parseInt(size) || 1);
+        if (this.batchEngine) {
+            this.batchEngine.setBatchSize(this.batchSize);
+        }
+    }
+
     // Get number of outputs
     getOutputCount() {
         return this.layerSizes[this.layerSizes.length - 1];
@@ -1020,6 +1185,7 @@ class NeuralNetwork {
             optimizerName: this.optimizerName,
             learningRate: this.learningRate,
             dropoutRate: this.dropoutRate,
+            batchSize: this.batchSize,
             weights: this.weights.map(layer => layer.map(neuron => [...neuron])),
             biases: this.biases.map(layer => [...layer]),
             initialWeights: this.initialWeights.map(layer => layer.map(neuron => [...neuron])),
@@ -1054,6 +1220,7 @@ class NeuralNetwork {
         network.epoch = json.epoch || 0;
         network.lossHistory = json.lossHistory ? [...json.lossHistory] : [];
         network.dropoutRate = json.dropoutRate || 0;
+        network.batchSize = json.batchSize || 1;
 
         return network;
     }
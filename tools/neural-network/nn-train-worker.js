@@ -0,0 +1,111 @@
+/**
+ * Neural Network Training Worker
+ * Runs BatchEngine epochs off the UI thread and posts back loss history
+ * and weight snapshots every `reportEvery` epochs
+ */
+
+// Engine files export onto `window`
+self.window = self;
+importScripts('nn-engine.js', 'nn-batch-engine.js');
+
+let network = null;
+let inputs = [];
+let targets = [];
+let running = false;
+let remaining = 0;
+let reportEvery = 10;
+let runId = 0;
+
+self.onmessage = (e) => {
+    const msg = e.data;
+
+    switch (msg.type) {
+        case 'init':
+            network = NeuralNetwork.importModel(msg.model);
+            network.setBatchSize(msg.batchSize);
+            break;
+
+        case 'weights':
+            network.weights = msg.weights;
+            network.biases = msg.biases;
+            network.epoch = msg.epoch;
+            break;
+
+        case 'config':
+            if (!network) break;
+            network.setBatchSize(msg.batchSize);
+            if (msg.optimizerName !== network.optimizerName || msg.learningRate !== network.learningRate) {
+                network.setOptimizer(msg.optimizerName, msg.learningRate);
+            }
+            network.setActivation(msg.activationName);
+            network.setDropoutRate(msg.dropoutRate);
+            break;
+
+        case 'data':
+            inputs = msg.inputs;
+            targets = msg.targets;
+            break;
+
+        case 'start':
+            remaining = msg.epochs;
+            reportEvery = Math.max(1, msg.reportEvery | 0);
+            running = true;
+            runId = msg.runId;
+            runChunk(runId);
+            break;
+
+        case 'stop':
+            running = false;
+            runId = -1;
+            break;
+    }
+};
+
+function runChunk(id) {
+    if (!running || !network || id !== runId) return;
+
+    const epochs = Math.min(reportEvery, remaining);
+    const historyStart = network.lossHistory.length;
+    network.getBatchEngine().trainEpochs(inputs, targets, epochs);
+    remaining -= epochs;
+
+    const done = remaining <= 0;
+    postSnapshot(id, network.lossHistory.slice(historyStart), done);
+    // Keep long runs from growing the worker's copy of the history
+    network.lossHistory.length = 0;
+
+    if (done) {
+        running = false;
+        return;
+    }
+    // Yield so 'stop' messages are processed between chunks
+    setTimeout(() => runChunk(id), 0);
+}
+
+function postSnapshot(id, losses, done) {
+    const engine = network.getBatchEngine();
+    const weights = engine.weights.map(W => W.slice());
+    const biases = engine.biases.map(b => b.slice());
+    const weightGradients = engine.weightGradients.map(g => g.slice());
+    const biasGradients = engine.biasGradients.map(g => g.slice());
+
+    const transfer = [];
+    for (const list of [weights, biases, weightGradients, biasGradients]) {
+        for (const buffer of list) transfer.push(buffer.buffer);
+    }
+
+    self.postMessage({
+        type: 'progress',
+        runId: id,
+        epoch: network.epoch,
+        losses,
+        done,
+        weights,
+        biases,
+        weightGradients,
+        biasGradients,
+        deltaValues: network.deltaValues,
+        layerGradientMagnitudes: network.layerGradientMagnitudes,
+        maxGradientMagnitude: network.maxGradientMagnitude
+    }, transfer);
+}
@@ -0,0 +1,587 @@
+/**
+ * Tensor Kernels
+ * Flat Float64Array tensors with shape/stride metadata and the kernels the
+ * CNN and Transformer engines share: cache-blocked matmul, im2col
+ * convolution, max-pool with argmax, fused scaled-dot-product attention and
+ * a flat-buffer optimizer (load before cnn-engine.js / transformer-engine.js)
+ */
+
+// ============================================
+// TENSOR
+// ============================================
+
+class Tensor {
+    constructor(shape, data = null) {
+        this.shape = Array.from(shape);
+        this.strides = Tensor.computeStrides(this.shape);
+        this.size = this.shape.reduce((a, b) => a * b, 1);
+        this.data = data || new Float64Array(this.size);
+        if (this.data.length < this.size) {
+            throw new Error(`Tensor data has ${this.data.length} elements, shape needs ${this.size}`);
+        }
+    }
+
+    // Row-major strides
+    static computeStrides(shape) {
+        const strides = new Array(shape.length);
+        let stride = 1;
+        for (let d = shape.length - 1; d >= 0; d--) {
+            strides[d] = stride;
+            stride *= shape[d];
+        }
+        return strides;
+    }
+
+    static shapeOf(nested) {
+        const shape = [];
+        let level = nested;
+        while (level && typeof level !== 'number' && level.length !== undefined) {
+            shape.push(level.length);
+            level = level[0];
+        }
+        return shape;
+    }
+
+    static fromNested(nested) {
+        return new Tensor(Tensor.shapeOf(nested)).copyFromNested(nested);
+    }
+
+    // Uniform in [-limit, limit]
+    static random(shape, limit) {
+        const t = new Tensor(shape);
+        for (let i = 0; i < t.size; i++) {
+            t.data[i] = (Math.random() * 2 - 1) * limit;
+        }
+        return t;
+    }
+
+    // Glorot-uniform [rows x cols] matrix, same range as the nested initMatrix helpers
+    static glorot(rows, cols) {
+        return Tensor.random([rows, cols], Math.sqrt(6 / (rows + cols)));
+    }
+
+    copyFromNested(nested) {
+        let i = 0;
+        const data = this.data;
+        const walk = (level) => {
+            if (typeof level === 'number') {
+                data[i++] = level;
+            } else {
+                for (let k = 0; k < level.length; k++) walk(level[k]);
+            }
+        };
+        walk(nested);
+        if (i !== this.size) {
+            throw new Error(`Nested array has ${i} elements, tensor expects ${this.size}`);
+        }
+        return this;
+    }
+
+    // Same data, new shape
+    reshape(shape) {
+        return new Tensor(shape, this.data);
+    }
+
+    offset(...index) {
+        let o = 0;
+        for (let d = 0; d < index.length; d++) o += index[d] * this.strides[d];
+        return o;
+    }
+
+    get(...index) {
+        return this.data[this.offset(...index)];
+    }
+
+    fill(value) {
+        this.data.fill(value, 0, this.size);
+        return this;
+    }
+
+    toNested() {
+        const build = (dim, base) => {
+            const out = new Array(this.shape[dim]);
+            if (dim === this.shape.length - 1) {
+                for (let i = 0; i < out.length; i++) out[i] = this.data[base + i];
+            } else {
+                for (let i = 0; i < out.length; i++) out[i] = build(dim + 1, base + i * this.strides[dim]);
+            }
+            return out;
+        };
+        return this.shape.length === 0 ? this.data[0] : build(0, 0);
+    }
+}
+
+// Named scratch tensors, reallocated only when the requested shape changes
+class TensorWorkspace {
+    constructor() {
+        this.buffers = new Map();
+    }
+
+    get(name, shape) {
+        const existing = this.buffers.get(name);
+        if (existing && existing.shape.length === shape.length &&
+            existing.shape.every((s, d) => s === shape[d])) {
+            return existing;
+        }
+        const tensor = new Tensor(shape);
+        this.buffers.set(name, tensor);
+        return tensor;
+    }
+
+    clear() {
+        this.buffers.clear();
+    }
+}
+
+// ============================================
+// KERNELS
+// ============================================
+
+const TensorKernels = {
+    // Tile sizes for the blocked matmul (rows of A, shared dim, columns of B)
+    BLOCK_I: 32,
+    BLOCK_K: 128,
+    BLOCK_J: 256,
+
+    /**
+     * C = op(A) · op(B) (+ C when accumulate), all 2-D row-major tensors.
+     * transA reads A as [k x m], transB reads B as [n x k].
+     */
+    matmul(A, B, C, transA = false, transB = false, accumulate = false) {
+        const m = transA ? A.shape[1] : A.shape[0];
+        const k = transA ? A.shape[0] : A.shape[1];
+        const n = transB ? B.shape[0] : B.shape[1];
+        const kB = transB ? B.shape[1] : B.shape[0];
+        if (k !== kB || C.shape[0] !== m || C.shape[1] !== n) {
+            throw new Error(`matmul shape mismatch: [${A.shape}]${transA ? 'ᵀ' : ''} · [${B.shape}]${transB ? 'ᵀ' : ''} -> [${C.shape}]`);
+        }
+        if (!accumulate) C.data.fill(0, 0, m * n);
+
+        if (transA && transB) {
+            throw new Error('matmul with both operands transposed is not supported');
+        } else if (transB) {
+            this.matmulNT(A.data, B.data, C.data, m, k, n);
+        } else if (transA) {
+            this.matmulTN(A.data, B.data, C.data, m, k, n);
+        } else {
+            this.matmulNN(A.data, B.data, C.data, m, k, n);
+        }
+        return C;
+    },
+
+    // C[m x n] += A[m x k] · B[k x n]; i-p-j order keeps the inner loop on contiguous rows
+    matmulNN(a, b, c, m, k, n) {
+        const BI = this.BLOCK_I, BK = this.BLOCK_K, BJ = this.BLOCK_J;
+        for (let j0 = 0; j0 < n; j0 += BJ) {
+            const jMax = Math.min(j0 + BJ, n);
+            for (let p0 = 0; p0 < k; p0 += BK) {
+                const pMax = Math.min(p0 + BK, k);
+                for (let i0 = 0; i0 < m; i0 += BI) {
+                    const iMax = Math.min(i0 + BI, m);
+                    for (let i = i0; i < iMax; i++) {
+                        const aRow = i * k;
+                        const cRow = i * n;
+                        for (let p = p0; p < pMax; p++) {
+                            const av = a[aRow + p];
+                            const bRow = p * n;
+                            for (let j = j0; j < jMax; j++) {
+                                c[cRow + j] += av * b[bRow + j];
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+
+    // C[m x n] += A[m x k] · B[n x k]ᵀ; row-by-row dot products
+    matmulNT(a, b, c, m, k, n) {
+        const BI = this.BLOCK_I, BJ = this.BLOCK_I;
+        for (let i0 = 0; i0 < m; i0 += BI) {
+            const iMax = Math.min(i0 + BI, m);
+            for (let j0 = 0; j0 < n; j0 += BJ) {
+                const jMax = Math.min(j0 + BJ, n);
+                for (let i = i0; i < iMax; i++) {
+                    const aRow = i * k;
+                    const cRow = i * n;
+                    for (let j = j0; j < jMax; j++) {
+                        const bRow = j * k;
+                        let sum = 0;
+                        for (let p = 0; p < k; p++) {
+                            sum += a[aRow + p] * b[bRow + p];
+                        }
+                        c[cRow + j] += sum;
+                    }
+                }
+            }
+        }
+    },
+
+    // C[m x n] += A[k x m]ᵀ · B[k x n]; rank-1 updates over the shared dimension
+    matmulTN(a, b, c, m, k, n) {
+        const BI = this.BLOCK_I, BJ = this.BLOCK_J;
+        for (let j0 = 0; j0 < n; j0 += BJ) {
+            const jMax = Math.min(j0 + BJ, n);
+            for (let i0 = 0; i0 < m; i0 += BI) {
+                const iMax = Math.min(i0 + BI, m);
+                for (let p = 0; p < k; p++) {
+                    const aRow = p * m;
+                    const bRow = p * n;
+                    for (let i = i0; i < iMax; i++) {
+                        const av = a[aRow + i];
+                        const cRow = i * n;
+                        for (let j = j0; j < jMax; j++) {
+                            c[cRow + j] += av * b[bRow + j];
+                        }
+                    }
+                }
+            }
+        }
+    },
+
+    // X[rows x cols] += bias broadcast over rows
+    addRowVector(X, bias) {
+        const [rows, cols] = X.shape;
+        const x = X.data, b = bias.data;
+        for (let i = 0; i < rows; i++) {
+            const row = i * cols;
+            for (let j = 0; j < cols; j++) x[row + j] += b[j];
+        }
+        return X;
+    },
+
+    // out[j] (+)= Σ_i X[i, j]
+    sumRows(X, out, accumulate = false) {
+        const [rows, cols] = X.shape;
+        const x = X.data, o = out.data;
+        if (!accumulate) o.fill(0, 0, cols);
+        for (let i = 0; i < rows; i++) {
+            const row = i * cols;
+            for (let j = 0; j < cols; j++) o[j] += x[row + j];
+        }
+        return out;
+    },
+
+    // In-place ReLU
+    relu(X) {
+        const x = X.data;
+        for (let i = 0; i < X.size; i++) {
+            if (x[i] < 0) x[i] = 0;
+        }
+        return X;
+    },
+
+    // dX *= (activation > 0), in place
+    reluBackward(dX, activation) {
+        const d = dX.data, a = activation.data;
+        for (let i = 0; i < dX.size; i++) {
+            if (a[i] <= 0) d[i] = 0;
+        }
+        return dX;
+    },
+
+    // Row-wise softmax with the row max subtracted (out may alias X)
+    softmaxRows(X, out = X) {
+        const [rows, cols] = X.shape;
+        const x = X.data, o = out.data;
+        for (let i = 0; i < rows; i++) {
+            const row = i * cols;
+            let max = -Infinity;
+            for (let j = 0; j < cols; j++) if (x[row + j] > max) max = x[row + j];
+            let sum = 0;
+            for (let j = 0; j < cols; j++) {
+                const e = Math.exp(x[row + j] - max);
+                o[row + j] = e;
+                sum += e;
+            }
+            const inv = 1 / sum;
+            for (let j = 0; j < cols; j++) o[row + j] *= inv;
+        }
+        return out;
+    },
+
+    // ============================================
+    // CONVOLUTION
+    // ============================================
+
+    convOutputSize(size, kernel, stride, padding) {
+        return Math.floor((size + 2 * padding - kernel) / stride) + 1;
+    },
+
+    /**
+     * Unfold input [C x H x W] into cols [C·k·k x outH·outW]; row r = (c·k + ki)·k + kj.
+     * Out-of-bounds (padding) taps are written as 0.
+     */
+    im2col(input, kernel, stride, padding, cols) {
+        const [C, H, W] = input.shape;
+        const outH = this.convOutputSize(H, kernel, stride, padding);
+        const outW = this.convOutputSize(W, kernel, stride, padding);
+        const P = outH * outW;
+        const x = input.data, col = cols.data;
+
+        for (let c = 0; c < C; c++) {
+            for (let ki = 0; ki < kernel; ki++) {
+                for (let kj = 0; kj < kernel; kj++) {
+                    const rowBase = ((c * kernel + ki) * kernel + kj) * P;
+                    for (let oi = 0; oi < outH; oi++) {
+                        const ii = oi * stride + ki - padding;
+                        const dst = rowBase + oi * outW;
+                        if (ii < 0 || ii >= H) {
+                            col.fill(0, dst, dst + outW);
+                            continue;
+                        }
+                        const src = (c * H + ii) * W;
+                        for (let oj = 0; oj < outW; oj++) {
+                            const jj = oj * stride + kj - padding;
+                            col[dst + oj] = jj >= 0 && jj < W ? x[src + jj] : 0;
+                        }
+                    }
+                }
+            }
+        }
+        return cols;
+    },
+
+    // Fold cols back into dInput [C x H x W], summing overlapping taps (adjoint of im2col)
+    col2im(cols, kernel, stride, padding, dInput) {
+        const [C, H, W] = dInput.shape;
+        const outH = this.convOutputSize(H, kernel, stride, padding);
+        const outW = this.convOutputSize(W, kernel, stride, padding);
+        const P = outH * outW;
+        const dx = dInput.data, col = cols.data;
+        dInput.fill(0);
+
+        for (let c = 0; c < C; c++) {
+            for (let ki = 0; ki < kernel; ki++) {
+                for (let kj = 0; kj < kernel; kj++) {
+                    const rowBase = ((c * kernel + ki) * kernel + kj) * P;
+                    for (let oi = 0; oi < outH; oi++) {
+                        const ii = oi * stride + ki - padding;
+                        if (ii < 0 || ii >= H) continue;
+                        const src = rowBase + oi * outW;
+                        const dst = (c * H + ii) * W;
+                        for (let oj = 0; oj < outW; oj++) {
+                            const jj = oj * stride + kj - padding;
+                            if (jj >= 0 && jj < W) dx[dst + jj] += col[src + oj];
+                        }
+                    }
+                }
+            }
+        }
+        return dInput;
+    },
+
+    // output [O x outH x outW] = weights [O x C·k·k] · im2col(input) + bias
+    conv2dForward(input, weights, bias, kernel, stride, padding, cols, output) {
+        this.im2col(input, kernel, stride, padding, cols);
+        const O = weights.shape[0];
+        const P = cols.shape[1];
+        this.matmul(weights, cols, output.reshape([O, P]));
+
+        const out = output.data, b = bias.data;
+        for (let o = 0; o < O; o++) {
+            const base = o * P;
+            for (let q = 0; q < P; q++) out[base + q] += b[o];
+        }
+        return output;
+    },
+
+    /**
+     * Gradients for conv2dForward given dOutput [O x outH x outW] and the cols
+     * from the forward pass. dInput (optional) also needs a dCols scratch tensor.
+     */
+    conv2dBackward(dOutput, weights, cols, kernel, stride, padding, dWeights, dBias, dCols = null, dInput = null) {
+        const O = weights.shape[0];
+        const P = cols.shape[1];
+        const dOut = dOutput.reshape([O, P]);
+
+        // dW = dOut · colsᵀ, db = row sums of dOut
+        this.matmul(dOut, cols, dWeights, false, true);
+        const d = dOut.data, db = dBias.data;
+        for (let o = 0; o < O; o++) {
+            let sum = 0;
+            const base = o * P;
+            for (let q = 0; q < P; q++) sum += d[base + q];
+            db[o] = sum;
+        }
+
+        if (dInput && dCols) {
+            this.matmul(weights, dOut, dCols, true, false);
+            this.col2im(dCols, kernel, stride, padding, dInput);
+        }
+    },
+
+    // ============================================
+    // POOLING
+    // ============================================
+
+    // argmax[i] is the flat input index that produced output[i] (first max wins)
+    maxPool2dForward(input, size, stride, output, argmax) {
+        const [C, H, W] = input.shape;
+        const outH = output.shape[1];
+        const outW = output.shape[2];
+        const x = input.data, out = output.data;
+
+        let o = 0;
+        for (let c = 0; c < C; c++) {
+            const plane = c * H * W;
+            for (let i = 0; i < outH; i++) {
+                for (let j = 0; j < outW; j++) {
+                    let maxVal = -Infinity;
+                    let maxIdx = plane + (i * stride) * W + j * stride;
+                    for (let pi = 0; pi < size; pi++) {
+                        const row = plane + (i * stride + pi) * W + j * stride;
+                        for (let pj = 0; pj < size; pj++) {
+                            if (x[row + pj] > maxVal) {
+                                maxVal = x[row + pj];
+                                maxIdx = row + pj;
+                            }
+                        }
+                    }
+                    out[o] = maxVal;
+                    argmax[o++] = maxIdx;
+                }
+            }
+        }
+        return output;
+    },
+
+    // Route each output gradient to the input element recorded in argmax
+    maxPool2dBackward(dOutput, argmax, dInput) {
+        dInput.fill(0);
+        const d = dOutput.data, dx = dInput.data;
+        for (let o = 0; o < dOutput.size; o++) {
+            dx[argmax[o]] += d[o];
+        }
+        return dInput;
+    },
+
+    // ============================================
+    // ATTENTION
+    // ============================================
+
+    /**
+     * Fused softmax(Q·Kᵀ·scale)·V for Q [S x d], K [T x d], V [T x dv].
+     * One score row is formed, normalized (max-subtracted) and applied to V
+     * before moving on; the weights are kept in weights [S x T] for backward.
+     */
+    attentionForward(Q, K, V, scale, weights, context) {
+        const [S, d] = Q.shape;
+        const T = K.shape[0];
+        const dv = V.shape[1];
+        const q = Q.data, k = K.data, v = V.data, w = weights.data, ctx = context.data;
+        context.fill(0);
+
+        for (let i = 0; i < S; i++) {
+            const qRow = i * d;
+            const wRow = i * T;
+            let max = -Infinity;
+            for (let j = 0; j < T; j++) {
+                const kRow = j * d;
+                let dot = 0;
+                for (let p = 0; p < d; p++) dot += q[qRow + p] * k[kRow + p];
+                const s = dot * scale;
+                w[wRow + j] = s;
+                if (s > max) max = s;
+            }
+
+            let sum = 0;
+            for (let j = 0; j < T; j++) {
+                const e = Math.exp(w[wRow + j] - max);
+                w[wRow + j] = e;
+                sum += e;
+            }
+            const inv = 1 / sum;
+
+            const cRow = i * dv;
+            for (let j = 0; j < T; j++) {
+                const a = w[wRow + j] * inv;
+                w[wRow + j] = a;
+                const vRow = j * dv;
+                for (let p = 0; p < dv; p++) ctx[cRow + p] += a * v[vRow + p];
+            }
+        }
+        return context;
+    },
+
+    /**
+     * Backward of attentionForward. dScores [S x T] is scratch; writes dQ, dK, dV.
+     * Softmax Jacobian per row: dS = A ⊙ (dA − Σ_j dA·A).
+     */
+    attentionBackward(dContext, Q, K, V, weights, scale, dScores, dQ, dK, dV) {
+        const [S, T] = weights.shape;
+        // dV = Aᵀ · dContext, dA = dContext · Vᵀ
+        this.matmul(weights, dContext, dV, true, false);
+        this.matmul(dContext, V, dScores, false, true);
+
+        const w = weights.data, ds = dScores.data;
+        for (let i = 0; i < S; i++) {
+            const row = i * T;
+            let dot = 0;
+            for (let j = 0; j < T; j++) dot += ds[row + j] * w[row + j];
+            for (let j = 0; j < T; j++) ds[row + j] = w[row + j] * (ds[row + j] - dot) * scale;
+        }
+
+        // Scores = scale · Q · Kᵀ
+        this.matmul(dScores, K, dQ);
+        this.matmul(dScores, Q, dK, true, false);
+    },
+
+    // ============================================
+    // OPTIMIZER
+    // ============================================
+
+    /**
+     * Adam or SGD over flat parameter buffers; moments are keyed per parameter.
+     * Call incrementT() once per step, then update(params, grads, key) per tensor.
+     */
+    createOptimizer(name, learningRate) {
+        const lr = learningRate;
+
+        if (name === 'adam') {
+            let t = 0;
+            const beta1 = 0.9, beta2 = 0.999, epsilon = 1e-8;
+            const moments = new Map();
+
+            return {
+                type: 'adam',
+                incrementT: () => { t++; },
+                update: (params, grads, key) => {
+                    const p = params.data || params;
+                    const g = grads.data || grads;
+                    if (!moments.has(key)) {
+                        moments.set(key, { m: new Float64Array(p.length), v: new Float64Array(p.length) });
+                    }
+                    const { m, v } = moments.get(key);
+                    const beta1Corr = 1 - Math.pow(beta1, t);
+                    const beta2Corr = 1 - Math.pow(beta2, t);
+
+                    for (let i = 0; i < p.length; i++) {
+                        m[i] = beta1 * m[i] + (1 - beta1) * g[i];
+                        v[i] = beta2 * v[i] + (1 - beta2) * g[i] * g[i];
+                        const mHat = m[i] / beta1Corr;
+                        const vHat = v[i] / beta2Corr;
+                        p[i] -= lr * mHat / (Math.sqrt(vHat) + epsilon);
+                    }
+                }
+            };
+        }
+
+        return {
+            type: 'sgd',
+            incrementT: () => { },
+            update: (params, grads) => {
+                const p = params.data || params;
+                const g = grads.data || grads;
+                for (let i = 0; i < p.length; i++) {
+                    p[i] -= lr * g[i];
+                }
+            }
+        };
+    }
+};
+
+// Export
+window.Tensor = Tensor;
+window.TensorWorkspace = TensorWorkspace;
+window.TensorKernels = TensorKernels;
@@ -1,6 +1,7 @@
 /**
  * Transformer Engine
- * Single-head self-attention implementation for sequence processing
+ * Single-head self-attention implementation for sequence processing, on
+ * flat tensors (tensor-kernels.js) with fused attention and full backprop
  */
 
 // ============================================
@@ -12,112 +13,89 @@ class SelfAttention {
         this.embedDim = embedDim;
 
         // Query, Key, Value projection matrices
-        this.W_q = this.initMatrix(embedDim, embedDim);
-        this.W_k = this.initMatrix(embedDim, embedDim);
-        this.W_v = this.initMatrix(embedDim, embedDim);
+        this.W_q = Tensor.glorot(embedDim, embedDim);
+        this.W_k = Tensor.glorot(embedDim, embedDim);
+        this.W_v = Tensor.glorot(embedDim, embedDim);
 
         // Output projection
-        this.W_o = this.initMatrix(embedDim, embedDim);
+        this.W_o = Tensor.glorot(embedDim, embedDim);
 
-        // Cache for visualization
-        this.lastAttentionWeights = null;
-    }
-
-    initMatrix(rows, cols) {
-        const limit = Math.sqrt(6 / (rows + cols));
-        const matrix = [];
-        for (let i = 0; i < rows; i++) {
-            const row = [];
-            for (let j = 0; j < cols; j++) {
-                row.push((Math.random() * 2 - 1) * limit);
-            }
-            matrix.push(row);
-        }
-        return matrix;
-    }
-
-    // Matrix multiplication: A (m x n) * B (n x p) = C (m x p)
-    matmul(A, B) {
-        const m = A.length;
-        const n = A[0].length;
-        const p = B[0].length;
-
-        const C = [];
-        for (let i = 0; i < m; i++) {
-            const row = [];
-            for (let j = 0; j < p; j++) {
-                let sum = 0;
-                for (let k = 0; k < n; k++) {
-                    sum += A[i][k] * B[k][j];
-                }
-                row.push(sum);
-            }
-            C.push(row);
-        }
-        return C;
-    }
+        this.grads = {
+            W_q: new Tensor([embedDim, embedDim]),
+            W_k: new Tensor([embedDim, embedDim]),
+            W_v: new Tensor([embedDim, embedDim]),
+            W_o: new Tensor([embedDim, embedDim])
+        };
 
-    // Transpose matrix
-    transpose(A) {
-        const rows = A.length;
-        const cols = A[0].length;
-        const T = [];
-        for (let j = 0; j < cols; j++) {
-            const row = [];
-            for (let i = 0; i < rows; i++) {
-                row.push(A[i][j]);
-            }
-            T.push(row);
-        }
-        return T;
+        // Cache for backward and visualization (workspace tensors)
+        this.workspace = new TensorWorkspace();
+        this.lastInput = null;
+        this.attentionTensor = null;
+        this.nestedWeights = null;
     }
 
-    // Softmax over rows
-    softmax(scores) {
-        const result = [];
-        for (let i = 0; i < scores.length; i++) {
-            const row = scores[i];
-            const maxVal = Math.max(...row);
-            const exp = row.map(x => Math.exp(x - maxVal));
-            const sum = exp.reduce((a, b) => a + b, 0);
-            result.push(exp.map(x => x / sum));
-        }
-        return result;
+    // Nested [seqLen][seqLen] copy for the heatmap, built on first access
+    get lastAttentionWeights() {
+        if (!this.attentionTensor) return null;
+        if (!this.nestedWeights) this.nestedWeights = this.attentionTensor.toNested();
+        return this.nestedWeights;
     }
 
     // Forward pass
-    // input: (seqLen x embedDim)
+    // input: Tensor (seqLen x embedDim)
     forward(input) {
-        const seqLen = input.length;
+        const seqLen = input.shape[0];
         const d_k = this.embedDim;
+        const ws = this.workspace;
+        const shape = [seqLen, d_k];
 
-        // Project to Q, K, V
-        const Q = this.matmul(input, this.transpose(this.W_q));
-        const K = this.matmul(input, this.transpose(this.W_k));
-        const V = this.matmul(input, this.transpose(this.W_v));
+        // Project to Q, K, V (x · Wᵀ per row)
+        const Q = TensorKernels.matmul(input, this.W_q, ws.get('Q', shape), false, true);
+        const K = TensorKernels.matmul(input, this.W_k, ws.get('K', shape), false, true);
+        const V = TensorKernels.matmul(input, this.W_v, ws.get('V', shape), false, true);
 
-        // Scaled dot-product attention
-        const scores = this.matmul(Q, this.transpose(K));
-        const scaleFactor = Math.sqrt(d_k);
+        // Scaled dot-product attention, softmax fused per query row
+        const attentionWeights = ws.get('weights', [seqLen, seqLen]);
+        const context = ws.get('context', shape);
+        TensorKernels.attentionForward(Q, K, V, 1 / Math.sqrt(d_k), attentionWeights, context);
 
-        // Scale scores
-        for (let i = 0; i < scores.length; i++) {
-            for (let j = 0; j < scores[i].length; j++) {
-                scores[i][j] /= scaleFactor;
-            }
-        }
+        // Output projection
+        const output = TensorKernels.matmul(context, this.W_o, ws.get('output', shape), false, true);
 
-        // Apply softmax to get attention weights
-        const attentionWeights = this.softmax(scores);
-        this.lastAttentionWeights = attentionWeights;
+        this.lastInput = input;
+        this.attentionTensor = attentionWeights;
+        this.nestedWeights = null;
 
-        // Apply attention to values
-        const context = this.matmul(attentionWeights, V);
+        return { output, attentionWeights };
+    }
 
-        // Output projection
-        const output = this.matmul(context, this.transpose(this.W_o));
+    // Fills this.grads from dOutput and returns dInput (valid until the next call)
+    backward(dOutput) {
+        const ws = this.workspace;
+        const input = this.lastInput;
+        const shape = input.shape;
+        const Q = ws.get('Q', shape), K = ws.get('K', shape), V = ws.get('V', shape);
+        const context = ws.get('context', shape);
+        const mm = TensorKernels.matmul.bind(TensorKernels);
 
-        return { output, attentionWeights };
+        // Output projection
+        mm(dOutput, context, this.grads.W_o, true, false);
+        const dContext = mm(dOutput, this.W_o, ws.get('dContext', shape));
+
+        // Attention
+        const dQ = ws.get('dQ', shape), dK = ws.get('dK', shape), dV = ws.get('dV', shape);
+        TensorKernels.attentionBackward(dContext, Q, K, V, this.attentionTensor, 1 / Math.sqrt(this.embedDim),
+            ws.get('dScores', this.attentionTensor.shape), dQ, dK, dV);
+
+        // Projections
+        mm(dQ, input, this.grads.W_q, true, false);
+        mm(dK, input, this.grads.W_k, true, false);
+        mm(dV, input, this.grads.W_v, true, false);
+
+        const dInput = mm(dQ, this.W_q, ws.get('dInput', shape));
+        mm(dK, this.W_k, dInput, false, false, true);
+        mm(dV, this.W_v, dInput, false, false, true);
+        return dInput;
     }
 }
 
@@ -154,21 +132,7 @@ class TransformerNetwork {
         this.learningRate = config.learningRate || 0.01;
         this.optimizerName = config.optimizerName || 'adam';
 
-        // Input embedding
-        this.W_embed = this.initMatrix(embedDim, inputSize);
-
-        // Self-attention layer
-        this.attention = new SelfAttention(embedDim);
-
-        // Feed-forward network
-        this.W_ff1 = this.initMatrix(embedDim * 2, embedDim);
-        this.b_ff1 = new Array(embedDim * 2).fill(0);
-        this.W_ff2 = this.initMatrix(embedDim, embedDim * 2);
-        this.b_ff2 = new Array(embedDim).fill(0);
-
-        // Output projection
-        this.W_out = this.initMatrix(outputSize, embedDim);
-        this.b_out = new Array(outputSize).fill(0);
+        this.initParameters();
 
         // Optimizer
         this.optimizer = this.createOptimizer();
@@ -179,207 +143,162 @@ class TransformerNetwork {
 
         // Cache
         this.lastOutputs = [];
-        this.lastAttentionWeights = null;
-        this.lastEmbeddings = null;
+        this.embeddingTensor = null;
     }
 
-    initMatrix(rows, cols) {
-        const limit = Math.sqrt(6 / (rows + cols));
-        const matrix = [];
-        for (let i = 0; i < rows; i++) {
-            const row = [];
-            for (let j = 0; j < cols; j++) {
-                row.push((Math.random() * 2 - 1) * limit);
-            }
-            matrix.push(row);
+    initParameters() {
+        const E = this.embedDim;
+
+        // Input embedding
+        this.W_embed = Tensor.glorot(E, this.inputSize);
+
+        // Self-attention layer
+        this.attention = new SelfAttention(E);
+
+        // Feed-forward network
+        this.W_ff1 = Tensor.glorot(E * 2, E);
+        this.b_ff1 = new Tensor([E * 2]);
+        this.W_ff2 = Tensor.glorot(E, E * 2);
+        this.b_ff2 = new Tensor([E]);
+
+        // Output projection
+        this.W_out = Tensor.glorot(this.outputSize, E);
+        this.b_out = new Tensor([this.outputSize]);
+
+        // Gradients share the parameter names
+        this.grads = {};
+        for (const name of ['W_embed', 'W_ff1', 'b_ff1', 'W_ff2', 'b_ff2', 'W_out', 'b_out']) {
+            this.grads[name] = new Tensor(this[name].shape);
         }
-        return matrix;
+
+        this.workspace = new TensorWorkspace();
+        this.positionalEncoding = null;
     }
 
     createOptimizer() {
-        const lr = this.learningRate;
-
-        if (this.optimizerName === 'adam') {
-            let t = 0;
-            const beta1 = 0.9, beta2 = 0.999, epsilon = 1e-8;
-            const moments = new Map();
-
-            return {
-                type: 'adam',
-                incrementT: () => { t++; },
-                update: (mat, grad, key) => {
-                    if (!moments.has(key)) {
-                        moments.set(key, {
-                            m: mat.map(row => row.map(() => 0)),
-                            v: mat.map(row => row.map(() => 0))
-                        });
-                    }
-                    const mom = moments.get(key);
-                    const beta1Corr = 1 - Math.pow(beta1, t);
-                    const beta2Corr = 1 - Math.pow(beta2, t);
-
-                    for (let i = 0; i < mat.length; i++) {
-                        for (let j = 0; j < mat[i].length; j++) {
-                            mom.m[i][j] = beta1 * mom.m[i][j] + (1 - beta1) * grad[i][j];
-                            mom.v[i][j] = beta2 * mom.v[i][j] + (1 - beta2) * grad[i][j] ** 2;
-                            const mHat = mom.m[i][j] / beta1Corr;
-                            const vHat = mom.v[i][j] / beta2Corr;
-                            mat[i][j] -= lr * mHat / (Math.sqrt(vHat) + epsilon);
-                        }
-                    }
-                },
-                updateVector: (vec, grad, key) => {
-                    if (!moments.has(key)) {
-                        moments.set(key, { m: vec.map(() => 0), v: vec.map(() => 0) });
-                    }
-                    const mom = moments.get(key);
-                    const beta1Corr = 1 - Math.pow(beta1, t);
-                    const beta2Corr = 1 - Math.pow(beta2, t);
-
-                    for (let i = 0; i < vec.length; i++) {
-                        mom.m[i] = beta1 * mom.m[i] + (1 - beta1) * grad[i];
-                        mom.v[i] = beta2 * mom.v[i] + (1 - beta2) * grad[i] ** 2;
-                        const mHat = mom.m[i] / beta1Corr;
-                        const vHat = mom.v[i] / beta2Corr;
-                        vec[i] -= lr * mHat / (Math.sqrt(vHat) + epsilon);
-                    }
-                }
-            };
-        }
+        return TensorKernels.createOptimizer(this.optimizerName, this.learningRate);
+    }
 
-        return {
-            type: 'sgd',
-            incrementT: () => { },
-            update: (mat, grad) => {
-                for (let i = 0; i < mat.length; i++) {
-                    for (let j = 0; j < mat[i].length; j++) {
-                        mat[i][j] -= lr * grad[i][j];
-                    }
-                }
-            },
-            updateVector: (vec, grad) => {
-                for (let i = 0; i < vec.length; i++) {
-                    vec[i] -= lr * grad[i];
-                }
-            }
-        };
+    get lastAttentionWeights() {
+        return this.attention.lastAttentionWeights;
+    }
+
+    get lastEmbeddings() {
+        return this.embeddingTensor ? this.embeddingTensor.toNested() : null;
     }
 
-    relu(x) {
-        return Math.max(0, x);
+    getPositionalEncodingTensor(seqLen) {
+        const pe = this.positionalEncoding;
+        if (!pe || pe.shape[0] !== seqLen || pe.shape[1] !== this.embedDim) {
+            this.positionalEncoding = Tensor.fromNested(getPositionalEncoding(seqLen, this.embedDim));
+        }
+        return this.positionalEncoding;
     }
 
     forward(sequence) {
         const seqLen = sequence.length;
+        const E = this.embedDim;
+        const ws = this.workspace;
+        const mm = TensorKernels.matmul.bind(TensorKernels);
 
-        // Embed input
-        const embedded = [];
+        // Pack inputs (scalars or vectors per step)
+        const X = ws.get('input', [seqLen, this.inputSize]);
         for (let t = 0; t < seqLen; t++) {
-            const x = Array.isArray(sequence[t]) ? sequence[t] : [sequence[t]];
-            const emb = new Array(this.embedDim).fill(0);
-            for (let i = 0; i < this.embedDim; i++) {
-                for (let j = 0; j < this.inputSize; j++) {
-                    emb[i] += this.W_embed[i][j] * x[j];
-                }
+            const x = sequence[t];
+            for (let j = 0; j < this.inputSize; j++) {
+                X.data[t * this.inputSize + j] = Array.isArray(x) ? x[j] : x;
             }
-            embedded.push(emb);
         }
 
-        // Add positional encoding
-        const PE = getPositionalEncoding(seqLen, this.embedDim);
-        for (let t = 0; t < seqLen; t++) {
-            for (let i = 0; i < this.embedDim; i++) {
-                embedded[t][i] += PE[t][i];
-            }
+        // Embed input and add positional encoding
+        const embedded = mm(X, this.W_embed, ws.get('embedded', [seqLen, E]), false, true);
+        const PE = this.getPositionalEncodingTensor(seqLen);
+        for (let i = 0; i < embedded.size; i++) {
+            embedded.data[i] += PE.data[i];
         }
-
-        this.lastEmbeddings = embedded;
+        this.embeddingTensor = embedded;
 
         // Self-attention
-        const { output: attnOut, attentionWeights } = this.attention.forward(embedded);
-        this.lastAttentionWeights = attentionWeights;
+        const { output: attnOut } = this.attention.forward(embedded);
 
         // Residual connection (simplified)
-        const afterAttn = [];
-        for (let t = 0; t < seqLen; t++) {
-            const row = [];
-            for (let i = 0; i < this.embedDim; i++) {
-                row.push(embedded[t][i] + attnOut[t][i]);
-            }
-            afterAttn.push(row);
+        const afterAttn = ws.get('afterAttn', [seqLen, E]);
+        for (let i = 0; i < afterAttn.size; i++) {
+            afterAttn.data[i] = embedded.data[i] + attnOut.data[i];
         }
 
-        // Feed-forward network
-        const ffOut = [];
-        for (let t = 0; t < seqLen; t++) {
-            // First layer (with ReLU)
-            const hidden = new Array(this.embedDim * 2).fill(0);
-            for (let i = 0; i < this.embedDim * 2; i++) {
-                let sum = this.b_ff1[i];
-                for (let j = 0; j < this.embedDim; j++) {
-                    sum += this.W_ff1[i][j] * afterAttn[t][j];
-                }
-                hidden[i] = this.relu(sum);
-            }
-
-            // Second layer
-            const out = new Array(this.embedDim).fill(0);
-            for (let i = 0; i < this.embedDim; i++) {
-                let sum = this.b_ff2[i];
-                for (let j = 0; j < this.embedDim * 2; j++) {
-                    sum += this.W_ff2[i][j] * hidden[j];
-                }
-                out[i] = sum;
-            }
-
-            // Residual
-            for (let i = 0; i < this.embedDim; i++) {
-                out[i] += afterAttn[t][i];
-            }
-
-            ffOut.push(out);
-        }
+        // Feed-forward network: ReLU hidden layer, then projection plus residual
+        const hidden = mm(afterAttn, this.W_ff1, ws.get('hidden', [seqLen, E * 2]), false, true);
+        TensorKernels.relu(TensorKernels.addRowVector(hidden, this.b_ff1));
+        const ffOut = ws.get('ffOut', [seqLen, E]);
+        ffOut.data.set(afterAttn.data);
+        mm(hidden, this.W_ff2, ffOut, false, true, true);
+        TensorKernels.addRowVector(ffOut, this.b_ff2);
 
         // Output projection
-        const outputs = [];
-        for (let t = 0; t < seqLen; t++) {
-            const y = new Array(this.outputSize).fill(0);
-            for (let i = 0; i < this.outputSize; i++) {
-                let sum = this.b_out[i];
-                for (let j = 0; j < this.embedDim; j++) {
-                    sum += this.W_out[i][j] * ffOut[t][j];
-                }
-                y[i] = sum;
-            }
-            outputs.push(y);
-        }
+        const outputs = mm(ffOut, this.W_out, ws.get('outputs', [seqLen, this.outputSize]), false, true);
+        TensorKernels.addRowVector(outputs, this.b_out);
 
-        this.lastOutputs = outputs;
-        return outputs;
+        this.lastOutputs = outputs.toNested();
+        return this.lastOutputs;
     }
 
     trainStep(sequence, targets) {
         const outputs = this.forward(sequence);
+        const seqLen = sequence.length;
+        const E = this.embedDim;
+        const ws = this.workspace;
+        const grads = this.grads;
+        const mm = TensorKernels.matmul.bind(TensorKernels);
 
-        // Calculate loss
+        // Calculate loss and dL/dy = (y - target) / seqLen
         let loss = 0;
-        for (let t = 0; t < sequence.length; t++) {
+        const dY = ws.get('dOutputs', [seqLen, this.outputSize]);
+        for (let t = 0; t < seqLen; t++) {
             const tgt = Array.isArray(targets[t]) ? targets[t] : [targets[t]];
             for (let i = 0; i < this.outputSize; i++) {
-                loss += 0.5 * Math.pow(outputs[t][i] - tgt[i], 2);
+                const err = outputs[t][i] - tgt[i];
+                loss += 0.5 * err * err;
+                dY.data[t * this.outputSize + i] = err / seqLen;
             }
         }
-        loss /= sequence.length;
+        loss /= seqLen;
 
-        // Simplified gradient update (output layer only for speed)
-        this.optimizer.incrementT();
+        // Output projection
+        const ffOut = ws.get('ffOut', [seqLen, E]);
+        mm(dY, ffOut, grads.W_out, true, false);
+        TensorKernels.sumRows(dY, grads.b_out);
+        const dFF = mm(dY, this.W_out, ws.get('dFFOut', [seqLen, E]));
+
+        // Feed-forward (the residual passes dFF straight through to afterAttn)
+        const hidden = ws.get('hidden', [seqLen, E * 2]);
+        const afterAttn = ws.get('afterAttn', [seqLen, E]);
+        mm(dFF, hidden, grads.W_ff2, true, false);
+        TensorKernels.sumRows(dFF, grads.b_ff2);
+        const dHidden = mm(dFF, this.W_ff2, ws.get('dHidden', [seqLen, E * 2]));
+        TensorKernels.reluBackward(dHidden, hidden);
+        mm(dHidden, afterAttn, grads.W_ff1, true, false);
+        TensorKernels.sumRows(dHidden, grads.b_ff1);
+        const dAfterAttn = ws.get('dAfterAttn', [seqLen, E]);
+        dAfterAttn.data.set(dFF.data);
+        mm(dHidden, this.W_ff1, dAfterAttn, false, false, true);
+
+        // Attention (plus the residual into the embeddings)
+        const dAttnInput = this.attention.backward(dAfterAttn);
+        const dEmbedded = ws.get('dEmbedded', [seqLen, E]);
+        for (let i = 0; i < dEmbedded.size; i++) {
+            dEmbedded.data[i] = dAfterAttn.data[i] + dAttnInput.data[i];
+        }
 
-        for (let t = 0; t < sequence.length; t++) {
-            const tgt = Array.isArray(targets[t]) ? targets[t] : [targets[t]];
-            for (let i = 0; i < this.outputSize; i++) {
-                const err = outputs[t][i] - tgt[i];
-                this.b_out[i] -= this.learningRate * err / sequence.length;
-            }
+        // Embedding
+        mm(dEmbedded, ws.get('input', [seqLen, this.inputSize]), grads.W_embed, true, false);
+
+        this.optimizer.incrementT();
+        for (const name in grads) {
+            this.optimizer.update(this[name], grads[name], name);
+        }
+        for (const name in this.attention.grads) {
+            this.optimizer.update(this.attention[name], this.attention.grads[name], `attention.${name}`);
         }
 
         return loss;
@@ -405,21 +324,16 @@ class TransformerNetwork {
         const matrices = [this.W_embed, this.attention.W_q, this.attention.W_k,
         this.attention.W_v, this.W_ff1, this.W_ff2, this.W_out];
         for (const mat of matrices) {
-            for (const row of mat) {
-                count += row.length;
-            }
+            count += mat.size;
         }
         return { count };
     }
 
     reinitialize() {
-        this.W_embed = this.initMatrix(this.embedDim, this.inputSize);
-        this.attention = new SelfAttention(this.embedDim);
-        this.W_ff1 = this.initMatrix(this.embedDim * 2, this.embedDim);
-        this.W_ff2 = this.initMatrix(this.embedDim, this.embedDim * 2);
-        this.W_out = this.initMatrix(this.outputSize, this.embedDim);
-        this.b_out = new Array(this.outputSize).fill(0);
+        this.initParameters();
         this.optimizer = this.createOptimizer();
+        this.lastOutputs = [];
+        this.embeddingTensor = null;
         this.epoch = 0;
         this.lossHistory = [];
     }
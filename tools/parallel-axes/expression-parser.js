@@ -1,7 +1,8 @@
 /**
  * Expression Parser Module for Parallel Axes Visualizer
  * Handles custom function parsing, LaTeX conversion, and calculus operations
- * Uses math.js for expression evaluation and symbolic derivatives
+ * Uses math.js for parsing and symbolic derivatives, and ExpressionCompiler
+ * (tools/shared/expression-compiler.js) for evaluation
  */
 
 const ExpressionParser = (function () {
@@ -11,7 +12,8 @@ const ExpressionParser = (function () {
     /**
      * Parse and validate a mathematical expression
      * @param {string} exprString - The expression to parse (e.g., "x^2 + sin(x)")
-     * @returns {Object} - { valid: boolean, error?: string, latex: string, evaluate: (x) => number, node?: Object }
+     * @returns {Object} - { valid: boolean, error?: string, latex: string, evaluate: (x) => number,
+     *                      evaluateBatch?: (xs, out?) => Float64Array, node?: Object }
      */
     function parseExpression(exprString) {
         if (!exprString || exprString.trim() === '') {
@@ -49,26 +51,17 @@ const ExpressionParser = (function () {
                 };
             }
 
-            // Compile the expression for fast evaluation
-            const compiled = node.compile();
+            // Compile to a straight-line evaluator (cached by expression string)
+            const compiled = ExpressionCompiler.compile(exprString);
 
             // Convert to LaTeX
             const latex = node.toTex({ parenthesis: 'auto' });
 
-            // Create evaluator function
-            const evaluate = (x) => {
-                try {
-                    const result = compiled.evaluate({ x: x });
-                    return typeof result === 'number' ? result : NaN;
-                } catch (e) {
-                    return NaN;
-                }
-            };
-
             return {
                 valid: true,
                 latex: latex,
-                evaluate: evaluate,
+                evaluate: compiled.evaluate,
+                evaluateBatch: (xs, out) => compiled.evaluateBatch(xs, out),
                 node: node,
                 expression: exprString
             };
@@ -108,21 +101,13 @@ const ExpressionParser = (function () {
             const latex = simplified.toTex({ parenthesis: 'auto' });
 
             // Compile for evaluation
-            const compiled = simplified.compile();
-
-            const evaluate = (x) => {
-                try {
-                    const result = compiled.evaluate({ x: x });
-                    return typeof result === 'number' ? result : NaN;
-                } catch (e) {
-                    return NaN;
-                }
-            };
+            const compiled = ExpressionCompiler.compile(simplified);
 
             return {
                 valid: true,
                 latex: latex,
-                evaluate: evaluate,
+                evaluate: compiled.evaluate,
+                evaluateBatch: (xs, out) => compiled.evaluateBatch(xs, out),
                 expression: simplified.toString()
             };
         } catch (e) {
@@ -134,7 +119,7 @@ const ExpressionParser = (function () {
     /**
      * Compute numerical derivative using central difference
      * @param {string} exprString - The expression
-     * @returns {Object} - { valid: boolean, latex: string, evaluate: (x) => number }
+     * @returns {Object} - { valid: boolean, latex: string, evaluate: (x) => number, evaluateBatch: (xs, out?) => Float64Array }
      */
     function computeNumericalDerivative(exprString) {
         const parsed = parseExpression(exprString);
@@ -153,10 +138,23 @@ const ExpressionParser = (function () {
             return (fxPlusH - fxMinusH) / (2 * h);
         };
 
+        const evaluateBatch = (xs, out) => {
+            const n = xs.length;
+            const shifted = new Float64Array(n);
+            for (let i = 0; i < n; i++) shifted[i] = xs[i] + h;
+            const fxPlusH = parsed.evaluateBatch(shifted);
+            for (let i = 0; i < n; i++) shifted[i] = xs[i] - h;
+            const fxMinusH = parsed.evaluateBatch(shifted, shifted);
+            if (!out || out.length < n) out = new Float64Array(n);
+            for (let i = 0; i < n; i++) out[i] = (fxPlusH[i] - fxMinusH[i]) / (2 * h);
+            return out;
+        };
+
         return {
             valid: true,
             latex: `\\frac{d}{dx}\\left(${parsed.latex}\\right)`,
             evaluate: evaluate,
+            evaluateBatch: evaluateBatch,
             expression: `derivative of ${exprString}`
         };
     }
@@ -186,13 +184,17 @@ const ExpressionParser = (function () {
         const values = [];
         let integral = 0;
 
+        // Evaluate every sample once, in a single batch
+        const xs = new Float64Array(numPoints);
+        for (let i = 0; i < numPoints; i++) xs[i] = xMin + i * step;
+        const ys = parsed.evaluateBatch(xs);
+
         for (let i = 0; i < numPoints; i++) {
-            const x = xMin + i * step;
-            const y = parsed.evaluate(x);
+            const x = xs[i];
+            const y = ys[i];
 
             if (i > 0) {
-                const prevX = xMin + (i - 1) * step;
-                const prevY = parsed.evaluate(prevX);
+                const prevY = ys[i - 1];
                 // Trapezoidal rule: area = (y1 + y2) / 2 * dx
                 if (!isNaN(y) && !isNaN(prevY) && isFinite(y) && isFinite(prevY)) {
                     integral += (prevY + y) / 2 * step;
@@ -17,6 +17,12 @@ const MathFunctions = {
             }
             return x; // Default to y = x
         },
+        evaluateBatch: (xs, params) => {
+            if (window.customFunctionBatchEvaluator) {
+                return window.customFunctionBatchEvaluator(xs);
+            }
+            return Float64Array.from(xs);
+        },
         getYRange: (xMin, xMax, params) => {
             // Will be dynamically computed based on actual function values
             return { yMin: -10, yMax: 10 };
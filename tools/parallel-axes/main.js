@@ -367,12 +367,19 @@ class ParallelAxesVisualizer {
         let actualYMax = -Infinity;
         const rawPoints = [];
 
+        const xs = new Float64Array(actualNumPoints);
         for (let i = 0; i < actualNumPoints; i++) {
             // Ensure we hit exactly xMin and xMax at the endpoints
-            const x = (i === 0) ? this.xMin :
+            xs[i] = (i === 0) ? this.xMin :
                 (i === actualNumPoints - 1) ? this.xMax :
                     this.xMin + i * step;
-            const y = func.evaluate(x, this.params);
+        }
+        // Compiled expressions evaluate the whole grid in one call
+        const ys = func.evaluateBatch ? func.evaluateBatch(xs, this.params) : null;
+
+        for (let i = 0; i < actualNumPoints; i++) {
+            const x = xs[i];
+            const y = ys ? ys[i] : func.evaluate(x, this.params);
 
             if (!isNaN(y) && isFinite(y)) {
                 rawPoints.push({ x, y, index: i });
@@ -1100,6 +1107,7 @@ class ParallelAxesVisualizer {
             latexPreview.innerHTML = '<span class="latex-content">y = x</span>';
 
             window.customFunctionEvaluator = (x) => x;
+            window.customFunctionBatchEvaluator = null;
             this.customExpressionValid = false;
 
             this.calculateDataPoints();
@@ -1123,6 +1131,7 @@ class ParallelAxesVisualizer {
 
             // Set the global evaluator for the custom function
             window.customFunctionEvaluator = parsed.evaluate;
+            window.customFunctionBatchEvaluator = parsed.evaluateBatch;
             this.customExpressionValid = true;
 
             // Recalculate and render
@@ -1175,15 +1184,18 @@ class ParallelAxesVisualizer {
 
         const numPoints = this.continuousMode ? 500 : this.numPoints;
         const step = (this.xMax - this.xMin) / (numPoints - 1);
+        const xs = new Float64Array(numPoints);
+        for (let i = 0; i < numPoints; i++) xs[i] = this.xMin + i * step;
 
         // Calculate derivative if enabled
         if (this.showDerivative) {
             this.derivativeData = ExpressionParser.derivative(exprString);
 
             if (this.derivativeData.valid) {
+                const ys = this.derivativeData.evaluateBatch(xs);
                 for (let i = 0; i < numPoints; i++) {
-                    const x = this.xMin + i * step;
-                    const y = this.derivativeData.evaluate(x);
+                    const x = xs[i];
+                    const y = ys[i];
                     if (!isNaN(y) && isFinite(y)) {
                         this.derivativePoints.push({ x, y });
                     }
@@ -1197,7 +1209,7 @@ class ParallelAxesVisualizer {
 
             if (this.integralData.valid) {
                 for (let i = 0; i < numPoints; i++) {
-                    const x = this.xMin + i * step;
+                    const x = xs[i];
                     const y = this.integralData.evaluate(x);
                     if (!isNaN(y) && isFinite(y)) {
                         this.integralPoints.push({ x, y });
@@ -32,9 +32,9 @@ const DISTRIBUTIONS = {
     logistic: { name: 'Logistic', category: 'Continuous', params: [{ id: 'mu', name: 'μ', min: -3, max: 3, step: 0.1, default: 0 }, { id: 's', name: 's', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=e^(-(x-μ)/s)/(s(1+e^(-(x-μ)/s))²)', pdf: (x, p) => { const z = Math.exp(-(x - p.mu) / p.s); return z / (p.s * (1 + z) ** 2); }, cdf: (x, p) => 1 / (1 + Math.exp(-(x - p.mu) / p.s)), mean: p => p.mu, variance: p => (p.s ** 2 * Math.PI ** 2) / 3, range: p => [p.mu - 8 * p.s, p.mu + 8 * p.s], sample: p => { const u = Math.random(); return p.mu + p.s * Math.log(u / (1 - u)); } },
     gumbel: { name: 'Gumbel', category: 'Continuous', params: [{ id: 'mu', name: 'μ', min: -3, max: 3, step: 0.1, default: 0 }, { id: 'beta', name: 'β', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=(1/β)e^(-(z+e^(-z)))', pdf: (x, p) => { const z = (x - p.mu) / p.beta; return Math.exp(-(z + Math.exp(-z))) / p.beta; }, cdf: (x, p) => Math.exp(-Math.exp(-(x - p.mu) / p.beta)), mean: p => p.mu + 0.5772 * p.beta, variance: p => (Math.PI ** 2 * p.beta ** 2) / 6, range: p => [p.mu - 4 * p.beta, p.mu + 6 * p.beta], sample: p => p.mu - p.beta * Math.log(-Math.log(Math.random())) },
     frechet: { name: 'Fréchet', category: 'Continuous', params: [{ id: 'alpha', name: 'α', min: 1, max: 5, step: 0.1, default: 2 }, { id: 's', name: 's', min: 0.5, max: 3, step: 0.1, default: 1 }, { id: 'm', name: 'm', min: 0, max: 3, step: 0.1, default: 0 }], formula: 'f(x)=(α/s)((x-m)/s)^(-1-α)e^(-((x-m)/s)^(-α))', pdf: (x, p) => { if (x <= p.m) return 0; const z = (x - p.m) / p.s; return (p.alpha / p.s) * Math.pow(z, -1 - p.alpha) * Math.exp(-Math.pow(z, -p.alpha)); }, cdf: (x, p) => x <= p.m ? 0 : Math.exp(-Math.pow((x - p.m) / p.s, -p.alpha)), mean: p => p.alpha > 1 ? p.m + p.s * gammaFn(1 - 1 / p.alpha) : Infinity, variance: p => p.alpha > 2 ? p.s ** 2 * (gammaFn(1 - 2 / p.alpha) - gammaFn(1 - 1 / p.alpha) ** 2) : Infinity, range: p => [p.m, p.m + 8 * p.s], sample: p => p.m + p.s * Math.pow(-Math.log(Math.random()), -1 / p.alpha) },
-    rayleigh: { name: 'Rayleigh', category: 'Continuous', params: [{ id: 'sigma', name: 'σ', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=(x/σ²)e^(-x²/2σ²)', pdf: (x, p) => x < 0 ? 0 : (x / (p.sigma ** 2)) * Math.exp(-x ** 2 / (2 * p.sigma ** 2)), cdf: (x, p) => x < 0 ? 0 : 1 - Math.exp(-x ** 2 / (2 * p.sigma ** 2)), mean: p => p.sigma * Math.sqrt(Math.PI / 2), variance: p => (4 - Math.PI) / 2 * p.sigma ** 2, range: () => [0, 6], sample: p => p.sigma * Math.sqrt(-2 * Math.log(Math.random())) },
-    maxwell: { name: 'Maxwell-Boltzmann', category: 'Continuous', params: [{ id: 'a', name: 'a', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=√(2/π)(x²/a³)e^(-x²/2a²)', pdf: (x, p) => x < 0 ? 0 : Math.sqrt(2 / Math.PI) * (x ** 2 / (p.a ** 3)) * Math.exp(-x ** 2 / (2 * p.a ** 2)), cdf: (x, p) => x < 0 ? 0 : erf(x / (p.a * Math.sqrt(2))) - Math.sqrt(2 / Math.PI) * (x / p.a) * Math.exp(-x ** 2 / (2 * p.a ** 2)), mean: p => 2 * p.a * Math.sqrt(2 / Math.PI), variance: p => p.a ** 2 * (3 * Math.PI - 8) / Math.PI, range: () => [0, 6], sample: p => Math.sqrt(normalSample() ** 2 + normalSample() ** 2 + normalSample() ** 2) * p.a },
-    chi: { name: 'Chi', category: 'Continuous', params: [{ id: 'k', name: 'k', min: 1, max: 10, step: 1, default: 2 }], formula: 'f(x)=x^(k-1)e^(-x²/2)/(2^(k/2-1)Γ(k/2))', pdf: (x, p) => x < 0 ? 0 : (x ** (p.k - 1)) * Math.exp(-x ** 2 / 2) / (Math.pow(2, p.k / 2 - 1) * gammaFn(p.k / 2)), cdf: (x, p) => x < 0 ? 0 : incGamma(p.k / 2, x ** 2 / 2), mean: p => Math.sqrt(2) * gammaFn((p.k + 1) / 2) / gammaFn(p.k / 2), variance: p => p.k - DISTRIBUTIONS.chi.mean({ k: p.k }) ** 2, range: () => [0, 8], sample: p => { let s = 0; for (let i = 0; i < p.k; i++)s += normalSample() ** 2; return Math.sqrt(s); } },
+    rayleigh: { name: 'Rayleigh', category: 'Continuous', params: [{ id: 'sigma', name: 'σ', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=(x/σ²)e^(-x²/2σ²)', pdf: (x, p) => x < 0 ? 0 : (x / (p.sigma ** 2)) * Math.exp(-(x ** 2) / (2 * p.sigma ** 2)), cdf: (x, p) => x < 0 ? 0 : 1 - Math.exp(-(x ** 2) / (2 * p.sigma ** 2)), mean: p => p.sigma * Math.sqrt(Math.PI / 2), variance: p => (4 - Math.PI) / 2 * p.sigma ** 2, range: () => [0, 6], sample: p => p.sigma * Math.sqrt(-2 * Math.log(Math.random())) },
+    maxwell: { name: 'Maxwell-Boltzmann', category: 'Continuous', params: [{ id: 'a', name: 'a', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=√(2/π)(x²/a³)e^(-x²/2a²)', pdf: (x, p) => x < 0 ? 0 : Math.sqrt(2 / Math.PI) * (x ** 2 / (p.a ** 3)) * Math.exp(-(x ** 2) / (2 * p.a ** 2)), cdf: (x, p) => x < 0 ? 0 : erf(x / (p.a * Math.sqrt(2))) - Math.sqrt(2 / Math.PI) * (x / p.a) * Math.exp(-(x ** 2) / (2 * p.a ** 2)), mean: p => 2 * p.a * Math.sqrt(2 / Math.PI), variance: p => p.a ** 2 * (3 * Math.PI - 8) / Math.PI, range: () => [0, 6], sample: p => Math.sqrt(normalSample() ** 2 + normalSample() ** 2 + normalSample() ** 2) * p.a },
+    chi: { name: 'Chi', category: 'Continuous', params: [{ id: 'k', name: 'k', min: 1, max: 10, step: 1, default: 2 }], formula: 'f(x)=x^(k-1)e^(-x²/2)/(2^(k/2-1)Γ(k/2))', pdf: (x, p) => x < 0 ? 0 : (x ** (p.k - 1)) * Math.exp(-(x ** 2) / 2) / (Math.pow(2, p.k / 2 - 1) * gammaFn(p.k / 2)), cdf: (x, p) => x < 0 ? 0 : incGamma(p.k / 2, x ** 2 / 2), mean: p => Math.sqrt(2) * gammaFn((p.k + 1) / 2) / gammaFn(p.k / 2), variance: p => p.k - DISTRIBUTIONS.chi.mean({ k: p.k }) ** 2, range: () => [0, 8], sample: p => { let s = 0; for (let i = 0; i < p.k; i++)s += normalSample() ** 2; return Math.sqrt(s); } },
     chisquared: { name: 'Chi-Squared', category: 'Continuous', params: [{ id: 'k', name: 'k', min: 1, max: 20, step: 1, default: 3 }], formula: 'f(x)=x^(k/2-1)e^(-x/2)/(2^(k/2)Γ(k/2))', pdf: (x, p) => x <= 0 ? 0 : (x ** (p.k / 2 - 1)) * Math.exp(-x / 2) / (Math.pow(2, p.k / 2) * gammaFn(p.k / 2)), cdf: (x, p) => x <= 0 ? 0 : incGamma(p.k / 2, x / 2), mean: p => p.k, variance: p => 2 * p.k, range: p => [0, Math.max(10, p.k + 4 * Math.sqrt(2 * p.k))], sample: p => 2 * gammaSample(p.k / 2) },
     studentt: { name: "Student's t", category: 'Continuous', params: [{ id: 'nu', name: 'ν', min: 1, max: 30, step: 1, default: 5 }], formula: 'f(x)=Γ((ν+1)/2)/(√(νπ)Γ(ν/2))(1+x²/ν)^(-(ν+1)/2)', pdf: (x, p) => gammaFn((p.nu + 1) / 2) / (Math.sqrt(p.nu * Math.PI) * gammaFn(p.nu / 2)) * Math.pow(1 + x ** 2 / p.nu, -(p.nu + 1) / 2), cdf: (x, p) => { const t = p.nu / (p.nu + x ** 2); return x > 0 ? 1 - 0.5 * incBeta(t, p.nu / 2, 0.5) : 0.5 * incBeta(t, p.nu / 2, 0.5); }, mean: p => p.nu > 1 ? 0 : NaN, variance: p => p.nu > 2 ? p.nu / (p.nu - 2) : (p.nu > 1 ? Infinity : NaN), range: () => [-6, 6], sample: p => normalSample() / Math.sqrt(gammaSample(p.nu / 2) * 2 / p.nu) },
     f: { name: 'F', category: 'Continuous', params: [{ id: 'd1', name: 'd₁', min: 1, max: 20, step: 1, default: 5 }, { id: 'd2', name: 'd₂', min: 1, max: 20, step: 1, default: 10 }], formula: 'f(x)=√((d1x)^d1×d2^d2/(d1x+d2)^(d1+d2))/(xB(d1/2,d2/2))', pdf: (x, p) => x <= 0 ? 0 : Math.sqrt(Math.pow(p.d1 * x, p.d1) * Math.pow(p.d2, p.d2) / Math.pow(p.d1 * x + p.d2, p.d1 + p.d2)) / (x * betaFn(p.d1 / 2, p.d2 / 2)), cdf: (x, p) => x <= 0 ? 0 : incBeta(p.d1 * x / (p.d1 * x + p.d2), p.d1 / 2, p.d2 / 2), mean: p => p.d2 > 2 ? p.d2 / (p.d2 - 2) : NaN, variance: p => p.d2 > 4 ? 2 * p.d2 ** 2 * (p.d1 + p.d2 - 2) / (p.d1 * (p.d2 - 2) ** 2 * (p.d2 - 4)) : NaN, range: () => [0, 6], sample: p => (gammaSample(p.d1 / 2) / p.d1) / (gammaSample(p.d2 / 2) / p.d2) },
@@ -63,9 +63,9 @@ const DISTRIBUTIONS = {
     yulesimon: { name: 'Yule-Simon', category: 'Discrete', discrete: true, params: [{ id: 'rho', name: 'ρ', min: 1, max: 5, step: 0.1, default: 2 }], formula: 'P(X=k)=ρB(k,ρ+1)', pdf: (k, p) => { k = Math.round(k); if (k < 1) return 0; return p.rho * betaFn(k, p.rho + 1); }, cdf: (k, p) => { let sum = 0; for (let i = 1; i <= Math.floor(k); i++)sum += DISTRIBUTIONS.yulesimon.pdf(i, p); return sum; }, mean: p => p.rho > 1 ? p.rho / (p.rho - 1) : Infinity, variance: p => p.rho > 2 ? p.rho ** 2 / ((p.rho - 1) ** 2 * (p.rho - 2)) : Infinity, range: () => [1, 20], sample: p => { const e = gammaSample(1); const g = gammaSample(p.rho); let k = 1; while (Math.random() > g / (g + k * e)) k++; return k; } },
     zeta: { name: 'Zeta (Zipf)', category: 'Discrete', discrete: true, params: [{ id: 's', name: 's', min: 1.01, max: 4, step: 0.01, default: 2 }], formula: 'P(X=k)=1/(k^s·ζ(s))', pdf: (k, p) => { k = Math.round(k); if (k < 1) return 0; let zeta = 0; for (let i = 1; i <= 1000; i++)zeta += 1 / Math.pow(i, p.s); return 1 / (Math.pow(k, p.s) * zeta); }, cdf: (k, p) => { let sum = 0; for (let i = 1; i <= Math.floor(k); i++)sum += DISTRIBUTIONS.zeta.pdf(i, p); return sum; }, mean: p => { if (p.s <= 2) return Infinity; let zeta = 0, zeta1 = 0; for (let i = 1; i <= 1000; i++) { zeta += 1 / Math.pow(i, p.s); zeta1 += 1 / Math.pow(i, p.s - 1); } return zeta1 / zeta; }, variance: p => { if (p.s <= 3) return Infinity; let z0 = 0, z1 = 0, z2 = 0; for (let i = 1; i <= 1000; i++) { z0 += 1 / Math.pow(i, p.s); z1 += 1 / Math.pow(i, p.s - 1); z2 += 1 / Math.pow(i, p.s - 2); } return z2 / z0 - (z1 / z0) ** 2; }, range: () => [1, 20], sample: p => { const u = Math.random(); let sum = 0; for (let k = 1; k <= 1000; k++) { sum += DISTRIBUTIONS.zeta.pdf(k, p); if (u <= sum) return k; } return 1; } },
     // Special distributions
-    halfnormal: { name: 'Half-Normal', category: 'Special', params: [{ id: 'sigma', name: 'σ', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=(√2/σ√π)e^(-x²/2σ²)', pdf: (x, p) => x < 0 ? 0 : (Math.sqrt(2 / Math.PI) / p.sigma) * Math.exp(-x ** 2 / (2 * p.sigma ** 2)), cdf: (x, p) => x < 0 ? 0 : erf(x / (p.sigma * Math.sqrt(2))), mean: p => p.sigma * Math.sqrt(2 / Math.PI), variance: p => p.sigma ** 2 * (1 - 2 / Math.PI), range: () => [0, 6], sample: p => Math.abs(p.sigma * normalSample()) },
-    foldednormal: { name: 'Folded Normal', category: 'Special', params: [{ id: 'mu', name: 'μ', min: 0, max: 3, step: 0.1, default: 1 }, { id: 'sigma', name: 'σ', min: 0.1, max: 2, step: 0.1, default: 1 }], formula: 'f(x)=φ((x-μ)/σ)+φ((x+μ)/σ)', pdf: (x, p) => { if (x < 0) return 0; const phi = z => Math.exp(-z ** 2 / 2) / Math.sqrt(2 * Math.PI); return (phi((x - p.mu) / p.sigma) + phi((x + p.mu) / p.sigma)) / p.sigma; }, cdf: (x, p) => { if (x < 0) return 0; return 0.5 * (erf((x + p.mu) / (p.sigma * Math.sqrt(2))) + erf((x - p.mu) / (p.sigma * Math.sqrt(2)))); }, mean: p => p.sigma * Math.sqrt(2 / Math.PI) * Math.exp(-p.mu ** 2 / (2 * p.sigma ** 2)) + p.mu * (1 - 2 * 0.5 * (1 - erf(p.mu / (p.sigma * Math.sqrt(2))))), variance: p => p.mu ** 2 + p.sigma ** 2 - DISTRIBUTIONS.foldednormal.mean(p) ** 2, range: () => [0, 8], sample: p => Math.abs(p.mu + p.sigma * normalSample()) },
-    truncatednormal: { name: 'Truncated Normal', category: 'Special', params: [{ id: 'mu', name: 'μ', min: -2, max: 2, step: 0.1, default: 0 }, { id: 'sigma', name: 'σ', min: 0.1, max: 2, step: 0.1, default: 1 }, { id: 'a', name: 'a', min: -4, max: 0, step: 0.1, default: -2 }, { id: 'b', name: 'b', min: 0, max: 4, step: 0.1, default: 2 }], formula: 'f(x)=φ((x-μ)/σ)/(σ(Φ(β)-Φ(α)))', pdf: (x, p) => { if (x < p.a || x > p.b) return 0; const phi = z => Math.exp(-z ** 2 / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const Z = Phi(beta_) - Phi(alpha); return phi((x - p.mu) / p.sigma) / (p.sigma * Z); }, cdf: (x, p) => { if (x < p.a) return 0; if (x > p.b) return 1; const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; return (Phi((x - p.mu) / p.sigma) - Phi(alpha)) / (Phi(beta_) - Phi(alpha)); }, mean: p => { const phi = z => Math.exp(-z ** 2 / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; return p.mu + p.sigma * (phi(alpha) - phi(beta_)) / (Phi(beta_) - Phi(alpha)); }, variance: p => { const phi = z => Math.exp(-z ** 2 / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const Z = Phi(beta_) - Phi(alpha); return p.sigma ** 2 * (1 + (alpha * phi(alpha) - beta_ * phi(beta_)) / Z - ((phi(alpha) - phi(beta_)) / Z) ** 2); }, range: p => [p.a, p.b], sample: p => { const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const PhiInv = u => { let low = -8, high = 8; while (high - low > 1e-10) { const mid = (low + high) / 2; if (Phi(mid) < u) low = mid; else high = mid; } return low; }; const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const u = Phi(alpha) + Math.random() * (Phi(beta_) - Phi(alpha)); return p.mu + p.sigma * PhiInv(u); } },
+    halfnormal: { name: 'Half-Normal', category: 'Special', params: [{ id: 'sigma', name: 'σ', min: 0.1, max: 3, step: 0.1, default: 1 }], formula: 'f(x)=(√2/σ√π)e^(-x²/2σ²)', pdf: (x, p) => x < 0 ? 0 : (Math.sqrt(2 / Math.PI) / p.sigma) * Math.exp(-(x ** 2) / (2 * p.sigma ** 2)), cdf: (x, p) => x < 0 ? 0 : erf(x / (p.sigma * Math.sqrt(2))), mean: p => p.sigma * Math.sqrt(2 / Math.PI), variance: p => p.sigma ** 2 * (1 - 2 / Math.PI), range: () => [0, 6], sample: p => Math.abs(p.sigma * normalSample()) },
+    foldednormal: { name: 'Folded Normal', category: 'Special', params: [{ id: 'mu', name: 'μ', min: 0, max: 3, step: 0.1, default: 1 }, { id: 'sigma', name: 'σ', min: 0.1, max: 2, step: 0.1, default: 1 }], formula: 'f(x)=φ((x-μ)/σ)+φ((x+μ)/σ)', pdf: (x, p) => { if (x < 0) return 0; const phi = z => Math.exp(-(z ** 2) / 2) / Math.sqrt(2 * Math.PI); return (phi((x - p.mu) / p.sigma) + phi((x + p.mu) / p.sigma)) / p.sigma; }, cdf: (x, p) => { if (x < 0) return 0; return 0.5 * (erf((x + p.mu) / (p.sigma * Math.sqrt(2))) + erf((x - p.mu) / (p.sigma * Math.sqrt(2)))); }, mean: p => p.sigma * Math.sqrt(2 / Math.PI) * Math.exp(-(p.mu ** 2) / (2 * p.sigma ** 2)) + p.mu * (1 - 2 * 0.5 * (1 - erf(p.mu / (p.sigma * Math.sqrt(2))))), variance: p => p.mu ** 2 + p.sigma ** 2 - DISTRIBUTIONS.foldednormal.mean(p) ** 2, range: () => [0, 8], sample: p => Math.abs(p.mu + p.sigma * normalSample()) },
+    truncatednormal: { name: 'Truncated Normal', category: 'Special', params: [{ id: 'mu', name: 'μ', min: -2, max: 2, step: 0.1, default: 0 }, { id: 'sigma', name: 'σ', min: 0.1, max: 2, step: 0.1, default: 1 }, { id: 'a', name: 'a', min: -4, max: 0, step: 0.1, default: -2 }, { id: 'b', name: 'b', min: 0, max: 4, step: 0.1, default: 2 }], formula: 'f(x)=φ((x-μ)/σ)/(σ(Φ(β)-Φ(α)))', pdf: (x, p) => { if (x < p.a || x > p.b) return 0; const phi = z => Math.exp(-(z ** 2) / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const Z = Phi(beta_) - Phi(alpha); return phi((x - p.mu) / p.sigma) / (p.sigma * Z); }, cdf: (x, p) => { if (x < p.a) return 0; if (x > p.b) return 1; const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; return (Phi((x - p.mu) / p.sigma) - Phi(alpha)) / (Phi(beta_) - Phi(alpha)); }, mean: p => { const phi = z => Math.exp(-(z ** 2) / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; return p.mu + p.sigma * (phi(alpha) - phi(beta_)) / (Phi(beta_) - Phi(alpha)); }, variance: p => { const phi = z => Math.exp(-(z ** 2) / 2) / Math.sqrt(2 * Math.PI); const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const Z = Phi(beta_) - Phi(alpha); return p.sigma ** 2 * (1 + (alpha * phi(alpha) - beta_ * phi(beta_)) / Z - ((phi(alpha) - phi(beta_)) / Z) ** 2); }, range: p => [p.a, p.b], sample: p => { const Phi = z => 0.5 * (1 + erf(z / Math.sqrt(2))); const PhiInv = u => { let low = -8, high = 8; while (high - low > 1e-10) { const mid = (low + high) / 2; if (Phi(mid) < u) low = mid; else high = mid; } return low; }; const alpha = (p.a - p.mu) / p.sigma, beta_ = (p.b - p.mu) / p.sigma; const u = Phi(alpha) + Math.random() * (Phi(beta_) - Phi(alpha)); return p.mu + p.sigma * PhiInv(u); } },
     power: { name: 'Power', category: 'Special', params: [{ id: 'alpha', name: 'α', min: 0.1, max: 5, step: 0.1, default: 2 }], formula: 'f(x)=αx^(α-1)', pdf: (x, p) => (x < 0 || x > 1) ? 0 : p.alpha * Math.pow(x, p.alpha - 1), cdf: (x, p) => { if (x < 0) return 0; if (x > 1) return 1; return Math.pow(x, p.alpha); }, mean: p => p.alpha / (p.alpha + 1), variance: p => p.alpha / ((p.alpha + 1) ** 2 * (p.alpha + 2)), range: () => [0, 1], sample: p => Math.pow(Math.random(), 1 / p.alpha) },
     bradford: { name: 'Bradford', category: 'Special', params: [{ id: 'c', name: 'c', min: 0.1, max: 5, step: 0.1, default: 2 }], formula: 'f(x)=c/(ln(1+c)(1+cx))', pdf: (x, p) => (x < 0 || x > 1) ? 0 : p.c / (Math.log(1 + p.c) * (1 + p.c * x)), cdf: (x, p) => { if (x < 0) return 0; if (x > 1) return 1; return Math.log(1 + p.c * x) / Math.log(1 + p.c); }, mean: p => (p.c - Math.log(1 + p.c)) / (p.c * Math.log(1 + p.c)), variance: p => { const k = Math.log(1 + p.c); return ((p.c + 2) * k - 2 * p.c) / (2 * p.c * k ** 2); }, range: () => [0, 1], sample: p => (Math.pow(1 + p.c, Math.random()) - 1) / p.c },
     reciprocal: { name: 'Reciprocal (Log-Uniform)', category: 'Special', params: [{ id: 'a', name: 'a', min: 0.1, max: 1, step: 0.1, default: 0.5 }, { id: 'b', name: 'b', min: 1, max: 10, step: 0.1, default: 5 }], formula: 'f(x)=1/(x·ln(b/a))', pdf: (x, p) => (x < p.a || x > p.b) ? 0 : 1 / (x * Math.log(p.b / p.a)), cdf: (x, p) => { if (x < p.a) return 0; if (x > p.b) return 1; return Math.log(x / p.a) / Math.log(p.b / p.a); }, mean: p => (p.b - p.a) / Math.log(p.b / p.a), variance: p => { const L = Math.log(p.b / p.a); return (p.b ** 2 - p.a ** 2) / (2 * L) - ((p.b - p.a) / L) ** 2; }, range: p => [p.a, p.b], sample: p => p.a * Math.pow(p.b / p.a, Math.random()) },
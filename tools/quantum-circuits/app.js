@@ -3,6 +3,9 @@
  */
 
 class QuantumPlaygroundApp {
+    // Cap on listed amplitudes / probability bars (6 qubits still show every state)
+    static MAX_LISTED_STATES = 64;
+
     constructor() {
         this.simulator = new QuantumSimulator(2);
         this.circuitRenderer = new CircuitRenderer('circuit-container', (circuit) => this.onCircuitChange(circuit));
@@ -145,9 +148,12 @@ class QuantumPlaygroundApp {
         const amplitudesContainer = document.getElementById('state-amplitudes');
         amplitudesContainer.innerHTML = '';
 
-        for (const amp of state.amplitudes) {
-            if (amp.magnitude < 0.001) continue; // Skip near-zero amplitudes
-
+        // Skip near-zero amplitudes (magnitude < 0.001); only these get DOM nodes
+        const listed = this.simulator.describeStates(state, {
+            limit: QuantumPlaygroundApp.MAX_LISTED_STATES,
+            minProbability: 1e-6
+        });
+        for (const amp of listed) {
             const item = document.createElement('div');
             item.className = 'amplitude-item';
 
@@ -177,13 +183,17 @@ class QuantumPlaygroundApp {
         const probContainer = document.getElementById('prob-bars');
         probContainer.innerHTML = '';
 
-        for (const prob of state.probabilities) {
+        // Small registers show every basis state; wide ones only the most probable
+        const bars = state.probabilities.length <= QuantumPlaygroundApp.MAX_LISTED_STATES
+            ? this.simulator.describeStates(state)
+            : listed;
+        for (const prob of bars) {
             const item = document.createElement('div');
             item.className = 'prob-bar-item';
 
             const label = document.createElement('div');
             label.className = 'prob-label';
-            label.textContent = prob.state;
+            label.textContent = prob.basis;
 
             const track = document.createElement('div');
             track.className = 'prob-bar-track';
@@ -4,14 +4,30 @@
  */
 
 class QuantumSimulator {
+    // Circuits this wide run on the Float64Array backend instead of {re, im} objects
+    static TYPED_BACKEND_MIN_QUBITS = 8;
+
     constructor(numQubits = 2) {
         this.numQubits = numQubits;
         this.stateVector = null;
+        this.backend = null;
         this.reset();
     }
 
     reset() {
         // Initialize to |0...0⟩ state
+        if (this.numQubits >= QuantumSimulator.TYPED_BACKEND_MIN_QUBITS &&
+            typeof StateVectorBackend !== 'undefined') {
+            if (!this.backend || this.backend.numQubits !== this.numQubits) {
+                this.backend = new StateVectorBackend(this.numQubits);
+            } else {
+                this.backend.reset();
+            }
+            this.stateVector = null;
+            return;
+        }
+
+        this.backend = null;
         const size = Math.pow(2, this.numQubits);
         this.stateVector = new Array(size).fill(null).map(() => ({ re: 0, im: 0 }));
         this.stateVector[0] = { re: 1, im: 0 };
@@ -113,11 +129,25 @@ class QuantumSimulator {
         }
     };
 
+    // Flat matrices for the typed backend, built once per gate type
+    static flatMatrix(gateType) {
+        const gate = QuantumSimulator.GATES[gateType];
+        if (!gate.flat) {
+            gate.flat = StateVectorBackend.toFlatMatrix(gate.matrix);
+        }
+        return gate.flat;
+    }
+
     // Apply single-qubit gate
     applySingleQubitGate(gateType, targetQubit) {
         const gate = QuantumSimulator.GATES[gateType];
         if (!gate) return;
 
+        if (this.backend) {
+            this.backend.queueSingleQubitGate(targetQubit, QuantumSimulator.flatMatrix(gateType));
+            return;
+        }
+
         const n = this.numQubits;
         const size = Math.pow(2, n);
         const newState = new Array(size).fill(null).map(() => ({ re: 0, im: 0 }));
@@ -159,6 +189,11 @@ class QuantumSimulator {
 
     // Apply CNOT gate
     applyCNOT(controlQubit, targetQubit) {
+        if (this.backend) {
+            this.backend.applyCNOT(controlQubit, targetQubit);
+            return;
+        }
+
         const size = Math.pow(2, this.numQubits);
         const newState = [...this.stateVector];
 
@@ -178,6 +213,11 @@ class QuantumSimulator {
 
     // Apply SWAP gate
     applySWAP(qubit1, qubit2) {
+        if (this.backend) {
+            this.backend.applySWAP(qubit1, qubit2);
+            return;
+        }
+
         const size = Math.pow(2, this.numQubits);
         const newState = [...this.stateVector];
 
@@ -200,6 +240,11 @@ class QuantumSimulator {
 
     // Apply CZ gate
     applyCZ(controlQubit, targetQubit) {
+        if (this.backend) {
+            this.backend.applyCZ(controlQubit, targetQubit);
+            return;
+        }
+
         const size = Math.pow(2, this.numQubits);
 
         for (let i = 0; i < size; i++) {
@@ -256,6 +301,11 @@ class QuantumSimulator {
 
     // Apply controlled phase rotation
     applyControlledPhase(controlQubit, targetQubit, angle) {
+        if (this.backend) {
+            this.backend.applyControlledPhase(controlQubit, targetQubit, angle);
+            return;
+        }
+
         const size = Math.pow(2, this.numQubits);
         const phase = { re: Math.cos(angle), im: Math.sin(angle) };
 
@@ -287,7 +337,7 @@ class QuantumSimulator {
         // M (measurement) is handled separately
     }
 
-    // Simulate entire circuit with optional initial states
+    // Simulate entire circuit with optional initial states; returns getStateArrays()
     simulate(circuit, initialStates = null) {
         this.reset();
 
@@ -302,7 +352,7 @@ class QuantumSimulator {
             }
         }
 
-        return this.getState();
+        return this.getStateArrays();
     }
 
     // Apply initial states to each qubit
@@ -344,42 +394,124 @@ class QuantumSimulator {
         }
     }
 
-    // Get current state info
-    getState() {
+    // Current state as typed arrays: interleaved amplitudes [re0, im0, re1, im1, ...]
+    // and |amplitude|² per basis index. Copies, so later gates do not change them.
+    getStateArrays() {
         const size = Math.pow(2, this.numQubits);
-        const amplitudes = [];
-        const probabilities = [];
+        let amplitudes;
+        if (this.backend) {
+            this.backend.flushAll();
+            amplitudes = this.backend.amps.slice();
+        } else {
+            amplitudes = new Float64Array(size * 2);
+            for (let i = 0; i < size; i++) {
+                amplitudes[i << 1] = this.stateVector[i].re;
+                amplitudes[(i << 1) + 1] = this.stateVector[i].im;
+            }
+        }
 
+        const probabilities = new Float64Array(size);
         for (let i = 0; i < size; i++) {
-            const amp = this.stateVector[i];
-            const mag = this.complexMagnitude(amp);
-            const phase = this.complexPhase(amp);
-            const prob = mag * mag;
+            const re = amplitudes[i << 1];
+            const im = amplitudes[(i << 1) + 1];
+            probabilities[i] = re * re + im * im;
+        }
 
-            // Create basis state string with q0 leftmost (reversed from standard binary)
-            const bitStr = i.toString(2).padStart(this.numQubits, '0');
-            const reversedBits = bitStr.split('').reverse().join('');
-            const basisState = '|' + reversedBits + '⟩';
+        return { numQubits: this.numQubits, amplitudes, probabilities };
+    }
 
-            amplitudes.push({
-                basis: basisState,
-                amplitude: amp,
-                magnitude: mag,
-                phase: phase,
-                probability: prob
-            });
-
-            probabilities.push({
-                state: basisState,
-                probability: prob
-            });
+    // Basis label with q0 leftmost (reversed from standard binary)
+    basisLabel(index) {
+        const bitStr = index.toString(2).padStart(this.numQubits, '0');
+        return '|' + bitStr.split('').reverse().join('') + '⟩';
+    }
+
+    /**
+     * Display entries for the states of `getStateArrays()` worth listing: the
+     * `limit` most probable with probability >= minProbability, in basis order.
+     * Only these get {basis, amplitude, magnitude, phase, probability} objects.
+     */
+    describeStates(state, { limit = Infinity, minProbability = 0 } = {}) {
+        const { amplitudes, probabilities } = state;
+        const size = probabilities.length;
+        let selected = [];
+
+        if (limit >= size) {
+            for (let i = 0; i < size; i++) {
+                if (probabilities[i] >= minProbability) selected.push(i);
+            }
+        } else {
+            // Bounded min-heap on probability keeps the top `limit` indices
+            const heap = [];
+            const less = (a, b) => probabilities[a] < probabilities[b];
+            for (let i = 0; i < size; i++) {
+                const p = probabilities[i];
+                if (p < minProbability) continue;
+                if (heap.length < limit) {
+                    heap.push(i);
+                    let c = heap.length - 1;
+                    while (c > 0) {
+                        const parent = (c - 1) >> 1;
+                        if (!less(heap[c], heap[parent])) break;
+                        [heap[c], heap[parent]] = [heap[parent], heap[c]];
+                        c = parent;
+                    }
+                } else if (p > probabilities[heap[0]]) {
+                    heap[0] = i;
+                    let c = 0;
+                    for (;;) {
+                        const l = 2 * c + 1, r = l + 1;
+                        let m = c;
+                        if (l < heap.length && less(heap[l], heap[m])) m = l;
+                        if (r < heap.length && less(heap[r], heap[m])) m = r;
+                        if (m === c) break;
+                        [heap[c], heap[m]] = [heap[m], heap[c]];
+                        c = m;
+                    }
+                }
+            }
+            selected = heap.sort((a, b) => a - b);
         }
 
-        return { amplitudes, probabilities };
+        return selected.map(i => {
+            const amp = { re: amplitudes[i << 1], im: amplitudes[(i << 1) + 1] };
+            return {
+                index: i,
+                basis: this.basisLabel(i),
+                amplitude: amp,
+                magnitude: Math.sqrt(probabilities[i]),
+                phase: this.complexPhase(amp),
+                probability: probabilities[i]
+            };
+        });
+    }
+
+    // Full per-state listing ({amplitudes, probabilities} of 2^n objects each).
+    // Fine for a handful of qubits; wide circuits should use getStateArrays().
+    getState() {
+        const entries = this.describeStates(this.getStateArrays());
+        return {
+            amplitudes: entries.map(({ basis, amplitude, magnitude, phase, probability }) =>
+                ({ basis, amplitude, magnitude, phase, probability })),
+            probabilities: entries.map(e => ({ state: e.basis, probability: e.probability }))
+        };
+    }
+
+    // Amplitude of basis state i as {re, im}
+    getAmplitude(i) {
+        if (this.backend) {
+            const amps = this.backend.amps;
+            return { re: amps[i << 1], im: amps[(i << 1) + 1] };
+        }
+        return this.stateVector[i];
     }
 
     // Get Bloch sphere coordinates for a single qubit
     getBlochCoordinates(qubitIndex) {
+        if (this.backend) {
+            return this.backend.getBlochCoordinates(qubitIndex);
+        }
+
         // Calculate reduced density matrix for this qubit
         const size = Math.pow(2, this.numQubits);
         let rho00 = { re: 0, im: 0 };
@@ -421,18 +553,26 @@ class QuantumSimulator {
 
     // Perform measurement (collapse state)
     measure() {
-        const state = this.getState();
+        if (this.backend) {
+            // Sample directly from the amplitudes; avoids building 2^n state objects
+            const index = this.backend.sampleIndex(Math.random());
+            return index.toString(2).padStart(this.numQubits, '0').split('').reverse().join('');
+        }
+
+        const probabilities = this.getStateArrays().probabilities;
         const rand = Math.random();
         let cumulative = 0;
+        let index = probabilities.length - 1;
 
-        for (let i = 0; i < state.probabilities.length; i++) {
-            cumulative += state.probabilities[i].probability;
+        for (let i = 0; i < probabilities.length; i++) {
+            cumulative += probabilities[i];
             if (rand < cumulative) {
-                return state.probabilities[i].state.replace('|', '').replace('⟩', '');
+                index = i;
+                break;
             }
         }
 
-        return state.probabilities[state.probabilities.length - 1].state.replace('|', '').replace('⟩', '');
+        return this.basisLabel(index).slice(1, -1);
     }
 }
 
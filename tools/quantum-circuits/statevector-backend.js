@@ -0,0 +1,250 @@
+/**
+ * State Vector Backend
+ * Interleaved Float64Array amplitudes [re0, im0, re1, im1, ...] with in-place
+ * gate kernels and per-wire fusion of consecutive single-qubit gates
+ */
+
+class StateVectorBackend {
+    constructor(numQubits) {
+        this.numQubits = numQubits;
+        this.size = 1 << numQubits;
+        this.amps = new Float64Array(this.size * 2);
+
+        // Pending fused 2x2 matrix per wire (null = nothing queued)
+        this.pending = new Array(numQubits).fill(null);
+        this.reset();
+    }
+
+    reset() {
+        this.amps.fill(0);
+        this.amps[0] = 1;
+        this.pending.fill(null);
+    }
+
+    // Convert a GATES matrix ([[{re, im}]]) to [m00re, m00im, m01re, m01im, m10re, m10im, m11re, m11im]
+    static toFlatMatrix(matrix) {
+        return new Float64Array([
+            matrix[0][0].re, matrix[0][0].im, matrix[0][1].re, matrix[0][1].im,
+            matrix[1][0].re, matrix[1][0].im, matrix[1][1].re, matrix[1][1].im
+        ]);
+    }
+
+    // Returns g * p (p applied first)
+    static multiply(g, p) {
+        const out = new Float64Array(8);
+        for (let r = 0; r < 2; r++) {
+            for (let c = 0; c < 2; c++) {
+                let re = 0;
+                let im = 0;
+                for (let k = 0; k < 2; k++) {
+                    const gi = (r * 2 + k) * 2;
+                    const pi = (k * 2 + c) * 2;
+                    re += g[gi] * p[pi] - g[gi + 1] * p[pi + 1];
+                    im += g[gi] * p[pi + 1] + g[gi + 1] * p[pi];
+                }
+                out[(r * 2 + c) * 2] = re;
+                out[(r * 2 + c) * 2 + 1] = im;
+            }
+        }
+        return out;
+    }
+
+    // Queue a single-qubit gate; it is fused with earlier gates on the same wire
+    queueSingleQubitGate(qubit, matrix) {
+        const queued = this.pending[qubit];
+        this.pending[qubit] = queued ? StateVectorBackend.multiply(matrix, queued) : matrix;
+    }
+
+    flush(qubit) {
+        const matrix = this.pending[qubit];
+        if (matrix) {
+            this.pending[qubit] = null;
+            this.applyMatrix(qubit, matrix);
+        }
+    }
+
+    flushAll() {
+        for (let q = 0; q < this.numQubits; q++) {
+            this.flush(q);
+        }
+    }
+
+    // In-place pair update: (a0, a1) <- M (a0, a1) for every pair differing in `qubit`
+    applyMatrix(qubit, m) {
+        const a = this.amps;
+        const stride = 1 << qubit;
+        const size = this.size;
+        const m00r = m[0], m00i = m[1], m01r = m[2], m01i = m[3];
+        const m10r = m[4], m10i = m[5], m11r = m[6], m11i = m[7];
+
+        if (m01r === 0 && m01i === 0 && m10r === 0 && m10i === 0) {
+            // Diagonal (Z, S, T, ...): scale each half independently
+            const skip0 = m00r === 1 && m00i === 0;
+            for (let base = 0; base < size; base += stride << 1) {
+                for (let i = base; i < base + stride; i++) {
+                    if (!skip0) {
+                        const i0 = i << 1;
+                        const ar = a[i0], ai = a[i0 + 1];
+                        a[i0] = m00r * ar - m00i * ai;
+                        a[i0 + 1] = m00r * ai + m00i * ar;
+                    }
+                    const i1 = (i + stride) << 1;
+                    const br = a[i1], bi = a[i1 + 1];
+                    a[i1] = m11r * br - m11i * bi;
+                    a[i1 + 1] = m11r * bi + m11i * br;
+                }
+            }
+            return;
+        }
+
+        for (let base = 0; base < size; base += stride << 1) {
+            for (let i = base; i < base + stride; i++) {
+                const i0 = i << 1;
+                const i1 = (i + stride) << 1;
+                const ar = a[i0], ai = a[i0 + 1];
+                const br = a[i1], bi = a[i1 + 1];
+                a[i0] = (m00r * ar - m00i * ai) + (m01r * br - m01i * bi);
+                a[i0 + 1] = (m00r * ai + m00i * ar) + (m01r * bi + m01i * br);
+                a[i1] = (m10r * ar - m10i * ai) + (m11r * br - m11i * bi);
+                a[i1 + 1] = (m10r * ai + m10i * ar) + (m11r * bi + m11i * br);
+            }
+        }
+    }
+
+    // Two-qubit kernels visit only the size/4 indices with both qubit bits clear:
+    // the applyMatrix block loop, nested once per qubit (outer loop = higher bit),
+    // then offset by the bits the gate acts on
+    applyCNOT(controlQubit, targetQubit) {
+        this.flush(controlQubit);
+        this.flush(targetQubit);
+
+        const a = this.amps;
+        const cMask = 1 << controlQubit;
+        const tMask = 1 << targetQubit;
+        const hi = Math.max(cMask, tMask);
+        const lo = Math.min(cMask, tMask);
+        for (let outer = 0; outer < this.size; outer += hi << 1) {
+            for (let base = outer; base < outer + hi; base += lo << 1) {
+                for (let i = base; i < base + lo; i++) {
+                    // (control=1, target=0) <-> (control=1, target=1)
+                    this.swapAmplitudes(a, i | cMask, i | cMask | tMask);
+                }
+            }
+        }
+    }
+
+    applySWAP(qubit1, qubit2) {
+        if (qubit1 === qubit2) return;
+        this.flush(qubit1);
+        this.flush(qubit2);
+
+        const a = this.amps;
+        const mask1 = 1 << qubit1;
+        const mask2 = 1 << qubit2;
+        const hi = Math.max(mask1, mask2);
+        const lo = Math.min(mask1, mask2);
+        for (let outer = 0; outer < this.size; outer += hi << 1) {
+            for (let base = outer; base < outer + hi; base += lo << 1) {
+                for (let i = base; i < base + lo; i++) {
+                    this.swapAmplitudes(a, i | mask1, i | mask2);
+                }
+            }
+        }
+    }
+
+    applyCZ(controlQubit, targetQubit) {
+        this.flush(controlQubit);
+        this.flush(targetQubit);
+
+        const a = this.amps;
+        const hi = 1 << Math.max(controlQubit, targetQubit);
+        const lo = 1 << Math.min(controlQubit, targetQubit);
+        for (let outer = 0; outer < this.size; outer += hi << 1) {
+            for (let base = outer; base < outer + hi; base += lo << 1) {
+                for (let i = base; i < base + lo; i++) {
+                    const k = (i | hi | lo) << 1;
+                    a[k] = -a[k];
+                    a[k + 1] = -a[k + 1];
+                }
+            }
+        }
+    }
+
+    applyControlledPhase(controlQubit, targetQubit, angle) {
+        this.flush(controlQubit);
+        this.flush(targetQubit);
+
+        const a = this.amps;
+        const hi = 1 << Math.max(controlQubit, targetQubit);
+        const lo = 1 << Math.min(controlQubit, targetQubit);
+        const pr = Math.cos(angle);
+        const pi = Math.sin(angle);
+        for (let outer = 0; outer < this.size; outer += hi << 1) {
+            for (let base = outer; base < outer + hi; base += lo << 1) {
+                for (let i = base; i < base + lo; i++) {
+                    const k = (i | hi | lo) << 1;
+                    const re = a[k], im = a[k + 1];
+                    a[k] = re * pr - im * pi;
+                    a[k + 1] = re * pi + im * pr;
+                }
+            }
+        }
+    }
+
+    swapAmplitudes(a, i, j) {
+        const ki = i << 1;
+        const kj = j << 1;
+        const re = a[ki], im = a[ki + 1];
+        a[ki] = a[kj];
+        a[ki + 1] = a[kj + 1];
+        a[kj] = re;
+        a[kj + 1] = im;
+    }
+
+    // Reduced density matrix entries for one qubit in a single pass over the pairs
+    getBlochCoordinates(qubitIndex) {
+        this.flushAll();
+
+        const a = this.amps;
+        const stride = 1 << qubitIndex;
+        let rho00 = 0;
+        let rho11 = 0;
+        let rho01re = 0;
+        let rho01im = 0;
+
+        for (let base = 0; base < this.size; base += stride << 1) {
+            for (let i = base; i < base + stride; i++) {
+                const i0 = i << 1;
+                const i1 = (i + stride) << 1;
+                const ar = a[i0], ai = a[i0 + 1];
+                const br = a[i1], bi = a[i1 + 1];
+                rho00 += ar * ar + ai * ai;
+                rho11 += br * br + bi * bi;
+                // amp0 * conj(amp1)
+                rho01re += ar * br + ai * bi;
+                rho01im += ai * br - ar * bi;
+            }
+        }
+
+        return { x: 2 * rho01re, y: 2 * rho01im, z: rho00 - rho11 };
+    }
+
+    // Sample a basis index from |amplitude|²
+    sampleIndex(rand) {
+        this.flushAll();
+
+        const a = this.amps;
+        let cumulative = 0;
+        for (let i = 0; i < this.size; i++) {
+            const re = a[i << 1];
+            const im = a[(i << 1) + 1];
+            const mag = Math.sqrt(re * re + im * im);
+            cumulative += mag * mag;
+            if (rand < cumulative) return i;
+        }
+        return this.size - 1;
+    }
+}
+
+// Export for use
+window.StateVectorBackend = StateVectorBackend;
@@ -0,0 +1,432 @@
+/**
+ * Expression Compiler - shared by the function plotters
+ * Lowers a math.js AST into straight-line JavaScript that evaluates a whole
+ * Float64Array of inputs per call, with an LRU cache keyed by the normalized
+ * expression and an adaptive sampler that only refines near curvature and
+ * discontinuities. Subtrees it cannot lower are evaluated by math.js and called
+ * from the generated code, so results always match math.js (non-real results
+ * become NaN).
+ */
+
+const ExpressionCompiler = (function () {
+    const math = window.math;
+
+    const CACHE_SIZE = 64;
+    const cache = new Map();
+    // Raw input string -> normalized cache key, so exact repeats skip parsing
+    const aliases = new Map();
+
+    const CONSTANTS = {
+        pi: 'Math.PI',
+        PI: 'Math.PI',
+        e: 'Math.E',
+        E: 'Math.E',
+        tau: '(2 * Math.PI)',
+        Infinity: 'Infinity',
+        NaN: 'NaN'
+    };
+
+    // Functions whose math.js number implementation is (or reduces to) the
+    // expression below; domain errors that math.js turns into Complex become NaN
+    const FUNCTIONS = {
+        sin: { arity: [1], code: a => `Math.sin(${a[0]})` },
+        cos: { arity: [1], code: a => `Math.cos(${a[0]})` },
+        tan: { arity: [1], code: a => `Math.tan(${a[0]})` },
+        asin: { arity: [1], code: a => `Math.asin(${a[0]})` },
+        acos: { arity: [1], code: a => `Math.acos(${a[0]})` },
+        atan: { arity: [1], code: a => `Math.atan(${a[0]})` },
+        atan2: { arity: [2], code: a => `Math.atan2(${a[0]}, ${a[1]})` },
+        sinh: { arity: [1], code: a => `Math.sinh(${a[0]})` },
+        cosh: { arity: [1], code: a => `Math.cosh(${a[0]})` },
+        tanh: { arity: [1], code: a => `Math.tanh(${a[0]})` },
+        sqrt: { arity: [1], code: a => `Math.sqrt(${a[0]})`, complex: true },
+        cbrt: { arity: [1], code: a => `Math.cbrt(${a[0]})` },
+        abs: { arity: [1], code: a => `Math.abs(${a[0]})` },
+        sign: { arity: [1], code: a => `Math.sign(${a[0]})` },
+        exp: { arity: [1], code: a => `Math.exp(${a[0]})` },
+        log: {
+            arity: [1, 2],
+            code: a => a.length === 1 ? `Math.log(${a[0]})` : `(Math.log(${a[0]}) / Math.log(${a[1]}))`,
+            complex: true
+        },
+        log10: { arity: [1], code: a => `Math.log10(${a[0]})`, complex: true },
+        log2: { arity: [1], code: a => `Math.log2(${a[0]})`, complex: true },
+        square: { arity: [1], code: a => `H.square(${a[0]})` },
+        cube: { arity: [1], code: a => `H.cube(${a[0]})` },
+        floor: { arity: [1], code: a => `H.floor(${a[0]})` },
+        ceil: { arity: [1], code: a => `H.ceil(${a[0]})` },
+        round: { arity: [1], code: a => `H.round(${a[0]})` }
+    };
+
+    // Distance from an integer (or half-integer) below which math.js applies
+    // its epsilon correction; only those inputs are handed to math.js itself
+    const NEAR = 1e-9;
+
+    const helpers = {
+        square: x => x * x,
+        cube: x => x * x * x,
+        // math.js powNumber, with non-real results (negative base, fractional exponent) as NaN
+        pow: (x, y) => {
+            if (Number.isInteger(y) || x >= 0) {
+                if ((x * x < 1 && y === Infinity) || (x * x > 1 && y === -Infinity)) return 0;
+                return Math.pow(x, y);
+            }
+            return NaN;
+        },
+        floor: x => {
+            const f = Math.floor(x);
+            return x - f > NEAR && f + 1 - x > NEAR ? f : math.floor(x);
+        },
+        ceil: x => {
+            const c = Math.ceil(x);
+            return c - x > NEAR && x - c + 1 > NEAR ? c : math.ceil(x);
+        },
+        round: x => {
+            const ax = Math.abs(x);
+            const frac = ax - Math.floor(ax);
+            // math.js rounds half away from zero
+            return Math.abs(frac - 0.5) > NEAR ? Math.sign(x) * Math.round(ax) : math.round(x);
+        }
+    };
+
+    // ============================================
+    // LOWERING
+    // ============================================
+
+    // Returns { code, complex } or null when the node itself has no lowering.
+    // `complex` marks subtrees that math.js could evaluate to a Complex.
+    // Children without a lowering become math.js calls collected in `fallbacks`.
+    function lower(node, variables, fallbacks) {
+        if (node.isParenthesisNode) return lower(node.content, variables, fallbacks);
+
+        if (node.isConstantNode) {
+            if (typeof node.value !== 'number') return null;
+            return { code: `(${numberLiteral(node.value)})`, complex: false };
+        }
+
+        if (node.isSymbolNode) {
+            const slot = variables.indexOf(node.name);
+            if (slot !== -1) return { code: `v${slot}`, complex: false };
+            if (CONSTANTS[node.name]) return { code: CONSTANTS[node.name], complex: false };
+            return null;
+        }
+
+        if (node.isOperatorNode) {
+            const args = lowerAll(node.args, variables, fallbacks);
+            const code = args.map(a => a.code);
+            const complex = args.some(a => a.complex);
+
+            switch (node.fn) {
+                case 'add': return { code: `(${code[0]} + ${code[1]})`, complex };
+                case 'subtract': return { code: `(${code[0]} - ${code[1]})`, complex };
+                case 'multiply': return { code: `(${code[0]} * ${code[1]})`, complex };
+                case 'divide': return { code: `(${code[0]} / ${code[1]})`, complex };
+                case 'unaryMinus': return { code: `(-${code[0]})`, complex };
+                case 'unaryPlus': return { code: code[0], complex };
+                case 'pow': {
+                    // Constant integer exponents never leave the reals
+                    if (isConstantInteger(node.args[1])) {
+                        return { code: `Math.pow(${code[0]}, ${code[1]})`, complex };
+                    }
+                    const base = node.args[0];
+                    const realBase = base.isConstantNode && base.value >= 0;
+                    return { code: `H.pow(${code[0]}, ${code[1]})`, complex: complex || !realBase };
+                }
+                default: return null;
+            }
+        }
+
+        if (node.isFunctionNode) {
+            if (!node.fn || !node.fn.isSymbolNode) return null;
+            const spec = FUNCTIONS[node.fn.name];
+            if (!spec || !spec.arity.includes(node.args.length)) return null;
+            // abs() maps Complex back to a real number, so a complex argument
+            // would give a different answer than NaN; leave it to math.js
+            const args = lowerAll(node.args, variables, fallbacks);
+            if (node.fn.name === 'abs' && args[0].complex) return null;
+            return {
+                code: spec.code(args.map(a => a.code)),
+                complex: !!spec.complex || args.some(a => a.complex)
+            };
+        }
+
+        return null;
+    }
+
+    // Lower a subtree, or hand it to math.js as fallback F[k]. Its result may
+    // be non-real, so it is marked complex.
+    function lowerOrFallback(node, variables, fallbacks) {
+        const mark = fallbacks.length;
+        const lowered = lower(node, variables, fallbacks);
+        if (lowered) return lowered;
+
+        // Drop fallbacks registered by children of a node math.js now evaluates whole
+        fallbacks.length = mark;
+        fallbacks.push(mathjsScalar(node, variables));
+        const params = variables.map((_, i) => `v${i}`).join(', ');
+        return { code: `F[${fallbacks.length - 1}](${params})`, complex: true };
+    }
+
+    function lowerAll(nodes, variables, fallbacks) {
+        return nodes.map(n => lowerOrFallback(n, variables, fallbacks));
+    }
+
+    // math.js evaluation of one node as f(...vars), sharing one scope object
+    // across calls. Booleans count as 0/1 as in math.js arithmetic.
+    function mathjsScalar(node, variables) {
+        const compiled = node.compile();
+        const scope = {};
+        return function () {
+            for (let v = 0; v < variables.length; v++) scope[variables[v]] = arguments[v];
+            try {
+                const result = compiled.evaluate(scope);
+                if (typeof result === 'number') return result;
+                return typeof result === 'boolean' ? +result : NaN;
+            } catch (e) {
+                return NaN;
+            }
+        };
+    }
+
+    function isConstantInteger(node) {
+        while (node.isParenthesisNode) node = node.content;
+        if (node.isOperatorNode && node.fn === 'unaryMinus') return isConstantInteger(node.args[0]);
+        return node.isConstantNode && Number.isInteger(node.value);
+    }
+
+    function numberLiteral(value) {
+        if (value === Infinity) return 'Infinity';
+        if (value === -Infinity) return '-Infinity';
+        if (Number.isNaN(value)) return 'NaN';
+        return String(value);
+    }
+
+    // Build the scalar and batch functions from the lowered body
+    function generate(body, variables, fallbacks) {
+        const params = variables.map((_, i) => `v${i}`);
+        const columns = variables.map((_, i) => `c${i}`);
+        const loads = variables.map((_, i) => `const v${i} = c${i}[i];`).join(' ');
+
+        const source = `
+            "use strict";
+            function scalar(${params.join(', ')}) {
+                return ${body};
+            }
+            function batch(out, n, ${columns.join(', ')}) {
+                for (let i = 0; i < n; i++) {
+                    ${loads}
+                    out[i] = ${body};
+                }
+                return out;
+            }
+            return { scalar, batch };
+        `;
+        return new Function('H', 'F', source)(helpers, fallbacks);
+    }
+
+    // ============================================
+    // COMPILED EXPRESSION
+    // ============================================
+
+    function createCompiled(expression, node, variables) {
+        const fallbacks = [];
+        const lowered = lowerOrFallback(node, variables, fallbacks);
+        const { scalar, batch } = generate(lowered.code, variables, fallbacks);
+
+        return {
+            expression,
+            variables,
+            node,
+            // true when no part of the expression goes through math.js
+            lowered: fallbacks.length === 0,
+            fallbacks: fallbacks.length,
+            evaluate: scalar,
+            /**
+             * Evaluate over whole columns of inputs
+             * @param {Float64Array|Float64Array[]} columns - One array per variable (or one array for a single variable)
+             * @param {Float64Array} [out] - Output buffer, allocated when omitted
+             * @returns {Float64Array}
+             */
+            evaluateBatch(columns, out) {
+                if (!Array.isArray(columns)) columns = [columns];
+                const n = columns[0].length;
+                if (!out || out.length < n) out = new Float64Array(n);
+                return batch(out, n, ...columns);
+            }
+        };
+    }
+
+    /**
+     * Compile an expression (string or math.js node) for the given variables
+     * @param {string|Object} expr - Expression string or math.js AST
+     * @param {string[]} variables - Free variable names, in argument order
+     * @returns {Object} - { expression, lowered, evaluate(...vars), evaluateBatch(columns, out?) }
+     */
+    function compile(expr, variables = ['x']) {
+        const raw = typeof expr === 'string' ? variables.join(',') + '|' + expr : null;
+        let key = raw !== null ? aliases.get(raw) : undefined;
+        let node = null;
+
+        if (key === undefined) {
+            // Key on the printed AST so spacing and redundant parentheses
+            // ("x^2+1" vs "x ^ 2 + 1") share one compiled entry
+            node = typeof expr === 'string' ? math.parse(expr) : expr;
+            key = variables.join(',') + '|' + node.toString();
+            if (raw !== null) {
+                aliases.set(raw, key);
+                if (aliases.size > CACHE_SIZE * 4) {
+                    aliases.delete(aliases.keys().next().value);
+                }
+            }
+        }
+
+        const hit = cache.get(key);
+        if (hit) {
+            // Refresh recency
+            cache.delete(key);
+            cache.set(key, hit);
+            return hit;
+        }
+
+        if (!node) node = math.parse(expr);
+        const expression = typeof expr === 'string' ? expr : expr.toString();
+        const compiled = createCompiled(expression, node, variables);
+
+        cache.set(key, compiled);
+        if (cache.size > CACHE_SIZE) {
+            cache.delete(cache.keys().next().value);
+        }
+        return compiled;
+    }
+
+    function clearCache() {
+        cache.clear();
+        aliases.clear();
+    }
+
+    // ============================================
+    // SAMPLING
+    // ============================================
+
+    // n evenly spaced values from min to max (endpoints exact)
+    function linspace(min, max, n) {
+        const xs = new Float64Array(n);
+        const step = n > 1 ? (max - min) / (n - 1) : 0;
+        for (let i = 0; i < n; i++) xs[i] = min + i * step;
+        if (n > 1) xs[n - 1] = max;
+        return xs;
+    }
+
+    // Spread of the finite samples between the 5th and 95th percentiles. Near a
+    // pole the full min-max range is dominated by a few huge values, which would
+    // make the tolerances too loose to refine exactly where the curve needs it.
+    function robustRange(ys) {
+        const finite = [];
+        for (let i = 0; i < ys.length; i++) {
+            if (Number.isFinite(ys[i])) finite.push(ys[i]);
+        }
+        if (finite.length < 2) return 1;
+
+        const sorted = Float64Array.from(finite).sort();
+        const last = sorted.length - 1;
+        const range = sorted[Math.round(last * 0.95)] - sorted[Math.round(last * 0.05)];
+        if (range > 0) return range;
+        // Mostly flat: fall back to the full finite range, then to 1
+        return sorted[last] > sorted[0] ? sorted[last] - sorted[0] : 1;
+    }
+
+    /**
+     * Adaptive sampling of y = f(x) on [xMin, xMax]
+     * Starts from a coarse uniform grid and repeatedly bisects only the intervals
+     * where the curve bends more than `tolerance` away from a straight line, jumps
+     * by more than `jump`, or changes between finite and non-finite.
+     * @param {Object} compiled - Result of compile() with a single variable
+     * @param {number} xMin - Domain start
+     * @param {number} xMax - Domain end
+     * @param {Object} [options] - { initial, maxPoints, maxDepth, tolerance, jump }
+     *   tolerance/jump default to fractions of the coarse grid's 5th-95th percentile y-range
+     * @returns {Object} - { x: Float64Array, y: Float64Array }
+     */
+    function sampleAdaptive(compiled, xMin, xMax, options = {}) {
+        const initial = Math.max(3, options.initial || 256);
+        const maxPoints = options.maxPoints || 20000;
+        const maxDepth = options.maxDepth || 10;
+
+        let xs = linspace(xMin, xMax, initial);
+        let ys = compiled.evaluateBatch(xs);
+
+        let tolerance = options.tolerance;
+        let jump = options.jump;
+        if (tolerance === undefined || jump === undefined) {
+            const range = robustRange(ys);
+            if (tolerance === undefined) tolerance = range * 1e-3;
+            if (jump === undefined) jump = range * 0.05;
+        }
+
+        let flags = new Uint8Array(initial);
+        for (let depth = 0; depth < maxDepth; depth++) {
+            const n = xs.length;
+            if (flags.length < n) flags = new Uint8Array(n);
+            flags.fill(0, 0, n);
+
+            // Flag interval [i, i+1] for refinement
+            let count = 0;
+            for (let i = 0; i < n - 1; i++) {
+                const y0 = ys[i];
+                const y1 = ys[i + 1];
+                const finite0 = Number.isFinite(y0);
+                const finite1 = Number.isFinite(y1);
+                if (finite0 !== finite1 || (finite0 && Math.abs(y1 - y0) > jump)) {
+                    if (!flags[i]) { flags[i] = 1; count++; }
+                }
+            }
+            for (let i = 1; i < n - 1; i++) {
+                const ya = ys[i - 1];
+                const yb = ys[i];
+                const yc = ys[i + 1];
+                if (!Number.isFinite(ya) || !Number.isFinite(yb) || !Number.isFinite(yc)) continue;
+                // Deviation of the middle sample from the chord of its neighbours
+                const t = (xs[i] - xs[i - 1]) / (xs[i + 1] - xs[i - 1]);
+                if (Math.abs(yb - (ya + t * (yc - ya))) > tolerance) {
+                    if (!flags[i - 1]) { flags[i - 1] = 1; count++; }
+                    if (!flags[i]) { flags[i] = 1; count++; }
+                }
+            }
+
+            if (count === 0 || n + count > maxPoints) break;
+
+            // Evaluate all new midpoints in one batch
+            const mids = new Float64Array(count);
+            for (let i = 0, k = 0; i < n - 1; i++) {
+                if (flags[i]) mids[k++] = 0.5 * (xs[i] + xs[i + 1]);
+            }
+            const midYs = compiled.evaluateBatch(mids);
+
+            // Merge midpoints into the sorted sample arrays
+            const nextXs = new Float64Array(n + count);
+            const nextYs = new Float64Array(n + count);
+            for (let i = 0, j = 0, k = 0; i < n; i++) {
+                nextXs[j] = xs[i];
+                nextYs[j++] = ys[i];
+                if (i < n - 1 && flags[i]) {
+                    nextXs[j] = mids[k];
+                    nextYs[j++] = midYs[k++];
+                }
+            }
+            xs = nextXs;
+            ys = nextYs;
+        }
+
+        return { x: xs, y: ys };
+    }
+
+    // Public API
+    return {
+        compile,
+        clearCache,
+        linspace,
+        sampleAdaptive
+    };
+})();
+
+window.ExpressionCompiler = ExpressionCompiler;
@@ -242,8 +242,7 @@ function updateEigenvalueList() {
 function updateSpectralAnalysis() {
     const numComponents = spectralEngine.getNumConnectedComponents();
     const algebraicConn = spectralEngine.getAlgebraicConnectivity();
-    const result = spectralEngine.computeEigendecomposition();
-    const spectralRadius = result.eigenvalues.length > 0 ? Math.max(...result.eigenvalues) : 0;
+    const spectralRadius = spectralEngine.getSpectralRadius();
 
     document.getElementById('spectralAnalysis').innerHTML = `
         <div class="analysis-item">
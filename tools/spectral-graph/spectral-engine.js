@@ -1,31 +1,40 @@
 /**
  * Spectral Graph Theory Engine
- * Computes Laplacian matrices, eigenvalues, and spectral decomposition
+ * Computes Laplacian matrices, eigenvalues, and spectral decomposition.
+ * Small graphs use dense Jacobi on the full Laplacian; large graphs use a
+ * CSR Laplacian and thick-restart Lanczos for the k smallest eigenpairs.
  */
 
 class SpectralEngine {
+    // Graphs with at least this many nodes take the sparse Lanczos path
+    static SPARSE_MIN_NODES = 200;
+    // Eigenpairs computed by the sparse path when the caller does not ask for k
+    static SPARSE_EIGENPAIRS = 10;
+
     constructor() {
         this.adjacencyMatrix = [];
         this.laplacianType = 'combinatorial';
+        this.adjacencyCSR = null;
+        this.spectrumCache = null;
+        this.spectralRadiusCache = null;
     }
 
     setAdjacencyMatrix(matrix) {
         this.adjacencyMatrix = matrix.map(row => [...row]);
+        this.adjacencyCSR = null;
+        this.spectrumCache = null;
+        this.spectralRadiusCache = null;
     }
 
     getSize() {
         return this.adjacencyMatrix.length;
     }
 
+    // Number of nonzero entries per row (a self-loop counts once)
     getDegrees() {
-        const n = this.getSize();
-        return Array(n).fill(0).map((_, i) => {
-            let degree = 0;
-            for (let j = 0; j < n; j++) {
-                if (this.adjacencyMatrix[i][j] !== 0) degree++;
-            }
-            return degree;
-        });
+        const adj = this.getAdjacencyCSR();
+        return Array(adj.size).fill(0).map((_, i) =>
+            adj.rowPtr[i + 1] - adj.rowPtr[i] + (this.adjacencyMatrix[i][i] !== 0 ? 1 : 0));
     }
 
     getLaplacian(type = null) {
@@ -62,8 +71,170 @@ class SpectralEngine {
         return L;
     }
 
-    computeEigendecomposition() {
-        const L = this.getLaplacian();
+    // ============================================
+    // SPARSE (CSR) REPRESENTATION
+    // ============================================
+
+    // Nonzero structure of the adjacency matrix (diagonal excluded), cached per graph
+    getAdjacencyCSR() {
+        if (this.adjacencyCSR) return this.adjacencyCSR;
+
+        const A = this.adjacencyMatrix;
+        const n = this.getSize();
+        const rowPtr = new Int32Array(n + 1);
+        let nnz = 0;
+        for (let i = 0; i < n; i++) {
+            const row = A[i];
+            for (let j = 0; j < n; j++) {
+                if (j !== i && row[j] !== 0) nnz++;
+            }
+            rowPtr[i + 1] = nnz;
+        }
+
+        const colIndex = new Int32Array(nnz);
+        const values = new Float64Array(nnz);
+        for (let i = 0, k = 0; i < n; i++) {
+            const row = A[i];
+            for (let j = 0; j < n; j++) {
+                if (j !== i && row[j] !== 0) {
+                    colIndex[k] = j;
+                    values[k++] = row[j];
+                }
+            }
+        }
+
+        this.adjacencyCSR = { size: n, rowPtr, colIndex, values };
+        return this.adjacencyCSR;
+    }
+
+    /**
+     * Laplacian in CSR form, with the same entries as getLaplacian(type)
+     * Each row stores its diagonal first, then the off-diagonal nonzeros
+     */
+    getSparseLaplacian(type = null) {
+        const laplacianType = type || this.laplacianType;
+        const adj = this.getAdjacencyCSR();
+        const n = adj.size;
+        const degrees = this.getDegrees();
+
+        const rowPtr = new Int32Array(n + 1);
+        const colIndex = new Int32Array(adj.colIndex.length + n);
+        const values = new Float64Array(adj.colIndex.length + n);
+
+        let k = 0;
+        for (let i = 0; i < n; i++) {
+            const di = degrees[i];
+            colIndex[k] = i;
+            values[k++] = laplacianType === 'combinatorial' ? di : (di > 0 ? 1 : 0);
+
+            for (let p = adj.rowPtr[i]; p < adj.rowPtr[i + 1]; p++) {
+                const j = adj.colIndex[p];
+                const a = adj.values[p];
+                let value;
+                if (laplacianType === 'combinatorial') value = -a;
+                else if (laplacianType === 'normalized') value = di > 0 && degrees[j] > 0 ? -a / Math.sqrt(di * degrees[j]) : 0;
+                else value = di > 0 ? -a / di : 0;
+                colIndex[k] = j;
+                values[k++] = value;
+            }
+            rowPtr[i + 1] = k;
+        }
+
+        return { size: n, rowPtr, colIndex, values };
+    }
+
+    // out = M x
+    static csrMultiply(M, x, out) {
+        const { size, rowPtr, colIndex, values } = M;
+        for (let i = 0; i < size; i++) {
+            let sum = 0;
+            for (let p = rowPtr[i]; p < rowPtr[i + 1]; p++) {
+                sum += values[p] * x[colIndex[p]];
+            }
+            out[i] = sum;
+        }
+        return out;
+    }
+
+    // Connected components by breadth-first search, each a sorted list of node indices
+    getConnectedComponents() {
+        const adj = this.getAdjacencyCSR();
+        const n = adj.size;
+        const component = new Int32Array(n).fill(-1);
+        const queue = new Int32Array(n);
+        const components = [];
+
+        for (let start = 0; start < n; start++) {
+            if (component[start] !== -1) continue;
+            const id = components.length;
+            let head = 0;
+            let tail = 0;
+            queue[tail++] = start;
+            component[start] = id;
+
+            while (head < tail) {
+                const u = queue[head++];
+                for (let p = adj.rowPtr[u]; p < adj.rowPtr[u + 1]; p++) {
+                    const v = adj.colIndex[p];
+                    if (component[v] === -1) {
+                        component[v] = id;
+                        queue[tail++] = v;
+                    }
+                }
+            }
+            components.push(Array.from(queue.subarray(0, tail)).sort((a, b) => a - b));
+        }
+        return components;
+    }
+
+    // ============================================
+    // EIGENDECOMPOSITION
+    // ============================================
+
+    /**
+     * Eigenvalues (ascending) and matching eigenvectors of the current Laplacian
+     * @param {number} [k] - Only the k smallest eigenpairs; large graphs default
+     *   to SPARSE_EIGENPAIRS, small graphs to the full spectrum
+     */
+    computeEigendecomposition(k = null) {
+        const n = this.getSize();
+        const sparse = n >= SpectralEngine.SPARSE_MIN_NODES;
+        const count = Math.min(n, k || (sparse ? SpectralEngine.SPARSE_EIGENPAIRS : n));
+
+        // Repeated queries (Fiedler vector, connectivity, spectrum) share one solve
+        const cached = this.spectrumCache;
+        if (cached && cached.type === this.laplacianType && cached.result.eigenvalues.length >= count) {
+            return count === cached.result.eigenvalues.length ? cached.result : {
+                eigenvalues: cached.result.eigenvalues.slice(0, count),
+                eigenvectors: cached.result.eigenvectors.slice(0, count)
+            };
+        }
+
+        const result = SpectralEngine.freezeResult(
+            sparse ? this.computeSparseEigenpairs(count) : this.computeDenseEigendecomposition());
+        this.spectrumCache = { type: this.laplacianType, result };
+        return count === result.eigenvalues.length ? result : {
+            eigenvalues: result.eigenvalues.slice(0, count),
+            eigenvectors: result.eigenvectors.slice(0, count)
+        };
+    }
+
+    // Cached results are shared between callers, so they are read-only
+    static freezeResult(result) {
+        result.eigenvectors.forEach(Object.freeze);
+        Object.freeze(result.eigenvalues);
+        Object.freeze(result.eigenvectors);
+        return Object.freeze(result);
+    }
+
+    /**
+     * Full spectrum from the dense Laplacian. The random-walk Laplacian is not
+     * symmetric, so (as on the sparse path) it is solved through the normalized
+     * one and its eigenvectors are mapped back with D^(-1/2).
+     */
+    computeDenseEigendecomposition() {
+        const randomWalk = this.laplacianType !== 'combinatorial' && this.laplacianType !== 'normalized';
+        const L = this.getLaplacian(randomWalk ? 'normalized' : null);
         const n = L.length;
         if (n === 0) return { eigenvalues: [], eigenvectors: [] };
         if (n === 1) return { eigenvalues: [L[0][0]], eigenvectors: [[1]] };
@@ -72,118 +243,351 @@ class SpectralEngine {
         const indices = Array(n).fill(0).map((_, i) => i);
         indices.sort((a, b) => result.eigenvalues[a] - result.eigenvalues[b]);
 
+        const eigenvectors = indices.map(i => result.eigenvectors[i]);
+        if (randomWalk) {
+            const degrees = this.getDegrees();
+            for (const vector of eigenvectors) {
+                for (let i = 0; i < n; i++) {
+                    if (degrees[i] > 0) vector[i] /= Math.sqrt(degrees[i]);
+                }
+                SpectralEngine.normalizeVector(vector);
+            }
+        }
+
         return {
             eigenvalues: indices.map(i => result.eigenvalues[i]),
-            eigenvectors: indices.map(i => result.eigenvectors[i])
+            eigenvectors
         };
     }
 
     /**
-     * Jacobi eigenvalue algorithm for symmetric matrices
-     * Improved version with better numerical stability
+     * k smallest eigenpairs from the CSR Laplacian
+     * The null space is deflated exactly from the connected components; the rest
+     * comes from Lanczos runs, each deflated against every pair found so far, until
+     * a run turns up nothing below the current k-th eigenvalue (this recovers the
+     * extra copies of repeated eigenvalues that a single Krylov space misses).
+     * The random-walk Laplacian shares its spectrum with the normalized one;
+     * its eigenvectors are D^(-1/2) times the normalized ones.
      */
-    jacobiEigenvalue(matrix, maxIter = 200, tol = 1e-12) {
-        const n = matrix.length;
+    computeSparseEigenpairs(k) {
+        const n = this.getSize();
+        k = Math.min(k, n);
+        if (k === 0) return { eigenvalues: [], eigenvectors: [] };
 
-        // Make a fresh copy
-        let A = [];
-        for (let i = 0; i < n; i++) {
-            A[i] = [];
-            for (let j = 0; j < n; j++) {
-                A[i][j] = matrix[i][j];
+        const type = this.laplacianType === 'combinatorial' ? 'combinatorial' : 'normalized';
+        const L = this.getSparseLaplacian(type);
+        const degrees = this.getDegrees();
+
+        // Null-space vectors: component indicators (scaled by sqrt(degree) when normalized)
+        const pairs = [];
+        const residual = new Float64Array(n);
+        for (const nodes of this.getConnectedComponents()) {
+            const z = new Float64Array(n);
+            for (const i of nodes) {
+                z[i] = type === 'normalized' && degrees[i] > 0 ? Math.sqrt(degrees[i]) : 1;
+            }
+            SpectralEngine.normalizeVector(z);
+            // Weighted edges can move the null space; only deflate exact eigenvectors
+            SpectralEngine.csrMultiply(L, z, residual);
+            if (Math.sqrt(SpectralEngine.dotVectors(residual, residual)) < 1e-10) {
+                pairs.push({ value: 0, vector: z });
             }
         }
 
-        // Initialize eigenvector matrix as identity
-        let V = [];
-        for (let i = 0; i < n; i++) {
-            V[i] = [];
-            for (let j = 0; j < n; j++) {
-                V[i][j] = (i === j) ? 1 : 0;
+        if (pairs.length > k) pairs.length = k;
+        const tol = 1e-8 * SpectralEngine.gershgorinBound(L);
+        let seed = 1;
+
+        while (pairs.length < n) {
+            const found = this.lanczosSmallest(L, k, pairs.map(p => p.vector), seed++);
+            const kth = pairs.length === k ? pairs[k - 1].value : Infinity;
+            const fresh = found.filter(p => p.value < kth - tol);
+            if (fresh.length === 0) break;
+
+            pairs.push(...fresh);
+            pairs.sort((a, b) => a.value - b.value);
+            if (pairs.length > k) pairs.length = k;
+        }
+
+        const eigenvalues = [];
+        const eigenvectors = [];
+        for (const { value, vector } of pairs) {
+            if (this.laplacianType !== 'combinatorial' && this.laplacianType !== 'normalized') {
+                for (let i = 0; i < n; i++) {
+                    if (degrees[i] > 0) vector[i] /= Math.sqrt(degrees[i]);
+                }
+                SpectralEngine.normalizeVector(vector);
             }
+            eigenvalues.push(Math.abs(value) < 1e-10 ? 0 : value);
+            eigenvectors.push(Array.from(vector));
         }
+        return { eigenvalues, eigenvectors };
+    }
 
-        for (let iter = 0; iter < maxIter; iter++) {
-            // Find largest off-diagonal element
-            let maxVal = 0;
-            let p = 0, q = 1;
+    /**
+     * Largest eigenvalue of the CSR Laplacian
+     * L is positive semidefinite with spectrum in [0, sigma], so the largest
+     * eigenvalue of L is sigma minus the smallest one of sigma*I - L.
+     */
+    computeSparseSpectralRadius() {
+        const type = this.laplacianType === 'combinatorial' ? 'combinatorial' : 'normalized';
+        const L = this.getSparseLaplacian(type);
+        if (L.size === 0) return 0;
+
+        const sigma = SpectralEngine.gershgorinBound(L);
+        // getSparseLaplacian stores each row's diagonal first
+        const values = L.values.map(v => -v);
+        for (let i = 0; i < L.size; i++) values[L.rowPtr[i]] += sigma;
+
+        const [smallest] = this.lanczosSmallest({ ...L, values }, 1, []);
+        return smallest ? sigma - smallest.value : 0;
+    }
 
+    /**
+     * Thick-restart Lanczos with full reorthogonalization for the k smallest
+     * eigenpairs of a symmetric CSR matrix, restricted to the complement of `deflation`.
+     * Runs on B = sigma*I - L (sigma = Gershgorin bound), whose largest Ritz values
+     * converge to the smallest eigenvalues of L.
+     */
+    lanczosSmallest(L, k, deflation, seed = 1, maxRestarts = 500, tol = 1e-10) {
+        const n = L.size;
+        const free = n - deflation.length;
+        k = Math.min(k, free);
+        if (k <= 0) return [];
+
+        const sigma = SpectralEngine.gershgorinBound(L);
+        const m = Math.min(free, Math.max(2 * k + 40, 60));
+        const T = new Float64Array(m * m);
+        const V = [];
+        const w = new Float64Array(n);
+
+        // Deterministic start so repeated solves give identical vectors
+        let state = seed * 2654435761 >>> 0;
+        const randomVector = () => {
+            const v = new Float64Array(n);
             for (let i = 0; i < n; i++) {
-                for (let j = i + 1; j < n; j++) {
-                    if (Math.abs(A[i][j]) > maxVal) {
-                        maxVal = Math.abs(A[i][j]);
-                        p = i;
-                        q = j;
-                    }
+                state = (state * 1664525 + 1013904223) >>> 0;
+                v[i] = state / 4294967296 - 0.5;
+            }
+            return v;
+        };
+        const orthogonalize = (v, count) => {
+            // Classical Gram-Schmidt, repeated when the first pass cancelled most
+            // of the vector (DGKS criterion; "twice is enough")
+            const coeffs = new Float64Array(count);
+            for (let pass = 0; pass < 2; pass++) {
+                const before = SpectralEngine.dotVectors(v, v);
+                for (const z of deflation) SpectralEngine.axpy(-SpectralEngine.dotVectors(z, v), z, v);
+                for (let i = 0; i < count; i++) {
+                    const h = SpectralEngine.dotVectors(V[i], v);
+                    coeffs[i] += h;
+                    SpectralEngine.axpy(-h, V[i], v);
                 }
+                if (SpectralEngine.dotVectors(v, v) > 0.5 * before) break;
             }
+            return coeffs;
+        };
+        const freshVector = (count) => {
+            for (let attempt = 0; attempt < 5; attempt++) {
+                const v = randomVector();
+                orthogonalize(v, count);
+                if (SpectralEngine.normalizeVector(v) > 1e-8) return v;
+            }
+            return null;
+        };
 
-            // Check convergence
-            if (maxVal < tol) break;
+        V.push(freshVector(0));
+        if (!V[0]) return [];
 
-            // Compute rotation angle
-            const App = A[p][p];
-            const Aqq = A[q][q];
-            const Apq = A[p][q];
+        let kept = 0;
+        let beta = 0;
+        let ritz = null;
 
-            let theta;
-            if (Math.abs(Aqq - App) < tol) {
-                theta = Math.PI / 4;
-                if (Apq < 0) theta = -theta;
-            } else {
-                theta = 0.5 * Math.atan2(2 * Apq, Aqq - App);
+        for (let restart = 0; restart < maxRestarts; restart++) {
+            // Extend the basis to m vectors; column j of T is V^T B v_j
+            for (let j = kept; j < m; j++) {
+                const vj = V[j];
+                SpectralEngine.csrMultiply(L, vj, w);
+                for (let i = 0; i < n; i++) w[i] = sigma * vj[i] - w[i];
+
+                const h = orthogonalize(w, j + 1);
+                for (let i = 0; i <= j; i++) {
+                    T[i * m + j] = h[i];
+                    T[j * m + i] = h[i];
+                }
+
+                beta = SpectralEngine.normalizeVector(w);
+                if (j + 1 < m) {
+                    if (beta > 1e-12 * sigma) {
+                        V[j + 1] = Float64Array.from(w);
+                    } else {
+                        // Invariant subspace: continue from a new direction
+                        V[j + 1] = freshVector(j + 1);
+                        if (!V[j + 1]) break;
+                    }
+                }
             }
 
-            const c = Math.cos(theta);
-            const s = Math.sin(theta);
+            ritz = SpectralEngine.cyclicJacobi(T, m);
+            let converged = 0;
+            for (let i = 0; i < k; i++) {
+                if (Math.abs(beta * ritz.vectors[(m - 1) * m + ritz.order[i]]) <= tol * sigma) converged++;
+            }
+            if (converged === k || beta <= 1e-12 * sigma) break;
+
+            // Thick restart: keep the best Ritz vectors, append the residual direction
+            const keep = Math.min(m - 1, k + ((m - k) >> 1));
+            const nextV = this.ritzVectors(V, ritz, keep, m);
+            T.fill(0);
+            for (let i = 0; i < keep; i++) T[i * m + i] = ritz.values[ritz.order[i]];
+            nextV.push(Float64Array.from(w));
+            V.length = 0;
+            V.push(...nextV);
+            kept = keep;
+        }
 
-            // Apply Givens rotation to A: A' = G^T * A * G
-            // Store old values
-            const oldApp = App;
-            const oldAqq = Aqq;
-            const oldApq = Apq;
+        const vectors = this.ritzVectors(V, ritz, k, m);
+        return vectors.map((vector, i) => {
+            SpectralEngine.normalizeVector(vector);
+            return { value: sigma - ritz.values[ritz.order[i]], vector };
+        });
+    }
 
-            // Update diagonal elements
-            A[p][p] = c * c * oldApp - 2 * s * c * oldApq + s * s * oldAqq;
-            A[q][q] = s * s * oldApp + 2 * s * c * oldApq + c * c * oldAqq;
-            A[p][q] = 0;
-            A[q][p] = 0;
+    // x_i = V y_i for the first `count` Ritz pairs (in ritz.order)
+    ritzVectors(V, ritz, count, m) {
+        const n = V[0].length;
+        const result = [];
+        for (let c = 0; c < count; c++) {
+            const col = ritz.order[c];
+            const x = new Float64Array(n);
+            for (let j = 0; j < V.length; j++) {
+                const y = ritz.vectors[j * m + col];
+                if (y !== 0) SpectralEngine.axpy(y, V[j], x);
+            }
+            result.push(x);
+        }
+        return result;
+    }
 
-            // Update off-diagonal elements
-            for (let i = 0; i < n; i++) {
-                if (i !== p && i !== q) {
-                    const oldAip = A[i][p];
-                    const oldAiq = A[i][q];
-                    A[i][p] = c * oldAip - s * oldAiq;
-                    A[p][i] = A[i][p];
-                    A[i][q] = s * oldAip + c * oldAiq;
-                    A[q][i] = A[i][q];
+    /**
+     * Cyclic Jacobi sweeps for the small projected matrix T (flat m x m, not modified)
+     * Returns values, column eigenvectors (flat, row-major) and `order`, the column
+     * indices sorted by descending eigenvalue
+     */
+    static cyclicJacobi(T, m, maxSweeps = 60) {
+        const A = Float64Array.from(T);
+        const V = new Float64Array(m * m);
+        for (let i = 0; i < m; i++) V[i * m + i] = 1;
+
+        for (let sweep = 0; sweep < maxSweeps; sweep++) {
+            let off = 0;
+            let norm = 0;
+            for (let p = 0; p < m; p++) {
+                norm += A[p * m + p] * A[p * m + p];
+                for (let q = p + 1; q < m; q++) off += A[p * m + q] * A[p * m + q];
+            }
+            if (off <= 1e-30 * (norm + off)) break;
+
+            for (let p = 0; p < m - 1; p++) {
+                for (let q = p + 1; q < m; q++) {
+                    const apq = A[p * m + q];
+                    if (apq === 0) continue;
+                    const app = A[p * m + p];
+                    const aqq = A[q * m + q];
+                    // Negligible next to both diagonals: rotating would not change them
+                    if (Math.abs(apq) < 1e-18 * (Math.abs(app) + Math.abs(aqq))) {
+                        A[p * m + q] = 0;
+                        A[q * m + p] = 0;
+                        continue;
+                    }
+                    const theta = (aqq - app) / (2 * apq);
+                    const t = Math.sign(theta || 1) / (Math.abs(theta) + Math.sqrt(theta * theta + 1));
+                    const c = 1 / Math.sqrt(t * t + 1);
+                    const s = t * c;
+
+                    for (let r = 0; r < m; r++) {
+                        const arp = A[r * m + p];
+                        const arq = A[r * m + q];
+                        A[r * m + p] = c * arp - s * arq;
+                        A[r * m + q] = s * arp + c * arq;
+                    }
+                    for (let r = 0; r < m; r++) {
+                        const apr = A[p * m + r];
+                        const aqr = A[q * m + r];
+                        A[p * m + r] = c * apr - s * aqr;
+                        A[q * m + r] = s * apr + c * aqr;
+                    }
+                    for (let r = 0; r < m; r++) {
+                        const vrp = V[r * m + p];
+                        const vrq = V[r * m + q];
+                        V[r * m + p] = c * vrp - s * vrq;
+                        V[r * m + q] = s * vrp + c * vrq;
+                    }
                 }
             }
+        }
 
-            // Update eigenvector matrix V' = V * G
-            for (let i = 0; i < n; i++) {
-                const oldVip = V[i][p];
-                const oldViq = V[i][q];
-                V[i][p] = c * oldVip - s * oldViq;
-                V[i][q] = s * oldVip + c * oldViq;
-            }
+        const values = new Float64Array(m);
+        for (let i = 0; i < m; i++) values[i] = A[i * m + i];
+        const order = Array.from({ length: m }, (_, i) => i).sort((a, b) => values[b] - values[a]);
+        return { values, vectors: V, order };
+    }
+
+    // Upper bound on the spectrum: max absolute row sum
+    static gershgorinBound(M) {
+        let bound = 0;
+        for (let i = 0; i < M.size; i++) {
+            let sum = 0;
+            for (let p = M.rowPtr[i]; p < M.rowPtr[i + 1]; p++) sum += Math.abs(M.values[p]);
+            if (sum > bound) bound = sum;
         }
+        return bound || 1;
+    }
 
-        // Extract eigenvalues from diagonal, round near-zero values
-        const eigenvalues = [];
+    static dotVectors(a, b) {
+        let sum = 0;
+        for (let i = 0; i < a.length; i++) sum += a[i] * b[i];
+        return sum;
+    }
+
+    // y += alpha * x
+    static axpy(alpha, x, y) {
+        for (let i = 0; i < y.length; i++) y[i] += alpha * x[i];
+    }
+
+    // Scales v to unit length in place and returns its previous norm
+    static normalizeVector(v) {
+        const norm = Math.sqrt(SpectralEngine.dotVectors(v, v));
+        if (norm > 0) {
+            for (let i = 0; i < v.length; i++) v[i] /= norm;
+        }
+        return norm;
+    }
+
+    /**
+     * Jacobi eigenvalue algorithm for symmetric matrices
+     * Eigenvalues come back unsorted, eigenvectors as rows
+     */
+    jacobiEigenvalue(matrix, maxSweeps = 60) {
+        const n = matrix.length;
+        const flat = new Float64Array(n * n);
         for (let i = 0; i < n; i++) {
-            let val = A[i][i];
-            if (Math.abs(val) < 1e-10) val = 0;
-            eigenvalues.push(val);
+            for (let j = 0; j < n; j++) flat[i * n + j] = matrix[i][j];
         }
 
-        // Get eigenvectors as rows (each column of V is an eigenvector)
+        // Cyclic sweeps converge quadratically; picking the largest off-diagonal
+        // element one rotation at a time stalled before converging from n ~ 40
+        const { values, vectors } = SpectralEngine.cyclicJacobi(flat, n, maxSweeps);
+
+        // Round near-zero eigenvalues
+        const eigenvalues = Array.from(values, v => Math.abs(v) < 1e-10 ? 0 : v);
+
+        // Eigenvectors as rows (each column of V is an eigenvector)
         const eigenvectors = [];
         for (let i = 0; i < n; i++) {
             eigenvectors[i] = [];
             for (let j = 0; j < n; j++) {
-                eigenvectors[i][j] = V[j][i];
+                eigenvectors[i][j] = vectors[j * n + i];
             }
         }
 
@@ -191,19 +595,34 @@ class SpectralEngine {
     }
 
     getFiedlerVector() {
-        const result = this.computeEigendecomposition();
+        const result = this.computeEigendecomposition(2);
         return result.eigenvectors.length < 2 ? null :
             { eigenvalue: result.eigenvalues[1], eigenvector: result.eigenvectors[1] };
     }
 
     getAlgebraicConnectivity() {
-        const result = this.computeEigendecomposition();
+        const result = this.computeEigendecomposition(2);
         return result.eigenvalues.length >= 2 ? result.eigenvalues[1] : 0;
     }
 
+    // λmax: the full dense spectrum holds it; large graphs ask Lanczos for it directly
+    getSpectralRadius() {
+        const n = this.getSize();
+        if (n === 0) return 0;
+        if (n < SpectralEngine.SPARSE_MIN_NODES) {
+            const { eigenvalues } = this.computeEigendecomposition();
+            return eigenvalues[eigenvalues.length - 1];
+        }
+
+        const cached = this.spectralRadiusCache;
+        if (cached && cached.type === this.laplacianType) return cached.value;
+        const value = this.computeSparseSpectralRadius();
+        this.spectralRadiusCache = { type: this.laplacianType, value };
+        return value;
+    }
+
     getNumConnectedComponents() {
-        const result = this.computeEigendecomposition();
-        return result.eigenvalues.filter(λ => Math.abs(λ) < 1e-8).length;
+        return this.getConnectedComponents().length;
     }
 
     static createCycleGraph(n) {